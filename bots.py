@@ -10,18 +10,18 @@
 from __future__ import annotations
 
 import math
-import random
 
 from harmonictook import Bot, Card, Game, UpgradeCard
 from strategy import (
     delta_coverage,
-    delta_ev,
     own_turn_pmf,
     pmf_mean,
     pmf_variance,
     round_pmf,
     score_purchase_options,
+    SwapValuer,
     _count_category,
+    _delta_evs,
     _landmark_cost_remaining,
     _n_landmarks_remaining,
     _own_turn_coverage,
@@ -163,6 +163,17 @@ class ThoughtfulBot(Bot):
         "Farmer's Market":          (1, 1),  # category 1 = Wheat Field / Apple Orchard
     }
 
+    # Preference order: upgrades, then (with Train Station) late cards, then early cards.
+    UPGRADES: list[str] = ["Radio Tower", "Amusement Park", "Shopping Mall", "Train Station"]
+    EARLY_CARDS: list[str] = [
+        "TV Station", "Business Center", "Stadium", "Forest",
+        "Convenience Store", "Ranch", "Wheat Field", "Cafe", "Bakery",
+    ]
+    LATE_CARDS: list[str] = [
+        "Mine", "Furniture Factory", "Cheese Factory",
+        "Family Restaurant", "Apple Orchard", "Farmer's Market",
+    ]
+
     def chooseCard(self, options: list[Card], game: Game | None = None) -> str | None:
         """Return the highest-priority card name from a list of Card objects.
 
@@ -173,28 +184,19 @@ class ThoughtfulBot(Bot):
         if not options:
             return None
         names = [c.name for c in options]
-        upgrades = ["Radio Tower", "Amusement Park", "Shopping Mall", "Train Station"]
-        earlycards = [
-            "TV Station", "Business Center", "Stadium", "Forest",
-            "Convenience Store", "Ranch", "Wheat Field", "Cafe", "Bakery",
-        ]
-        latecards = [
-            "Mine", "Furniture Factory", "Cheese Factory",
-            "Family Restaurant", "Apple Orchard", "Farmer's Market",
-        ]
         if self.hasTrainStation:
             eligible_latecards = [
-                c for c in latecards
+                c for c in self.LATE_CARDS
                 if c not in self._FACTORY_PREREQS
                 or _count_category(self, self._FACTORY_PREREQS[c][0]) >= self._FACTORY_PREREQS[c][1]
             ]
-            preferences = upgrades + eligible_latecards + earlycards
+            preferences = self.UPGRADES + eligible_latecards + self.EARLY_CARDS
         else:
-            preferences = upgrades + earlycards
+            preferences = self.UPGRADES + self.EARLY_CARDS
         for priority in preferences:
             if priority in names:
                 return priority
-        return random.choice(names)
+        return self.rng.choice(names)
 
     def chooseDice(self, players: list | None = None) -> int:
         return _dice_by_ev(self, players or [self])
@@ -224,8 +226,26 @@ class EVBot(Bot):
         if not options:
             return None
         use_players = list(game.players) if game else [self]
-        scored = score_purchase_options(self, options, use_players, N=self.n_horizon)
-        return next(iter(scored)).name if scored else random.choice(options).name
+        context = game.strategy if game else None
+        scored = score_purchase_options(self, options, use_players, N=self.n_horizon, context=context)
+        return next(iter(scored)).name if scored else self.rng.choice(options).name
+
+    def chooseBusinessCenterSwap(
+        self, target, my_swappable: list, their_swappable: list, players: list | None = None
+    ) -> tuple[Card, Card] | None:
+        """Make the swap _ev_businesscenter valued: best take, spite-filtered bottom-4 give.
+
+        Declines (taking the coin payout instead) unless the swap has positive net EV.
+        Values the swap against players, the same table _ev_businesscenter priced the card
+        with; players defaults to [self, target] when not supplied.
+        """
+        if not my_swappable or not their_swappable:
+            return None
+        players = list(players) if players else [self, target]
+        choice = SwapValuer(self, players, own_cards=my_swappable).best_for(target, their_swappable)
+        if choice is None or choice.net <= 0.0:
+            return None
+        return (choice.give, choice.take)
 
 
 class CoverageBot(Bot):
@@ -247,13 +267,13 @@ class CoverageBot(Bot):
         if not options:
             return None
 
-        def _score(c: Card, players: list, all_cards: list) -> tuple:
-            return (delta_coverage(c, self, players), delta_ev(c, self, players, market_cards=all_cards))
-
         use_players = list(game.players) if game else [self]
         landmarks = [c for c in options if isinstance(c, UpgradeCard)]
         pool = landmarks if landmarks else options
-        return max(pool, key=lambda c: _score(c, use_players, options)).name
+        evs = _delta_evs(pool, self, use_players, market_cards=options,
+                         context=game.strategy if game else None)
+        scores = [(delta_coverage(c, self, use_players), ev) for c, ev in zip(pool, evs)]
+        return max(zip(pool, scores), key=lambda pair: pair[1])[0].name
 
     def chooseDice(self, players: list | None = None) -> int:
         """Roll 2 dice if they cover more of the deck's hitsOn range than 1 die; else roll 1."""
@@ -337,10 +357,10 @@ class ImpatientBot(Bot):
             v = self._var_after_buy(card, players)
             if t < best_tuv or (t == best_tuv and v < best_var):
                 best_tuv, best_var, best_name = t, v, card.name
-        return best_name if best_name is not None else random.choice(options).name
+        return best_name if best_name is not None else self.rng.choice(options).name
 
     def chooseBusinessCenterSwap(
-        self, target, my_swappable: list, their_swappable: list
+        self, target, my_swappable: list, their_swappable: list, players: list | None = None
     ) -> tuple[Card, Card] | None:
         """Choose what to give and take in a Business Center swap.
 
@@ -457,7 +477,7 @@ class FromageBot(Bot):
             if card_name in max_cap:
                 max_cap[card_name] = max(max_cap[card_name], cap)
         uncapped = [n for n in names if self._count(n) < max_cap.get(n, 1)]
-        return random.choice(uncapped if uncapped else names)
+        return self.rng.choice(uncapped if uncapped else names)
 
     def chooseDice(self, players: list | None = None) -> int:
         return _dice_by_ev(self, players or [self])
@@ -551,7 +571,7 @@ class MarathonBot(Bot):
             v = _card_variance(self, card, players)
             if p > best_pwn or (p == best_pwn and v < best_var):
                 best_pwn, best_var, best_name = p, v, card.name
-        return best_name if best_name is not None else random.choice(options).name
+        return best_name if best_name is not None else self.rng.choice(options).name
 
     def chooseTarget(self, players: list) -> 'Bot | None':
         """Steal from the opponent with the lowest ERUV; tiebreak on richest."""
@@ -561,7 +581,7 @@ class MarathonBot(Bot):
         return min(valid, key=lambda p: (_eruv_for(p, players), -p.bank))
 
     def chooseBusinessCenterSwap(
-        self, target, my_swappable: list, their_swappable: list
+        self, target, my_swappable: list, their_swappable: list, players: list | None = None
     ) -> 'tuple[Card, Card] | None':
         """Give the card whose removal hurts P(win in N) least; take the card that helps most."""
         if not my_swappable or not their_swappable:
@@ -186,10 +186,9 @@ def _market_markup(game: Game) -> str:
     market = game.get_market_state()
     player = game.get_current_player()
 
-    card_lookup: dict[str, object] = {}
-    for card in game.market.deck:  # type: ignore[attr-defined]
-        if card.name not in card_lookup:
-            card_lookup[card.name] = card
+    card_lookup: dict[str, object] = {
+        card.name: card for card in game.market.kinds()  # type: ignore[attr-defined]
+    }
 
     sorted_names = sorted(
         market.keys(),
@@ -0,0 +1,410 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# fastgame.py — Headless array-backed game engine for bot evaluation
+#
+# FastGame plays by exactly the rules of Game.next_turn / Game.run, but keeps the
+# table as plain integer arrays: per-seat card counts, landmark bits and banks, plus
+# market and reserve counts. No Events, Displays or history snapshots are produced.
+#
+# Bots are driven through their own Player objects, which act as a thin adapter:
+# banks are written back before every decision, and decks and landmark flags are
+# only touched when a card is bought or swapped. Decisions therefore see the same
+# state they would in Game, and seeded runs of both engines agree move for move
+# (see compare_with_game).
+#
+# Usage:
+#   python fastgame.py                       # time 200 2-player games of Bots
+#   python fastgame.py --games 1000 --players 4
+#   python fastgame.py --check 50            # differential check against Game
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from harmonictook import (
+    Blue, Bot, BusinessCenter, Card, DiceStream, Game, Green, NullDisplay, Player, PlayerDeck,
+    Red, Stadium, TableDeck, TVStation, UpgradeCard, setPlayers,
+)
+
+
+# Every card kind on the table, in deck sort order, so that walking kinds by index
+# visits cards in the same order as a sorted Store. Landmarks sort last.
+CATALOGUE: tuple[Card, ...] = tuple(sorted(
+    TableDeck().kinds() + [UpgradeCard.listing(name) for name in UpgradeCard.orangeCards]
+))
+KIND: dict[str, int] = {card.name: k for k, card in enumerate(CATALOGUE)}
+
+_ESTABLISHMENTS: tuple[int, ...] = tuple(k for k, c in enumerate(CATALOGUE) if not isinstance(c, UpgradeCard))
+_N_EST = len(_ESTABLISHMENTS)
+_PURPLES: tuple[int, ...] = tuple(k for k in _ESTABLISHMENTS if isinstance(CATALOGUE[k], (Stadium, TVStation, BusinessCenter)))
+# Landmark kind -> bit, and landmark bits in checkRemainingUpgrades() order
+_LANDMARK_BIT: dict[int, int] = {KIND[name]: 1 << i for i, name in enumerate(UpgradeCard.orangeCards)}
+_UPGRADE_ORDER: tuple[int, ...] = tuple(KIND[name] for name in UpgradeCard.orangeCards)
+_ALL_LANDMARKS = (1 << len(_UPGRADE_ORDER)) - 1
+_FLAG: dict[int, str] = {k: UpgradeCard.orangeCards[CATALOGUE[k].name][2] for k in _UPGRADE_ORDER}
+_TRAIN, _MALL, _PARK, _RADIO = (_LANDMARK_BIT[KIND[name]] for name in UpgradeCard.orangeCards)
+_LANDMARK_CATEGORY = CATALOGUE[_UPGRADE_ORDER[0]].category
+
+# The same name-based Shopping Mall bonuses as Red.trigger and Green.trigger
+_MALL_RED: frozenset[int] = frozenset(KIND[name] for name in ("Cafe", "Family Restaurant"))
+_MALL_GREEN: frozenset[int] = frozenset({KIND["Convenience Store"]})
+
+_NAME: tuple[str, ...] = tuple(c.name for c in CATALOGUE)
+_BY_LOWER: dict[str, int] = {name.lower(): k for k, name in enumerate(_NAME)}
+_COST: tuple[int, ...] = tuple(c.cost for c in CATALOGUE)
+_PAYOUT: tuple[int, ...] = tuple(c.payout for c in CATALOGUE)
+# Establishment kinds in each category (factory multipliers count these)
+_IN_CATEGORY: dict[int, tuple[int, ...]] = {
+    cat: tuple(k for k in _ESTABLISHMENTS if CATALOGUE[k].category == cat)
+    for cat in {c.category for c in CATALOGUE}
+}
+
+
+def _firing(color: type) -> tuple[tuple[int, ...], ...]:
+    """For each roll 0-12, the kinds of this color that fire on it, in deck order."""
+    return tuple(
+        tuple(k for k in _ESTABLISHMENTS if type(CATALOGUE[k]) is color and CATALOGUE[k].fires_on(roll))
+        for roll in range(13)
+    )
+
+
+_RED_ON = _firing(Red)
+_BLUE_ON = _firing(Blue)
+_GREEN_ON = _firing(Green)
+_STADIUM_ON = _firing(Stadium)
+_TV_ON = _firing(TVStation)
+_BC_ON = _firing(BusinessCenter)
+
+
+class MarketView:
+    """Read-only Store lookalike over FastGame's market counts, handed to chooseAction.
+
+    deck holds one card per listed kind rather than every copy; bots only use it to
+    find a card by name.
+    """
+
+    def __init__(self, game: FastGame) -> None:
+        self._game = game
+
+    def kinds(self) -> list[Card]:
+        """Return one card of each listed kind, in deck order."""
+        market = self._game.market
+        return [CATALOGUE[k] for k in range(len(CATALOGUE)) if market[k]]
+
+    deck = property(kinds)
+
+    def names(self, maxcost: int = 99, flavor: type = Card) -> list[str]:
+        """Return listed card names with cost ≤ maxcost and matching flavor type."""
+        market = self._game.market
+        return [_NAME[k] for k in range(len(CATALOGUE))
+                if market[k] and _COST[k] <= maxcost and isinstance(CATALOGUE[k], flavor)]
+
+    def counts(self) -> dict[str, int]:
+        """Return a {name: count} dict of the market, in deck order."""
+        market = self._game.market
+        return {_NAME[k]: n for k, n in enumerate(market) if n}
+
+    def count(self, name: str) -> int:
+        """Return how many copies of name are listed."""
+        k = KIND.get(name)
+        return 0 if k is None else self._game.market[k]
+
+
+class FastGame:
+    """Headless game engine over count arrays; same rules and bot interface as Game.
+
+    counts[i][k] is how many copies of establishment kind k seat i owns, landmarks[i]
+    holds one bit per landmark (in UpgradeCard.orangeCards order) and bank[i] is the
+    authoritative coin total. market[k] and reserve[k] cover every kind in CATALOGUE.
+    """
+
+    def __init__(self, players: list[Player] | int = 2, seed: int | None = None,
+                 rng: random.Random | None = None, dice: DiceStream | None = None) -> None:
+        """Seat the given players (reset to a fresh start) or that many Bots.
+
+        seed, rng and dice give the table its own random streams, as in Game; a Game and
+        a FastGame built with the same seed (and dice seed) and players roll the same dice.
+        """
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random  # type: ignore[assignment]
+        self.rng: random.Random = rng  # type: ignore[assignment]
+        self.players: list[Player] = (list(players) if isinstance(players, list)
+                                      else setPlayers(players, rng=self.rng))
+        n = len(self.players)
+        for player in self.players:
+            player.reset()
+            player.rng = self.rng
+            player.dice = dice
+        self.dice: DiceStream | None = dice
+        self.counts: list[list[int]] = [[0] * _N_EST for _ in range(n)]
+        for row, player in zip(self.counts, self.players):
+            for card in player.deck.deck:
+                row[KIND[card.name]] += 1
+        self.landmarks: list[int] = [0] * n
+        self.bank: list[int] = [player.bank for player in self.players]
+        self.market: list[int] = [0] * len(CATALOGUE)
+        self.reserve: list[int] = [0] * len(CATALOGUE)
+        for k in _ESTABLISHMENTS:
+            self.market[k] = 1 if k in _PURPLES else 6
+        for k in _PURPLES + _UPGRADE_ORDER:
+            self.reserve[k] = n + 1
+        self.current_player_index: int = 0
+        self.turn_number: int = 0
+        self.last_roll: int | None = None
+        self.winner: Player | None = None
+        self._view = MarketView(self)
+        self._strategy = None
+
+    @property
+    def strategy(self):
+        """Shared StrategyContext for this table, built on first use (see Game.strategy)."""
+        if self._strategy is None:
+            # Lazy import — strategy.py imports harmonictook, which this module imports
+            from strategy import StrategyContext  # noqa: PLC0415
+            self._strategy = StrategyContext(self.players)
+        return self._strategy
+
+    def get_current_player(self) -> Player:
+        """Return the player whose turn it currently is."""
+        return self.players[self.current_player_index]
+
+    def _sync(self) -> None:
+        """Write banks back to the Player objects before a bot makes a decision."""
+        for player, coins in zip(self.players, self.bank):
+            player.bank = coins
+
+    def _take(self, payer: int, payee: int, amount: int) -> None:
+        """Move up to amount coins from payer to payee (never below zero), as deduct/deposit do."""
+        paid = min(amount, self.bank[payer])
+        self.bank[payer] -= paid
+        self.bank[payee] += paid
+
+    def refresh_market(self) -> None:
+        """Sync unique cards between reserve and market exactly as Game.refresh_market does."""
+        i = self.current_player_index
+        market, reserve = self.market, self.reserve
+        for k in _PURPLES + _UPGRADE_ORDER:
+            if not reserve[k]:
+                continue
+            owned = self.landmarks[i] & _LANDMARK_BIT[k] if k in _LANDMARK_BIT else self.counts[i][k]
+            if not owned and not market[k]:
+                market[k] += 1
+                reserve[k] -= 1
+            elif owned and market[k]:
+                market[k] -= 1
+                reserve[k] += 1
+
+    def get_purchase_options(self) -> list[Card]:
+        """Return the cards Game.get_purchase_options would offer, in the same order."""
+        i = self.current_player_index
+        coins = self.bank[i]
+        market = self.market
+        listed = [k for k in range(len(CATALOGUE)) if market[k] and _COST[k] <= coins]
+        for k in _UPGRADE_ORDER:
+            if not self.landmarks[i] & _LANDMARK_BIT[k] and _COST[k] <= coins and k not in listed:
+                listed.append(k)
+        return [CATALOGUE[k] for k in listed]
+
+    def next_turn(self) -> bool:
+        """Play one full turn for the current player; return True if the final roll was doubles."""
+        i = self.current_player_index
+        player = self.players[i]
+        players = self.players
+        bank, counts = self.bank, self.counts
+        if self._strategy is not None:
+            self._strategy.refresh()
+        for person in players:
+            person.isrollingdice = False
+        player.isrollingdice = True
+        self.refresh_market()
+
+        self._sync()
+        if self.dice is not None:
+            self.dice.start_turn(i)
+        roll, is_doubles = player.dieroll(players)
+        if player.chooseReroll(roll, players):
+            roll, is_doubles = player.dieroll(players)
+        self.last_roll = roll
+
+        # Red → Blue → Green → Purple, seat by seat within each color (as Game.next_turn)
+        for j in range(len(players)):
+            if j == i:
+                continue
+            mall = self.landmarks[j] & _MALL
+            for k in _RED_ON[roll]:
+                if counts[j][k]:
+                    self._take(i, j, (_PAYOUT[k] + (1 if mall and k in _MALL_RED else 0)) * counts[j][k])
+        for j in range(len(players)):
+            for k in _BLUE_ON[roll]:
+                bank[j] += _PAYOUT[k] * counts[j][k]
+        own = counts[i]
+        for k in _GREEN_ON[roll]:
+            if own[k]:
+                multiplies = CATALOGUE[k].multiplies
+                if multiplies:
+                    per_copy = _PAYOUT[k] * self._category_count(i, multiplies)
+                else:
+                    per_copy = _PAYOUT[k] + (1 if self.landmarks[i] & _MALL and k in _MALL_GREEN else 0)
+                bank[i] += per_copy * own[k]
+        for k in _STADIUM_ON[roll]:
+            # Every Stadium on the table collects for the roller, as Stadium.trigger does
+            for _ in range(sum(row[k] for row in counts)):
+                for j in range(len(players)):
+                    if j != i:
+                        self._take(j, i, _PAYOUT[k])
+        for k in _TV_ON[roll]:
+            for _ in range(own[k]):
+                self._sync()
+                target = player.chooseTarget(players)
+                if target:
+                    self._take(players.index(target), i, _PAYOUT[k])
+        for k in _BC_ON[roll]:
+            for _ in range(own[k]):
+                self._business_center(i)
+
+        self._buy_phase(i)
+        self.turn_number += 1
+        return is_doubles
+
+    def _category_count(self, i: int, category: int) -> int:
+        """Cards seat i owns in category, landmarks included (as Green.trigger counts them)."""
+        total = sum(self.counts[i][k] for k in _IN_CATEGORY.get(category, ()))
+        if category == _LANDMARK_CATEGORY:
+            total += bin(self.landmarks[i]).count("1")
+        return total
+
+    def _business_center(self, i: int) -> None:
+        """Resolve one Business Center copy owned by the roller in seat i."""
+        roller = self.players[i]
+        self._sync()
+        target = roller.chooseTarget(self.players)
+        swap = None
+        if target and len(target.deck.deck) > 0:
+            mine = [c for c in roller.deck.deck if not isinstance(c, UpgradeCard)]
+            theirs = [c for c in target.deck.deck if not isinstance(c, UpgradeCard)]
+            swap = roller.chooseBusinessCenterSwap(target, mine, theirs, self.players)
+        if not swap:
+            self.bank[i] += 5
+            return
+        give, take = swap
+        roller.swap(give, target, take)
+        t = self.players.index(target)
+        self.counts[i][KIND[give.name]] -= 1
+        self.counts[t][KIND[give.name]] += 1
+        self.counts[t][KIND[take.name]] -= 1
+        self.counts[i][KIND[take.name]] += 1
+
+    def _buy_phase(self, i: int) -> None:
+        """Ask the roller to buy or pass, then apply the purchase as Player.buy does."""
+        player = self.players[i]
+        self._sync()
+        if player.chooseAction(self._view) != 'buy':
+            return
+        name = player.chooseCard(self.get_purchase_options(), self)
+        if name is None:
+            return
+        # Player.buy matches names case-insensitively among listed cards and unbuilt landmarks
+        kind = _BY_LOWER.get(name.lower())
+        if kind is None:
+            return
+        available = not self.landmarks[i] & _LANDMARK_BIT[kind] if kind in _LANDMARK_BIT else self.market[kind]
+        if not available or self.bank[i] < _COST[kind]:
+            return
+        self.bank[i] -= _COST[kind]
+        card = CATALOGUE[kind].copy()
+        player.deck.append(card)
+        card.owner = player
+        if kind in _LANDMARK_BIT:
+            self.landmarks[i] |= _LANDMARK_BIT[kind]
+            setattr(player, _FLAG[kind], True)
+        else:
+            self.counts[i][kind] += 1
+            self.market[kind] -= 1
+
+    def run(self) -> Player:
+        """Play until someone holds every landmark; return the winner.
+
+        Extra turns from Amusement Park follow Game.run: the same player goes again
+        while their final roll is doubles.
+        """
+        while True:
+            for i, turntaker in enumerate(self.players):
+                self.current_player_index = i
+                is_doubles = self.next_turn()
+                while self.landmarks[i] != _ALL_LANDMARKS and is_doubles and self.landmarks[i] & _PARK:
+                    is_doubles = self.next_turn()
+                if self.landmarks[i] == _ALL_LANDMARKS:
+                    self._sync()
+                    self.winner = turntaker
+                    return turntaker
+
+
+def compare_with_game(factories: list[Callable[[str], Player]], seed: int) -> list[str]:
+    """Play one seeded game in Game and in FastGame; return the differences found.
+
+    factories build the players for each seat from a name (as TournamentPlayer does).
+    Compares the winner, number of turns, banks, decks and landmarks at the end; an
+    empty list means the two engines agree.
+    """
+    names = [f"P{i}" for i in range(len(factories))]
+
+    game = Game(players=len(factories), seed=seed)
+    for i, factory in enumerate(factories):
+        game.players[i] = factory(names[i])
+        game.players[i].deck = PlayerDeck(game.players[i])
+    game.run(display=NullDisplay())
+
+    fast = FastGame([factory(name) for factory, name in zip(factories, names)], seed=seed)
+    fast.run()
+
+    diffs: list[str] = []
+    if game.winner.name != fast.winner.name:
+        diffs.append(f"winner: Game {game.winner.name}, FastGame {fast.winner.name}")
+    if game.turn_number != fast.turn_number:
+        diffs.append(f"turns: Game {game.turn_number}, FastGame {fast.turn_number}")
+    for slow_player, fast_player in zip(game.players, fast.players):
+        slow_state = (slow_player.bank, slow_player.deck.counts())
+        fast_state = (fast_player.bank, fast_player.deck.counts())
+        if slow_state != fast_state:
+            diffs.append(f"{slow_player.name}: Game {slow_state}, FastGame {fast_state}")
+    return diffs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless FastGame throughput and differential checks")
+    parser.add_argument("--games", type=int, default=200, metavar="N",
+                        help="number of games to time in each engine (default: 200)")
+    parser.add_argument("--players", type=int, default=2, metavar="N",
+                        help="players per game, 2-4 (default: 2)")
+    parser.add_argument("--check", type=int, default=0, metavar="N",
+                        help="also compare N seeded games against Game and report mismatches")
+    args = parser.parse_args()
+
+    factories = [Bot] * args.players
+    random.seed(0)
+    start = time.perf_counter()
+    for _ in range(args.games):
+        game = Game(players=args.players)
+        game.run(display=NullDisplay())
+    slow = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.games):
+        FastGame(args.players).run()
+    fast = time.perf_counter() - start
+    print(f"Game:     {args.games / slow:8.1f} games/s")
+    print(f"FastGame: {args.games / fast:8.1f} games/s  ({slow / fast:.1f}x)")
+
+    mismatches = 0
+    for seed in range(args.check):
+        for diff in compare_with_game(factories, seed):
+            mismatches += 1
+            print(f"seed {seed}: {diff}")
+    if args.check:
+        print(f"{args.check} seeded games checked, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
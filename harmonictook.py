@@ -8,11 +8,15 @@ import random
 import time
 import utility
 import argparse
+from bisect import bisect_left, insort_right
+from collections import deque
 from functools import total_ordering
-from dataclasses import dataclass
+from itertools import count
+from operator import attrgetter
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from statistics import mean
-from typing import Literal
+from typing import ClassVar, Literal
 
 
 EventType = Literal[
@@ -24,6 +28,12 @@ EventType = Literal[
     "pass", "win", "doubles_bonus",
 ]
 
+# Subscription presets for headless consumers (see Display.subscribes)
+OUTCOME_EVENTS: frozenset[str] = frozenset({"roll", "buy", "pass", "win", "doubles_bonus"})
+PAYOUT_EVENTS: frozenset[str] = frozenset({"payout", "steal", "collect"})
+# Always built: Game.run reads the roll events next_turn returns to spot doubles
+_CONTROL_EVENTS: frozenset[str] = frozenset({"roll"})
+
 
 @dataclass
 class Event:
@@ -58,11 +68,221 @@ class GameState:
     events: list[Event]         # full event log for this turn
 
 
+HistoryMode = Literal["full", "compact", "delta", "off"]
+
+
+@dataclass(frozen=True)
+class HistoryPolicy:
+    """How much per-turn history a Game keeps.
+
+    mode: "full" keeps every GameState with its events; "compact" keeps the snapshots
+    but drops events; "delta" stores only the player snapshots that changed since the
+    previous turn; "off" keeps nothing. last, when set, keeps only the most recent
+    N turns in a ring buffer.
+    """
+    mode: HistoryMode = "full"
+    last: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.last is not None and self.last < 0:
+            raise ValueError(f"history length must be non-negative, got {self.last}")
+
+    @classmethod
+    def parse(cls, spec: str) -> HistoryPolicy:
+        """Build a policy from a CLI string such as "full", "off", "compact:50" or "delta:200"."""
+        mode, _, last = spec.partition(":")
+        if mode not in ("full", "compact", "delta", "off"):
+            raise ValueError(f"unknown history mode: {mode!r}")
+        return cls(mode=mode, last=int(last) if last else None)  # type: ignore[arg-type]
+
+
+class GameHistory:
+    """The per-turn record of a Game, stored according to a HistoryPolicy.
+
+    Reads look like a list of GameState: len(), indexing (including negative indices)
+    and iteration. Compact and delta entries come back with an empty events list.
+    Delta entries carry a full keyframe every KEYFRAME_INTERVAL turns, so a read
+    replays at most that many deltas; the newest entry is served directly.
+    """
+
+    KEYFRAME_INTERVAL: ClassVar[int] = 32
+
+    def __init__(self, policy: HistoryPolicy | None = None) -> None:
+        self.policy = policy or HistoryPolicy()
+        self._entries: deque = deque(maxlen=self.policy.last)
+        # Delta mode: players as of just before the oldest retained entry, and as of the newest
+        self._base: list[PlayerSnapshot] = []
+        self._latest: list[PlayerSnapshot] = []
+        self._appended = 0
+
+    @property
+    def enabled(self) -> bool:
+        """False when the policy keeps nothing, so callers can skip building snapshots."""
+        return self.policy.mode != "off" and self.policy.last != 0
+
+    def append(self, state: GameState) -> None:
+        """Record one completed turn."""
+        if not self.enabled:
+            return
+        mode = self.policy.mode
+        if mode == "full":
+            self._entries.append(state)
+        elif mode == "compact":
+            self._entries.append(GameState(state.turn_number, state.active_player, state.roll, state.players, []))
+        else:
+            self._append_delta(state)
+
+    def _append_delta(self, state: GameState) -> None:
+        latest = self._latest
+        changes = tuple(
+            (seat, snap) for seat, snap in enumerate(state.players)
+            if seat >= len(latest) or snap != latest[seat]
+        )
+        players = list(state.players)
+        keyframe = players if self._appended % self.KEYFRAME_INTERVAL == 0 else None
+        if len(self._entries) == self._entries.maxlen:
+            # The oldest delta is about to fall out of the ring; fold it into the base
+            oldest = self._entries[0]
+            self._base = oldest[4] if oldest[4] is not None else self._apply(self._base, oldest[3])
+        self._entries.append((state.turn_number, state.active_player, state.roll, changes, keyframe))
+        self._latest = players
+        self._appended += 1
+
+    @staticmethod
+    def _apply(players: list[PlayerSnapshot], changes: tuple) -> list[PlayerSnapshot]:
+        players = list(players)
+        for seat, snap in changes:
+            if seat >= len(players):
+                players.extend([snap] * (seat + 1 - len(players)))
+            players[seat] = snap
+        return players
+
+    def clear(self) -> None:
+        """Drop every entry; the policy is kept."""
+        self._entries.clear()
+        self._base = []
+        self._latest = []
+        self._appended = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        if self.policy.mode != "delta":
+            yield from self._entries
+            return
+        players = self._base
+        for turn_number, active_player, roll, changes, keyframe in self._entries:
+            players = keyframe if keyframe is not None else self._apply(players, changes)
+            yield GameState(turn_number, active_player, roll, players, [])
+
+    def __getitem__(self, index: int) -> GameState:
+        if self.policy.mode != "delta":
+            return self._entries[index]
+        entries = self._entries
+        if index < 0:
+            index += len(entries)
+        if not 0 <= index < len(entries):
+            raise IndexError("history index out of range")
+        turn_number, active_player, roll, _, _ = entries[index]
+        if index == len(entries) - 1:
+            return GameState(turn_number, active_player, roll, list(self._latest), [])
+        # Walk back to the nearest keyframe (or the base), then replay forward
+        start = index
+        while start >= 0 and entries[start][4] is None:
+            start -= 1
+        players = self._base if start < 0 else entries[start][4]
+        for i in range(start + 1, index + 1):
+            players = self._apply(players, entries[i][3])
+        return GameState(turn_number, active_player, roll, list(players), [])
+
+
+class DeckStateEvent(Event):
+    """A deck_state Event whose message is rendered from a snapshot of the deck on first read.
+
+    Building the frequency table costs a freq() and string formatting per turn, so it
+    waits until a display actually prints the message.
+    """
+
+    def __init__(self, player: str, header: str, cards: list[Card]) -> None:
+        self._header = header
+        self._cards = list(cards)
+        self._message: str | None = None
+        super().__init__(type="deck_state", player=player)
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            snapshot = Store()
+            snapshot.deck = self._cards
+            self._message = self._header + deck_to_string(snapshot)
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        # Event.__init__ assigns the empty default; only a real message replaces the render
+        self._message = value or None
+
+
+class DiceStream:
+    """Pre-generated die faces for every seat, indexed by that seat's own turn count.
+
+    Seat s's t-th turn (bonus turns included) always gets the same four faces: a pair
+    for the roll, of which a one-die roll uses the first, and a pair for a Radio Tower
+    re-roll. Game calls start_turn(seat) at the top of each turn, so how many dice a
+    seat rolls, or how many turns it takes, never shifts another seat's faces, and
+    rotating the seating hands seat s's dice to a different player. Each seat's faces
+    come from its own stream derived from seed, block_size turns at a time.
+    """
+
+    FACES_PER_TURN: ClassVar[int] = 4
+
+    def __init__(self, seed: int, block_size: int = 64) -> None:
+        self.seed = seed
+        self.block_size = block_size
+        self._sources: dict[int, random.Random] = {}
+        self._faces: dict[int, list[int]] = {}
+        self._turns: dict[int, int] = {}
+        self.seat = 0
+        self.turn = 0
+        self._attempt = 0
+
+    def start_turn(self, seat: int) -> None:
+        """Begin the next turn of seat; following rolls use that turn's faces."""
+        self.seat = seat
+        self.turn = self._turns.get(seat, 0)
+        self._turns[seat] = self.turn + 1
+        self._attempt = 0
+
+    def faces(self, seat: int, turn: int) -> list[int]:
+        """The four faces seat rolls on its turn-th turn: roll pair, then re-roll pair."""
+        faces = self._faces.setdefault(seat, [])
+        end = (turn + 1) * self.FACES_PER_TURN
+        if len(faces) < end:
+            # String seeds hash deterministically (sha512), independent of PYTHONHASHSEED
+            source = self._sources.setdefault(seat, random.Random(f"{self.seed}:{seat}"))
+            while len(faces) < end:
+                faces.extend(source.randint(1, 6) for _ in range(self.block_size * self.FACES_PER_TURN))
+        return faces[end - self.FACES_PER_TURN:end]
+
+    def roll(self, n_dice: int) -> list[int]:
+        """Return n_dice faces for the current seat's roll (first call) or re-roll (second)."""
+        if self._attempt > 1:
+            raise ValueError("DiceStream holds one roll and one re-roll per turn")
+        start = 2 * self._attempt
+        self._attempt += 1
+        return self.faces(self.seat, self.turn)[start:start + n_dice]
+
+
 class Player(object):
     """Base class for all players; holds bank, deck, and upgrade flags."""
 
-    def __init__(self, name: str = "Player"):
+    def __init__(self, name: str = "Player", rng: random.Random | None = None):
         self.name = name
+        # Dice and tie-breaks draw from rng; the shared random module stands in until a Game binds its own
+        self.rng: random.Random = rng if rng is not None else random  # type: ignore[assignment]
+        # A DiceStream, when a Game binds one, replaces rng as the source of dice faces
+        self.dice: DiceStream | None = None
         self.isrollingdice = False
         self.bank = 3                  # Everyone starts with 3 coins
         self.deck = PlayerDeck(self)
@@ -88,21 +308,17 @@ class Player(object):
 
     def dieroll(self, players: list | None = None) -> tuple[int, bool]:
         """Roll dice as determined by chooseDice(); return (total, isDoubles)."""
-        isDoubles = False
         dice = self.chooseDice(players)
-        if dice == 1:
-            return random.randint(1,6), False
-        elif dice == 2:
-            a = random.randint(1,6)
-            b = random.randint(1,6)
-            if a == b:
-                isDoubles = True
-            else:
-                isDoubles = False
-            total = a + b
-            return total, isDoubles
-        else:
+        if dice not in (1, 2):
             raise ValueError(f"chooseDice() must return 1 or 2, got {dice}")
+        if self.dice is not None:
+            faces = self.dice.roll(dice)
+        else:
+            faces = [self.rng.randint(1,6) for _ in range(dice)]
+        if dice == 1:
+            return faces[0], False
+        a, b = faces
+        return a + b, a == b
 
     def chooseDice(self, players: list | None = None) -> int:
         """Return 2 if Train Station is owned, otherwise 1."""
@@ -125,15 +341,17 @@ class Player(object):
         # Default: random choice
         valid_targets = [p for p in players if not p.isrollingdice]
         if valid_targets:
-            return random.choice(valid_targets)
+            return self.rng.choice(valid_targets)
         return None
 
     def chooseBusinessCenterSwap(
-        self, target: Player, my_swappable: list, their_swappable: list
+        self, target: Player, my_swappable: list, their_swappable: list,
+        players: list[Player] | None = None,
     ) -> tuple[Card, Card] | None:
         """Choose which card to give and which to take when activating Business Center.
         Subclasses implement their own workflow (e.g. bot heuristic, CLI prompts, or GUI
-        "click opponent then choose cards"). Default: decline (return None)."""
+        "click opponent then choose cards"). players is the whole table, for strategies
+        that value the swap against every opponent. Default: decline (return None)."""
         return None
 
     def deposit(self, amount: int) -> None:
@@ -155,13 +373,13 @@ class Player(object):
         card = None
         specials = self.checkRemainingUpgrades()
         # Check if the name passed in is on the card list or specials list
-        for item in availableCards.deck:
+        for item in availableCards.kinds():
             if item.name.lower() == name.lower():
                 card = item
                 break
         for item in specials:
             if item.name.lower() == name.lower():
-                card = item
+                card = UpgradeCard(item.name)   # a fresh copy; the listed one is shared
                 break
         if isinstance(card, Card):
             if self.bank >= card.cost:
@@ -173,7 +391,7 @@ class Player(object):
                 events.append(Event(type="buy_failed", player=self.name, card=card.name, value=card.cost, remaining_bank=self.bank))
                 return events
         if isinstance(card, (Red, Green, Blue, TVStation, Stadium, BusinessCenter)):
-            availableCards.deck.remove(card)
+            availableCards.remove(card)
         elif isinstance(card, UpgradeCard):
             card.bestowPower()
         else:
@@ -181,17 +399,13 @@ class Player(object):
         return events
 
     def checkRemainingUpgrades(self) -> list:
-        """Return a list of UpgradeCard objects for upgrades this player has not yet purchased."""
-        upgrades = []
-        if not self.hasTrainStation:
-            upgrades.append(UpgradeCard("Train Station"))
-        if not self.hasShoppingMall:
-            upgrades.append(UpgradeCard("Shopping Mall"))
-        if not self.hasAmusementPark:
-            upgrades.append(UpgradeCard("Amusement Park"))
-        if not self.hasRadioTower:
-            upgrades.append(UpgradeCard("Radio Tower"))
-        return upgrades
+        """Return UpgradeCards for upgrades this player has not yet purchased.
+
+        The cards are shared, unowned listings (see UpgradeCard.listing); buy() hands the
+        player a fresh copy, so callers must not take ownership of these.
+        """
+        return [UpgradeCard.listing(name) for name, (_, _, flag) in UpgradeCard.orangeCards.items()
+                if not getattr(self, flag)]
 
     def swap(self, card: Card, otherPlayer: Player, otherCard: Card) -> None:
         """Exchange card with otherPlayer's otherCard, updating ownership and decks."""
@@ -268,7 +482,8 @@ class Human(Player):
         )
 
     def chooseBusinessCenterSwap(
-        self, target: Player, my_swappable: list, their_swappable: list
+        self, target: Player, my_swappable: list, their_swappable: list,
+        players: list[Player] | None = None,
     ) -> tuple[Card, Card] | None:
         """Prompt the human to choose cards for a Business Center swap, or decline."""
         if not my_swappable or not their_swappable:
@@ -297,10 +512,10 @@ class Bot(Player):
         "Dolores", "Bernard", "Maeve", "Charlotte", "Rachael", "Leon", "Zhora",
     ]
 
-    def __init__(self, name: str = "") -> None:
-        super().__init__(name=name)
+    def __init__(self, name: str = "", rng: random.Random | None = None) -> None:
+        super().__init__(name=name, rng=rng)
         if not self.name:
-            self.name = random.choice(self.NAME_OPTIONS)
+            self.name = self.rng.choice(self.NAME_OPTIONS)
 
     def chooseAction(self, availableCards: Store) -> str:
         """Return 'buy' if any affordable card is available, otherwise 'pass'."""
@@ -312,7 +527,7 @@ class Bot(Player):
         """Return a randomly selected card name, or None if the list is empty."""
         if not options:
             return None
-        return random.choice(options).name
+        return self.rng.choice(options).name
 
     def chooseReroll(self, last_roll: int | None = None, players: list | None = None) -> bool:
         """Return True if the bot owns Radio Tower and the last roll was below 5."""
@@ -326,7 +541,8 @@ class Bot(Player):
         return max(valid_targets, key=lambda p: p.bank)
 
     def chooseBusinessCenterSwap(
-        self, target: Player, my_swappable: list, their_swappable: list
+        self, target: Player, my_swappable: list, their_swappable: list,
+        players: list[Player] | None = None,
     ) -> tuple[Card, Card] | None:
         """Choose which card to give and which to take when activating Business Center.
 
@@ -365,19 +581,119 @@ def get_die_roller(players: list[Player]) -> Player:
     raise ValueError("No player is currently rolling the dice")
 
 
+def roll_mask(values: list[int]) -> int:
+    """Return an int with bit v set for every die value v in values (bit 0 = roll 0)."""
+    mask = 0
+    for v in values:
+        mask |= 1 << v
+    return mask
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CardSpec:
+    """Immutable definition of a card's rules, shared by every copy of that card.
+
+    Specs are interned through CardSpec.of(), so equal definitions are the same object
+    and compare and hash by identity. hits_mask and sort_key are worked out once here
+    rather than on every trigger check or comparison.
+    """
+    name: str | None
+    category: int | None
+    cost: int
+    payout: int
+    hits: tuple[int, ...]
+    multiplies: int | None = None
+    hits_mask: int = field(init=False)
+    sort_key: float = field(init=False)
+
+    _interned: ClassVar[dict[tuple, CardSpec]] = {}
+
+    def __post_init__(self) -> None:
+        # Sort by mean hit value, then by cost, then pseudo-alphabetically
+        key = mean(self.hits) + self.cost/100 + ord(str(self.name)[0])/255
+        object.__setattr__(self, "hits_mask", roll_mask(self.hits))
+        object.__setattr__(self, "sort_key", key)
+
+    @classmethod
+    def of(cls, name: str | None, category: int | None, cost: int, payout: int,
+           hits, multiplies: int | None = None) -> CardSpec:
+        """Return the shared spec for these stats, creating it on first use."""
+        key = (name, category, cost, payout, tuple(hits), multiplies)
+        spec = cls._interned.get(key)
+        if spec is None:
+            spec = cls._interned[key] = cls(*key)
+        return spec
+
+    def with_(self, **changes) -> CardSpec:
+        """Return the interned spec equal to this one with the given fields changed."""
+        fields = {"name": self.name, "category": self.category, "cost": self.cost,
+                  "payout": self.payout, "hits": self.hits, "multiplies": self.multiplies}
+        fields.update(changes)
+        return CardSpec.of(**fields)
+
+
+def _spec_field(attr: str, doc: str) -> property:
+    """Property that reads attr from the card's spec; assigning rebinds the copy to a new spec."""
+    fget = attrgetter(f"spec.{attr}")
+
+    def fset(self, value) -> None:
+        self._rebind(self.spec.with_(**{attr: value}))
+    return property(fget, fset, doc=doc)
+
+
 # === Define Class Card() === #
 @total_ordering
 class Card(object):
-    """Abstract base card; subclasses implement trigger() to define activation behaviour."""
+    """Abstract base card; subclasses implement trigger() to define activation behaviour.
+
+    A Card is one physical copy: it holds only its owner and a shared, immutable CardSpec
+    with the rules. hits_mask mirrors hitsOn as a bitmask so trigger checks are a shift
+    and an AND.
+    """
+
+    __slots__ = ("spec", "owner")
 
     def __init__(self):
-        self.name = None
-        self.cost = 0
-        self.payout = 0
-        self.hitsOn = [0]
+        self.spec = CardSpec.of(None, None, 0, 0, (0,))
         self.owner = None       # Cards start with no owner
-        self.category = None    # Categories from the list below
-        self.multiplies = None  # Also categories
+
+    name = _spec_field("name", "Card name.")
+    cost = _spec_field("cost", "Purchase price in coins.")
+    payout = _spec_field("payout", "Coins paid (or taken) when the card fires.")
+    category = _spec_field("category", "Category from the list below.")
+    multiplies = _spec_field("multiplies", "Category a factory card multiplies, if any.")
+
+    @property
+    def hitsOn(self) -> list[int]:
+        """Die values this card fires on, as a fresh list. Reassign (don't mutate in place) to change them."""
+        return list(self.spec.hits)
+
+    @hitsOn.setter
+    def hitsOn(self, values: list[int]) -> None:
+        self._rebind(self.spec.with_(hits=tuple(values)))
+
+    def _rebind(self, spec: CardSpec) -> None:
+        """Switch this copy to spec and bump the owner's deck version, so caches keyed on it refresh."""
+        self.spec = spec
+        deck = getattr(self.owner, "deck", None)
+        if isinstance(deck, Store):
+            deck.deck._touch()
+
+    @property
+    def hits_mask(self) -> int:
+        """Bitmask with bit v set for each value in hitsOn."""
+        return self.spec.hits_mask
+
+    def fires_on(self, roll: int) -> bool:
+        """Return True if roll is one of this card's trigger values (a single bit test)."""
+        return self.spec.hits_mask >> roll & 1 == 1
+
+    def copy(self) -> Card:
+        """Return a new, unowned copy of this card sharing the same spec."""
+        card = object.__new__(type(self))
+        card.spec = self.spec
+        card.owner = None
+        return card
 
     def describe(self) -> str:
         """Return a plain-English description of this card's effect for display in purchase menus."""
@@ -385,21 +701,17 @@ class Card(object):
 
     def sortvalue(self) -> float:
         """Return a float used for stable deck ordering: mean hitsOn, then cost, then name."""
-        value = 0.000
-        value += mean(self.hitsOn)   # Sort by mean hit value
-        value += self.cost/100                  # Then by cost
-        value += ord(str(self.name)[0])/255     # Then by pseudo-alphabetical
-        return value
+        return self.spec.sort_key
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Card):
             return NotImplemented
-        return self.sortvalue() == other.sortvalue()
+        return self.spec.sort_key == other.spec.sort_key
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Card):
             return NotImplemented
-        return self.sortvalue() < other.sortvalue()
+        return self.spec.sort_key < other.spec.sort_key
 
     def __hash__(self) -> int:
         return hash((self.name, self.category, self.cost))
@@ -417,13 +729,11 @@ class Card(object):
 class Green(Card):
     """Green card: pays the bank → die-roller on their own turn; optionally multiplies by category count."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, category: int, cost: int, payout: int, hitsOn: list, multiplies: int | None = None):
-        self.name = name
-        self.category = category
-        self.cost = cost
-        self.payout = payout
-        self.multiplies = multiplies
-        self.hitsOn = hitsOn
+        self.spec = CardSpec.of(name, category, cost, payout, hitsOn, multiplies)
+        self.owner = None
 
     _category_names = {1: "Grain", 2: "Ranch", 3: "Bakery", 4: "Café",
                        5: "Gear", 6: "Factory", 7: "Major", 8: "Fruit"}
@@ -463,12 +773,11 @@ class Green(Card):
 class Red(Card):
     """Red card: steals coins from the die-roller and gives them to the card owner."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, category: int, cost: int, payout: int, hitsOn: list):
-        self.name = name
-        self.category = category
-        self.cost = cost
-        self.payout = payout
-        self.hitsOn = hitsOn
+        self.spec = CardSpec.of(name, category, cost, payout, hitsOn)
+        self.owner = None
 
     def describe(self) -> str:
         """Describe this Red card's steal effect; notes Shopping Mall bonus where applicable."""
@@ -490,12 +799,11 @@ class Red(Card):
 class Blue(Card):
     """Blue card: pays the bank → card owner regardless of who rolled the dice."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, category: int, cost: int, payout: int, hitsOn: list):
-        self.name = name
-        self.category = category
-        self.cost = cost
-        self.payout = payout
-        self.hitsOn = hitsOn
+        self.spec = CardSpec.of(name, category, cost, payout, hitsOn)
+        self.owner = None
 
     def describe(self) -> str:
         """Describe this Blue card's passive income effect."""
@@ -509,12 +817,11 @@ class Blue(Card):
 class Stadium(Card):
     """Purple card: on a 6, collects 2 coins from every player for the die-roller."""
 
+    __slots__ = ()
+
     def __init__(self, name="Stadium"):
-        self.name = name
-        self.category = 7
-        self.cost = 6
-        self.hitsOn = [6]
-        self.payout = 2
+        self.spec = CardSpec.of(name, 7, 6, 2, (6,))
+        self.owner = None
 
     def describe(self) -> str:
         """Describe the Stadium's collect-from-all effect."""
@@ -535,12 +842,11 @@ class Stadium(Card):
 class TVStation(Card):
     """Purple card: on a 6, lets the owner steal 5 coins from a chosen target player."""
 
+    __slots__ = ()
+
     def __init__(self, name="TV Station"):
-        self.name = name
-        self.category = 7
-        self.cost = 7
-        self.hitsOn = [6]
-        self.payout = 5
+        self.spec = CardSpec.of(name, 7, 7, 5, (6,))
+        self.owner = None
 
     def describe(self) -> str:
         """Describe the TV Station's targeted-steal effect."""
@@ -567,12 +873,11 @@ class TVStation(Card):
 class BusinessCenter(Card):
     """Purple card: on a 6, lets the owner swap a card with another player."""
 
+    __slots__ = ()
+
     def __init__(self, name="Business Center"):
-        self.name = name
-        self.category = 7
-        self.cost = 8
-        self.hitsOn = [6]
-        self.payout = 0
+        self.spec = CardSpec.of(name, 7, 8, 0, (6,))
+        self.owner = None
 
     def describe(self) -> str:
         """Describe the Business Center's card-swap effect."""
@@ -589,7 +894,7 @@ class BusinessCenter(Card):
                 my_cards = [c for c in dieroller.deck.deck if not isinstance(c, UpgradeCard)]
                 their_cards = [c for c in target.deck.deck if not isinstance(c, UpgradeCard)]
                 swap_result = dieroller.chooseBusinessCenterSwap(
-                    target, my_cards, their_cards
+                    target, my_cards, their_cards, players
                 )
                 if swap_result:
                     card_to_give, card_to_take = swap_result
@@ -621,13 +926,13 @@ class UpgradeCard(Card):
         "Radio Tower" : [22, 7, "hasRadioTower"]
     }
 
+    __slots__ = ()
+
     def __init__(self, name: str):
-        super().__init__()
-        self.name = name
-        self.cost = self.orangeCards[name][0]
-        self.category = self.orangeCards[name][1]
+        cost, category, _ = self.orangeCards[name]
+        # For sorting purposes these cards should be listed last among a player's assets, with a number that can never be rolled
+        self.spec = CardSpec.of(name, category, cost, 0, (99,))
         self.owner = None
-        self.hitsOn = [99]  # For sorting purposes these cards should be listed last among a player's assets, with a number that can never be rolled
 
     _descriptions = {
         "Train Station":  "Roll 1 or 2 dice on your turn",
@@ -636,6 +941,16 @@ class UpgradeCard(Card):
         "Radio Tower":    "Once per turn, reroll your dice",
     }
 
+    _listings: ClassVar[dict[str, UpgradeCard]] = {}
+
+    @classmethod
+    def listing(cls, name: str) -> UpgradeCard:
+        """Return the shared, unowned card used to offer this landmark for sale."""
+        card = cls._listings.get(name)
+        if card is None:
+            card = cls._listings[name] = cls(name)
+        return card
+
     def describe(self) -> str:
         """Return the permanent ability description for this landmark card."""
         return self._descriptions.get(self.name, "")
@@ -644,44 +959,184 @@ class UpgradeCard(Card):
         """Set the corresponding boolean flag on the owner to activate this upgrade's ability."""
         setattr(self.owner, self.orangeCards[self.name][2], True)
 
+_card_list_versions = count(1)
+
+
+class CardList(list):
+    """A list of Cards that records a new version stamp whenever it is mutated.
+
+    Store.deck is always a CardList, so code that edits the list directly (deck.append,
+    deck.remove, deck.clear, ...) still invalidates anything cached against it. Stamps
+    come from one process-wide counter, so a version identifies a deck's contents
+    uniquely, even across different lists.
+    """
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.version = next(_card_list_versions)
+
+    def _touch(self) -> None:
+        self.version = next(_card_list_versions)
+
+    def append(self, card) -> None:
+        super().append(card)
+        self._touch()
+
+    def extend(self, cards) -> None:
+        super().extend(cards)
+        self._touch()
+
+    def insert(self, index, card) -> None:
+        super().insert(index, card)
+        self._touch()
+
+    def remove(self, card) -> None:
+        super().remove(card)
+        self._touch()
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._touch()
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._touch()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, cards):
+        result = super().__iadd__(cards)
+        self._touch()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._touch()
+        return result
+
+
+# Cards resolve in this color order on every roll: Red → Blue → Green → Purple
+TRIGGER_ORDER: tuple[type, ...] = (Red, Blue, Green, Stadium, TVStation, BusinessCenter)
+_NO_TRIGGERS: tuple[tuple, ...] = ((),) * len(TRIGGER_ORDER)
+
+
 # "Stores" are wrappers for a deck[] list and a few functions; decks hold Card objects
 class Store(object):
-    """Generic sorted collection of Card objects with query and mutation helpers."""
+    """Generic sorted collection of Card objects with query and mutation helpers.
+
+    Alongside the sorted .deck list, a Store keeps a name -> [cards] multiset in deck
+    order, so names(), freq() and counts() read one entry per card type. The multiset
+    is updated in place by append() and remove(); if .deck is edited directly, it is
+    rebuilt from the list on next use (tracked via CardList.version).
+    """
 
     def __init__(self):
         self.deck = []
 
+    @property
+    def deck(self) -> CardList:
+        """The cards in this store; assigning a plain list wraps it in a CardList."""
+        return self._cards
+
+    @deck.setter
+    def deck(self, cards: list) -> None:
+        self._cards = cards if isinstance(cards, CardList) else CardList(cards)
+        self._counted_version = None
+        self._sorted_version = None
+
+    def _by_name(self) -> dict[str, list[Card]]:
+        """Return the name -> [cards] multiset, rebuilding it if .deck was edited directly."""
+        if self._counted_version != self._cards.version:
+            self._recount()
+        return self._kinds
+
+    def _recount(self) -> None:
+        kinds: dict[str, list[Card]] = {}
+        for card in self._cards:
+            kinds.setdefault(card.name, []).append(card)
+        self._kinds = kinds
+        self._counted_version = self._cards.version
+
     def names(self, maxcost: int = 99, flavor: type = Card) -> list[str]:
         """Return a de-duplicated list of card names with cost ≤ maxcost and matching flavor type."""
-        namelist = []
-        for card in self.deck:
-            if (card.name not in namelist) and isinstance(card, flavor) and (card.cost <= maxcost):
-                namelist.append(card.name)
-        return namelist
+        return [name for name, cards in self._by_name().items()
+                if isinstance(cards[0], flavor) and cards[0].cost <= maxcost]
 
     def freq(self) -> dict[Card, int]:
         """Return a {card: count} dict of card occurrences in this deck."""
-        f = {}
-        for card in self.deck:
-            if f.get(card):
-                f[card] += 1
-            else:
-                f[card] = 1
-        return f
+        return {cards[0]: len(cards) for cards in self._by_name().values()}
+
+    def counts(self) -> dict[str, int]:
+        """Return a {name: count} dict of card occurrences in this deck, in deck order."""
+        return {name: len(cards) for name, cards in self._by_name().items()}
+
+    def count(self, name: str) -> int:
+        """Return how many cards named name are in this deck."""
+        return len(self._by_name().get(name, ()))
+
+    def first(self, name: str) -> Card | None:
+        """Return the first card named name in deck order, or None if there is none."""
+        cards = self._by_name().get(name)
+        return cards[0] if cards else None
+
+    def kinds(self) -> list[Card]:
+        """Return the first card of each name, in deck order."""
+        return [cards[0] for cards in self._by_name().values()]
 
     def append(self, card: Card) -> None:
-        """Add card to the deck and re-sort. Raises TypeError if card is not a Card."""
+        """Add card to the deck in sorted position. Raises TypeError if card is not a Card."""
         if not isinstance(card, Card):
             raise TypeError(f"Expected Card, got {type(card).__name__}")
-        self.deck.append(card)
-        self.deck.sort()
+        deck = self._cards
+        if self._sorted_version != deck.version:
+            deck.append(card)
+            deck.sort()
+            self._recount()
+        else:
+            kinds = self._by_name()
+            insort_right(deck, card)
+            if card.name in kinds:
+                kinds[card.name].append(card)
+                self._counted_version = deck.version
+            else:
+                self._recount()
+        self._sorted_version = deck.version
 
     def remove(self, card: Card) -> None:
-        """Remove card from the deck and re-sort. Raises TypeError if card is not a Card."""
+        """Remove the first card equal to card. Raises TypeError if card is not a Card."""
         if not isinstance(card, Card):
             raise TypeError(f"Expected Card, got {type(card).__name__}")
-        self.deck.remove(card)
-        self.deck.sort()
+        deck = self._cards
+        i = bisect_left(deck, card) if self._sorted_version == deck.version else None
+        if i is None or i == len(deck) or deck[i] != card:
+            # Unsorted, or an unowned card's spec changed in place: fall back to a linear remove
+            deck.remove(card)
+            deck.sort()
+            self._recount()
+        else:
+            kinds = self._by_name()
+            removed = deck.pop(i)
+            same = kinds[removed.name]
+            same.pop(next(j for j, c in enumerate(same) if c is removed))
+            if not same:
+                del kinds[removed.name]
+            self._counted_version = deck.version
+        self._sorted_version = deck.version
 
 class PlayerDeck(Store):
     """A player's personal card collection; pre-loaded with Wheat Field and Bakery."""
@@ -694,6 +1149,42 @@ class PlayerDeck(Store):
         for card in self.deck:
             card.owner = self.owner
 
+    def trigger_masks(self) -> tuple[int, int]:
+        """Union bitmasks (own_turn, opponent_turn) of die values this deck fires on.
+
+        Own turn: every card except Reds and landmarks. Opponent turn: Blues and Reds.
+        """
+        self._refresh_indexes()
+        return self._masks
+
+    def triggered_by(self, roll: int) -> tuple[list[Card], ...]:
+        """Cards that fire on roll, one list per TRIGGER_ORDER color, in deck order."""
+        self._refresh_indexes()
+        return self._by_roll.get(roll, _NO_TRIGGERS)
+
+    def _refresh_indexes(self) -> None:
+        """Rebuild the trigger masks and roll index if the deck list changed since last time."""
+        cards = self.deck
+        if getattr(self, "_indexed_version", None) == cards.version:
+            return
+        own = opponent = 0
+        by_roll: dict[int, tuple[list[Card], ...]] = {}
+        for card in cards:
+            rank = next((i for i, color in enumerate(TRIGGER_ORDER) if isinstance(card, color)), None)
+            if rank is None:
+                continue
+            if not isinstance(card, Red):
+                own |= card.hits_mask
+            if isinstance(card, (Blue, Red)):
+                opponent |= card.hits_mask
+            for roll in card.hitsOn:
+                if roll not in by_roll:
+                    by_roll[roll] = tuple([] for _ in TRIGGER_ORDER)
+                by_roll[roll][rank].append(card)
+        self._masks = (own, opponent)
+        self._by_roll = by_roll
+        self._indexed_version = cards.version
+
     def __str__(self) -> str:
         decktext = ""
         for card in self.deck:
@@ -745,8 +1236,13 @@ class UniqueDeck(Store):
         self.deck.sort()
 
 # ==== Define top-level game functions ====
-def setPlayers(players: int | None = None, bots: int = 0, humans: int = 0) -> list[Player]:
-    """Build and return the player list from explicit counts, an integer, or interactive prompts."""
+def setPlayers(players: int | None = None, bots: int = 0, humans: int = 0,
+               rng: random.Random | None = None) -> list[Player]:
+    """Build and return the player list from explicit counts, an integer, or interactive prompts.
+
+    rng picks the bot class for interactive "Hard"/"Medium"/"Easy"/"Surprise Me!" seats;
+    it defaults to the global random module.
+    """
     # Lazy import — bots.py imports harmonictook (for Bot, Player, etc.) and strategy
     # (for EV functions), so importing at module level would create a circular dependency.
     # By the time setPlayers() is called the module is fully loaded and this resolves cleanly.
@@ -754,6 +1250,8 @@ def setPlayers(players: int | None = None, bots: int = 0, humans: int = 0) -> li
         ThoughtfulBot, EVBot, CoverageBot, ImpatientBot, MarathonBot,
         FromageBot, KinematicBot,
     )
+    if rng is None:
+        rng = random  # type: ignore[assignment]
     playerlist = []
     if bots > 0 or humans > 0:
         total = bots + humans
@@ -789,14 +1287,14 @@ def setPlayers(players: int | None = None, bots: int = 0, humans: int = 0) -> li
             else:
                 playername = input("What's the bot's name? (blank to auto-generate) ").strip()
                 if "Hard" in choice:
-                    cls = random.choices([FromageBot, ImpatientBot], weights=[50, 50])[0]
+                    cls = rng.choices([FromageBot, ImpatientBot], weights=[50, 50])[0]
                 elif "Medium" in choice:
-                    cls = random.choice([MarathonBot, EVBot, ThoughtfulBot])
+                    cls = rng.choice([MarathonBot, EVBot, ThoughtfulBot])
                 elif "Easy" in choice:
-                    cls = random.choices([CoverageBot, Bot], weights=[75, 25])[0]
+                    cls = rng.choices([CoverageBot, Bot], weights=[75, 25])[0]
                 else:  # Surprise me
-                    cls = random.choice([ThoughtfulBot, MarathonBot, ImpatientBot,
-                                         EVBot, CoverageBot, FromageBot, KinematicBot])
+                    cls = rng.choice([ThoughtfulBot, MarathonBot, ImpatientBot,
+                                      EVBot, CoverageBot, FromageBot, KinematicBot])
                 playerlist.append(cls(name=playername))
             if len(playerlist) == 4:
                 break
@@ -834,8 +1332,15 @@ class Display(ABC):
     Input:  pick_one, confirm, and show_info provide the primitives for
             Human player interaction. Any Display implementation that
             supports human play must implement all three.
+
+    subscribes names the event types this display wants; Game does not build the
+    rest (roll events excepted). None, the default, means every event type.
+    headless displays show nothing live, so Game skips the pause after bot turns.
     """
 
+    subscribes: frozenset[str] | None = None
+    headless: ClassVar[bool] = False
+
     @abstractmethod
     def show_events(self, events: list[Event]) -> None:
         """Render a list of game events."""
@@ -969,7 +1474,16 @@ class PlainTextDisplay(Display):
 
 
 class NullDisplay(Display):
-    """Swallows all events without rendering; used for testing and headless runs."""
+    """Swallows all events without rendering; used for testing and headless runs.
+
+    Pass subscribes=frozenset() for the quietest headless run: next_turn then builds
+    only the roll events Game.run needs.
+    """
+
+    headless: ClassVar[bool] = True
+
+    def __init__(self, subscribes: frozenset[str] | None = None) -> None:
+        self.subscribes = subscribes
 
     def show_events(self, events: list[Event]) -> None:
         pass
@@ -985,8 +1499,11 @@ class RecordingDisplay(Display):
     compute acceleration, or build any other per-game metrics.
     """
 
-    def __init__(self) -> None:
+    headless: ClassVar[bool] = True
+
+    def __init__(self, subscribes: frozenset[str] | None = None) -> None:
         self.events: list[Event] = []
+        self.subscribes = subscribes
 
     def show_events(self, events: list[Event]) -> None:
         self.events.extend(events)
@@ -995,19 +1512,75 @@ class RecordingDisplay(Display):
         pass
 
 
+class PayoutTallyDisplay(Display):
+    """Tallies card payouts as events stream in, without keeping the events.
+
+    After game.run(), self.payouts maps player name -> card name -> {"fires", "total"}:
+    how many times each card paid out and the coins it moved. Memory grows with the
+    number of distinct cards, not the length of the game.
+    """
+
+    headless: ClassVar[bool] = True
+
+    def __init__(self, subscribes: frozenset[str] | None = PAYOUT_EVENTS) -> None:
+        self.payouts: dict[str, dict[str, dict[str, int]]] = {}
+        self.subscribes = subscribes
+
+    def show_events(self, events: list[Event]) -> None:
+        for ev in events:
+            if ev.type not in PAYOUT_EVENTS or not ev.card:
+                continue
+            entry = self.payouts.setdefault(ev.player, {}).setdefault(ev.card, {"fires": 0, "total": 0})
+            entry["fires"] += 1
+            entry["total"] += ev.value
+
+    def show_state(self, game: Game) -> None:
+        pass
+
+
 class Game:
     """Encapsulates all state and logic for a single Machi Koro game."""
 
-    def __init__(self, players=None, bots: int = 0, humans: int = 0):
-        """Set up players, market, and reserve for a new game."""
-        self.players: list = setPlayers(players, bots=bots, humans=humans)
+    def __init__(self, players=None, bots: int = 0, humans: int = 0,
+                 history: HistoryPolicy | None = None, seed: int | None = None,
+                 rng: random.Random | None = None, dice: DiceStream | None = None):
+        """Set up players, market, and reserve for a new game.
+
+        history sets the retention policy for Game.history. seed (or an explicit rng)
+        gives this game its own random stream, shared by every seated player for dice
+        and tie-breaks; with neither, play draws from the global random module. dice, if
+        given, replaces that stream for dice rolls only, so bot decisions cannot shift it.
+        """
+        self.seed: int | None = seed
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random  # type: ignore[assignment]
+        self.rng: random.Random = rng  # type: ignore[assignment]
+        self.dice: DiceStream | None = dice
+        self.players: list = setPlayers(players, bots=bots, humans=humans, rng=self.rng)
+        for player in self.players:
+            player.rng = self.rng
+            player.dice = self.dice
         self.market: TableDeck = TableDeck()
         self.reserve: UniqueDeck = UniqueDeck(self.players)
         self.current_player_index: int = 0
         self.turn_number: int = 0
         self.last_roll: int | None = None
         self.winner: Player | None = None
-        self.history: list[GameState] = []
+        self.history: GameHistory = GameHistory(history)
+        self._strategy = None
+
+    @property
+    def strategy(self):
+        """Shared StrategyContext for this table, built on first use (see strategy.py).
+
+        Refreshed at the start of every turn and fed each event, so bots that receive
+        the game in chooseCard reuse one set of EV building blocks per turn.
+        """
+        if self._strategy is None:
+            # Lazy import — strategy.py imports this module
+            from strategy import StrategyContext  # noqa: PLC0415
+            self._strategy = StrategyContext(self.players)
+        return self._strategy
 
     def get_current_player(self) -> Player:
         """Return the player whose turn it currently is."""
@@ -1022,7 +1595,7 @@ class Game:
         player = self.get_current_player()
         seen: set[str] = set()
         options: list[Card] = []
-        for card in self.market.deck:
+        for card in self.market.kinds():
             if card.cost <= player.bank and card.name not in seen:
                 seen.add(card.name)
                 options.append(card)
@@ -1050,10 +1623,7 @@ class Game:
 
     def get_market_state(self) -> dict[str, int]:
         """Return available cards in the market as name -> quantity."""
-        counts: dict[str, int] = {}
-        for card in self.market.deck:
-            counts[card.name] = counts.get(card.name, 0) + 1
-        return counts
+        return self.market.counts()
 
     def reset(self) -> None:
         """Reset all game state for a rematch; preserves player list (same types, same names)."""
@@ -1065,22 +1635,26 @@ class Game:
         self.turn_number = 0
         self.last_roll = None
         self.winner = None
-        self.history = []
+        self.history.clear()
+        self._strategy = None
 
     def refresh_market(self) -> None:
-        """Sync unique cards between reserve and market based on the current player's holdings."""
+        """Sync unique cards between reserve and market based on the current player's holdings.
+
+        Works once per card name in the reserve, using the Store name counts, so the cost
+        per turn is the number of unique card types rather than a scan of every deck.
+        """
         player = self.get_current_player()
-        for card in list(self.reserve.deck):
-            if (card.name not in player.deck.names()) and (card.name in self.market.names()):
-                pass
-            elif (card.name not in player.deck.names()) and (card.name not in self.market.names()):
+        for card in self.reserve.kinds():
+            owned = player.deck.count(card.name) > 0
+            listed = self.market.count(card.name) > 0
+            if not owned and not listed:
                 self.market.append(card)
                 self.reserve.remove(card)
-            elif (card.name in player.deck.names()) and (card.name in self.market.names()):
-                self.market.remove(card)
-                self.reserve.append(card)
-            elif (card.name in player.deck.names()) and (card.name not in self.market.names()):
-                pass
+            elif owned and listed:
+                listed_card = self.market.first(card.name)
+                self.market.remove(listed_card)
+                self.reserve.append(listed_card)
 
     def next_turn(self, display: Display | None = None) -> list[Event]:
         """Execute one full turn for the current player; return list of game events.
@@ -1091,12 +1665,23 @@ class Game:
         if display is None:
             display = NullDisplay()
         events: list[Event] = []
+        wanted = None if display.subscribes is None else display.subscribes | _CONTROL_EVENTS
+
+        def wants(event_type: str) -> bool:
+            return wanted is None or event_type in wanted
 
         def emit(event: Event) -> None:
-            events.append(event)
-            display.show_events([event])
+            if self._strategy is not None:
+                self._strategy.observe([event])
+            if wanted is None or event.type in wanted:
+                events.append(event)
+                display.show_events([event])
 
         player = self.get_current_player()
+        if self.dice is not None:
+            self.dice.start_turn(self.current_player_index)
+        if self._strategy is not None:
+            self._strategy.refresh()
 
         # Reset isrollingdice flags; mark the active player
         for person in self.players:
@@ -1107,13 +1692,15 @@ class Game:
         display.show_state(self)
 
         # Pre-turn status: show coins and deck before any prompts fire
-        for person in self.players:
-            emit(Event(type="bank_status", player=person.name, value=person.bank))
-        deck_header = f"-=-=-={player.name}'s Deck=-=-=-\n"
-        emit(Event(type="deck_state", player=player.name, message=deck_header + deck_to_string(player.deck)))
+        if wants("bank_status"):
+            for person in self.players:
+                emit(Event(type="bank_status", player=person.name, value=person.bank))
+        if wants("deck_state"):
+            emit(DeckStateEvent(player.name, f"-=-=-={player.name}'s Deck=-=-=-\n", player.deck.deck))
 
         # Die Rolling Phase
-        emit(Event(type="turn_start", player=player.name))
+        if wants("turn_start"):
+            emit(Event(type="turn_start", player=player.name))
         dieroll, isDoubles = player.dieroll(self.players)
         self.last_roll = dieroll
         emit(Event(type="roll", player=player.name, value=dieroll, is_doubles=isDoubles))
@@ -1126,21 +1713,23 @@ class Game:
             emit(Event(type="roll", player=player.name, value=dieroll, is_doubles=isDoubles))
 
         # Brief pause after roll so bot turns are readable (skip in headless/tournament runs)
-        if isinstance(player, Bot) and not isinstance(display, NullDisplay):
+        if isinstance(player, Bot) and not display.headless:
             time.sleep(0.5)
 
-        # Card triggers in correct color order: Red → Blue → Green → Purple
-        for card_color in [Red, Blue, Green, Stadium, TVStation, BusinessCenter]:
+        # Card triggers in correct color order: Red → Blue → Green → Purple.
+        # Each deck's roll index hands back only the cards that fire on this roll.
+        for rank in range(len(TRIGGER_ORDER)):
             for person in self.players:
-                for card in person.deck.deck:
-                    if dieroll in card.hitsOn and isinstance(card, card_color):
+                for card in person.deck.triggered_by(dieroll)[rank]:
+                    if wants("card_activates"):
                         emit(Event(type="card_activates", player=person.name, card=card.name, value=dieroll))
-                        for trigger_event in card.trigger(self.players):
-                            emit(trigger_event)
+                    for trigger_event in card.trigger(self.players):
+                        emit(trigger_event)
 
         # Post-trigger bank status: show updated coins before the buy decision
-        for person in self.players:
-            emit(Event(type="bank_status", player=person.name, value=person.bank))
+        if wants("bank_status"):
+            for person in self.players:
+                emit(Event(type="bank_status", player=person.name, value=person.bank))
         display.show_state(self)
 
         action = player.chooseAction(self.market)
@@ -1154,19 +1743,20 @@ class Game:
             emit(Event(type="pass", player=player.name))
 
         # Brief pause after purchase/pass so bot turns are readable (skip in headless/tournament runs)
-        if isinstance(player, Bot) and not isinstance(display, NullDisplay):
+        if isinstance(player, Bot) and not display.headless:
             time.sleep(0.5)
 
-        self.history.append(GameState(
-            turn_number=self.turn_number,
-            active_player=player.name,
-            roll=self.last_roll,
-            players=[
-                PlayerSnapshot(**self.get_player_state(p))
-                for p in self.players
-            ],
-            events=events,
-        ))
+        if self.history.enabled:
+            self.history.append(GameState(
+                turn_number=self.turn_number,
+                active_player=player.name,
+                roll=self.last_roll,
+                players=[
+                    PlayerSnapshot(**self.get_player_state(p))
+                    for p in self.players
+                ],
+                events=events,
+            ))
         self.turn_number += 1
         display.show_state(self)
         return events
@@ -1174,7 +1764,8 @@ class Game:
     def _declare_winner(self, player: Player, display: Display) -> None:
         """Record the winner and emit the win event."""
         self.winner = player
-        display.show_events([Event(type="win", player=player.name)])
+        if display.subscribes is None or "win" in display.subscribes:
+            display.show_events([Event(type="win", player=player.name)])
 
     def run(self, display: Display | None = None) -> None:
         """Run the game loop until a player wins."""
@@ -1182,6 +1773,8 @@ class Game:
             display = PlainTextDisplay()
         for p in self.players:
             p.display = display
+            p.rng = self.rng
+            p.dice = self.dice
         while True:
             for i, turntaker in enumerate(self.players):
                 self.current_player_index = i
@@ -1193,7 +1786,8 @@ class Game:
                     self._declare_winner(turntaker, display)
                     return
                 while is_doubles and turntaker.hasAmusementPark:
-                    display.show_events([Event(type="doubles_bonus", player=turntaker.name)])
+                    if display.subscribes is None or "doubles_bonus" in display.subscribes:
+                        display.show_events([Event(type="doubles_bonus", player=turntaker.name)])
                     events = self.next_turn(display)
                     roll_events = [e for e in events if e.type == "roll"]
                     is_doubles = roll_events[-1].is_doubles if roll_events else False
@@ -1212,10 +1806,21 @@ def main():
                         help='display mode: text (default), color (full-screen Textual TUI), gui (not yet supported)')
     parser.add_argument('--seed', type=int, default=None, metavar='N',
                         help='random seed for reproducible dice and bot choices')
+    parser.add_argument('--history', default='full', metavar='MODE[:N]',
+                        help='per-turn history kept: full (default), compact, delta or off; '
+                             'append :N to keep only the last N turns')
     args = parser.parse_args()
+    try:
+        history = HistoryPolicy.parse(args.history)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # Each match gets its own game seed drawn from --seed, so New Match does not replay the last game
+    match_rng = random.Random(args.seed) if args.seed is not None else None
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    def new_game() -> Game:
+        seed = match_rng.getrandbits(63) if match_rng is not None else None
+        return Game(bots=args.bots, humans=args.humans, history=history, seed=seed)
 
     if args.mode == 'color':
         try:
@@ -1223,7 +1828,7 @@ def main():
         except ImportError:
             parser.error("--mode color requires the textual package: pip install textual")
         while True:
-            game = Game(bots=args.bots, humans=args.humans)
+            game = new_game()
             display = ColorTUIDisplay()
             app = HarmonicTookApp(game=game, display=display)
             app.run()
@@ -1234,7 +1839,7 @@ def main():
     else:
         _MENU = ["New Match", "Rematch", "Quit"]
         display = PlainTextDisplay()
-        game = Game(bots=args.bots, humans=args.humans)
+        game = new_game()
         while True:
             game.run(display=display)
             choice = display.pick_one(_MENU, prompt="Play again? ")
@@ -1243,7 +1848,7 @@ def main():
             elif choice == "Rematch":
                 game.reset()
             else:  # New Match
-                game = Game(bots=args.bots, humans=args.humans)
+                game = new_game()
 
 
 if __name__ == "__main__":
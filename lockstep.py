@@ -0,0 +1,351 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# lockstep.py — Vectorized lock-step Monte Carlo simulator for fixed buy-order policies
+#
+# Plays thousands of independent games at once with NumPy: every unfinished game
+# advances one turn per step, dice are drawn as arrays and each color of card
+# resolves as one array operation across all games. Players follow PriorityPolicy
+# buy orders (FromageBot.PRIORITY, ThoughtfulBot's preference lists, or your own
+# caps), compiled into per-entry lookup arrays.
+#
+# Rules match FastGame / Game. Decisions follow the Bot defaults the priority bots
+# inherit: buy whenever something is affordable, reroll below 5 with Radio Tower,
+# target the richest opponent, and give away the lowest (hitsOn + cost) card in a
+# Business Center swap. Dice follow _dice_by_ev. Results are statistically, not
+# move-for-move, comparable with FastGame, since the random streams differ.
+#
+# Usage:
+#   python lockstep.py                       # FromageBot vs ThoughtfulBot, 10000 games
+#   python lockstep.py --games 50000 --seed 7
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+
+from bots import FromageBot, ThoughtfulBot
+from fastgame import CATALOGUE, KIND, _MALL_GREEN, _MALL_RED, _UPGRADE_ORDER
+from harmonictook import Blue, BusinessCenter, Green, Red, Stadium, TVStation, UpgradeCard
+from strategy import ONE_DIE_PROB, TWO_DIE_PROB
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for the rest of the package, but required here
+    np = None
+
+
+@dataclass(frozen=True)
+class PolicyEntry:
+    """One step of a buy order: buy card while owning fewer than cap copies.
+
+    The entry is skipped unless the seat owns every landmark in landmarks and at
+    least min_count cards of category (when category is set).
+    """
+    card: str
+    cap: int = 99
+    landmarks: tuple[str, ...] = ()
+    category: int | None = None
+    min_count: int = 0
+
+
+class PriorityPolicy:
+    """A fixed buy order compiled into arrays indexed by CATALOGUE kind.
+
+    choose() picks, for every game at once, the first entry whose card is on offer,
+    under its cap and whose gates pass. If none applies it picks uniformly among the
+    offered cards still under their fallback cap, or among all offered cards if every
+    one is capped (FromageBot's fallback; fallback_caps=None means no caps, as in
+    ThoughtfulBot).
+    """
+
+    def __init__(self, label: str, entries: list[PolicyEntry | tuple[str, int]],
+                 fallback_caps: dict[str, int] | None = None) -> None:
+        if np is None:
+            raise ImportError("lockstep requires NumPy: pip install numpy")
+        self.label = label
+        self.entries = [e if isinstance(e, PolicyEntry) else PolicyEntry(*e) for e in entries]
+        self.kind = np.array([KIND[e.card] for e in self.entries], dtype=np.intp)
+        self.cap = np.array([e.cap for e in self.entries])
+        self.need = np.zeros((len(self.entries), len(CATALOGUE)), dtype=bool)
+        for row, entry in zip(self.need, self.entries):
+            row[[KIND[name] for name in entry.landmarks]] = True
+        self.need_category = np.array([e.category or 0 for e in self.entries], dtype=np.intp)
+        self.min_count = np.array([e.min_count for e in self.entries])
+        self.fallback_cap = np.full(len(CATALOGUE), np.iinfo(np.int64).max)
+        if fallback_caps is not None:
+            self.fallback_cap[:] = 0    # FromageBot never prefers a card missing from its list
+            for name, cap in fallback_caps.items():
+                self.fallback_cap[KIND[name]] = cap
+
+    @classmethod
+    def fromage(cls, priority: list[tuple[str, int]] | None = None) -> PriorityPolicy:
+        """FromageBot's buy order (or a variant with other caps), with its capped fallback."""
+        priority = FromageBot.PRIORITY if priority is None else priority
+        caps: dict[str, int] = {}
+        for name, cap in priority:
+            caps[name] = max(caps.get(name, 0), cap)
+        return cls("FromageBot", list(priority), fallback_caps=caps)
+
+    @classmethod
+    def thoughtful(cls) -> PriorityPolicy:
+        """ThoughtfulBot's preference lists: late cards only with Train Station and factory prereqs."""
+        entries = [PolicyEntry(name) for name in ThoughtfulBot.UPGRADES]
+        for name in ThoughtfulBot.LATE_CARDS:
+            category, min_count = ThoughtfulBot._FACTORY_PREREQS.get(name, (None, 0))
+            entries.append(PolicyEntry(name, landmarks=("Train Station",), category=category, min_count=min_count))
+        entries += [PolicyEntry(name) for name in ThoughtfulBot.EARLY_CARDS]
+        return cls("ThoughtfulBot", entries)
+
+    def choose(self, offered, owned, rng):
+        """Return the chosen kind per row (-1 where nothing is offered).
+
+        offered is a (games, kinds) bool array; owned is the chooser's (games, kinds) counts.
+        """
+        categories = owned @ _CATEGORY_ONEHOT
+        ok = (offered[:, self.kind] & (owned[:, self.kind] < self.cap)
+              & (categories[:, self.need_category] >= self.min_count))
+        for e in np.flatnonzero(self.need.any(axis=1)):
+            ok[:, e] &= (owned[:, self.need[e]] > 0).all(axis=1)
+        hit = ok.any(axis=1)
+        choice = np.where(hit, self.kind[ok.argmax(axis=1)], -1)
+        rest = ~hit & offered.any(axis=1)
+        if rest.any():
+            pool = offered[rest]
+            under = pool & (owned[rest] < self.fallback_cap)
+            pool = np.where(under.any(axis=1)[:, None], under, pool)
+            keys = np.where(pool, rng.random(pool.shape), -1.0)
+            choice[rest] = keys.argmax(axis=1)
+        return choice
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a lock-step run: winning seat (-1 if unfinished) and turns per game."""
+    labels: list[str]
+    winners: object     # np.ndarray of shape (games,)
+    turns: object       # np.ndarray of shape (games,)
+
+    @property
+    def win_rates(self) -> dict[str, float]:
+        """Fraction of all games won by each seat, keyed by 'seat:label'."""
+        games = len(self.winners)
+        return {f"{seat}:{label}": float((self.winners == seat).sum()) / games
+                for seat, label in enumerate(self.labels)}
+
+    def length_distribution(self) -> dict[int, float]:
+        """Turns played -> fraction of finished games that took that many turns."""
+        finished = self.turns[self.winners >= 0]
+        values, counts = np.unique(finished, return_counts=True)
+        return {int(v): float(c) / len(finished) for v, c in zip(values, counts)}
+
+
+# Card tables (rows follow CATALOGUE)
+if np is not None:
+    _K = len(CATALOGUE)
+    _HIT = np.array([[card.fires_on(roll) for roll in range(13)] for card in CATALOGUE])
+    _PAYOUT = np.array([card.payout for card in CATALOGUE])
+    _COST = np.array([card.cost for card in CATALOGUE])
+    _IS_RED, _IS_BLUE, _IS_GREEN = (np.array([type(c) is color for c in CATALOGUE]) for color in (Red, Blue, Green))
+    _IS_LANDMARK = np.array([isinstance(c, UpgradeCard) for c in CATALOGUE])
+    _FACTORY = np.array([getattr(c, "multiplies", None) or 0 for c in CATALOGUE], dtype=np.intp)
+    _MALL_RED_BONUS = np.isin(np.arange(_K), list(_MALL_RED)).astype(int)
+    _MALL_GREEN_BONUS = np.isin(np.arange(_K), list(_MALL_GREEN)).astype(int)
+    _CATEGORY_ONEHOT = np.zeros((_K, 1 + max(c.category for c in CATALOGUE)), dtype=int)
+    _CATEGORY_ONEHOT[np.arange(_K), [c.category for c in CATALOGUE]] = 1
+    # Bot.chooseBusinessCenterSwap gives away the card with the lowest sum(hitsOn) + cost
+    _GIVE_SCORE = np.array([sum(c.hitsOn) + c.cost for c in CATALOGUE])
+    _DIE = {n: np.array([table.get(r, 0.0) for r in range(13)]) for n, table in ((1, ONE_DIE_PROB), (2, TWO_DIE_PROB))}
+    _PURPLES = [k for k, c in enumerate(CATALOGUE) if isinstance(c, (Stadium, TVStation, BusinessCenter))]
+    _STADIUM, _TV, _BC = KIND["Stadium"], KIND["TV Station"], KIND["Business Center"]
+    _TRAIN, _MALL, _PARK, _RADIO = (KIND[name] for name in UpgradeCard.orangeCards)
+    _LANDMARKS = list(_UPGRADE_ORDER)
+
+
+class LockstepSimulator:
+    """Array state for many games played side by side by the same seated policies.
+
+    counts[g, s, k] is how many of CATALOGUE kind k seat s owns in game g (landmark
+    kinds are 0 or 1); bank[g, s] is coins; market and reserve are (games, kinds).
+    """
+
+    def __init__(self, policies: list[PriorityPolicy], games: int, seed: int | None = None) -> None:
+        if np is None:
+            raise ImportError("lockstep requires NumPy: pip install numpy")
+        self.policies = policies
+        self.rng = np.random.default_rng(seed)
+        n = len(policies)
+        self.counts = np.zeros((games, n, _K), dtype=np.int64)
+        self.counts[:, :, KIND["Wheat Field"]] = 1
+        self.counts[:, :, KIND["Bakery"]] = 1
+        self.bank = np.full((games, n), 3, dtype=np.int64)
+        self.market = np.zeros((games, _K), dtype=np.int64)
+        self.market[:, ~_IS_LANDMARK] = 6
+        self.market[:, _PURPLES] = 1
+        self.reserve = np.zeros((games, _K), dtype=np.int64)
+        self.reserve[:, _PURPLES] = n + 1
+        self.current = np.zeros(games, dtype=np.intp)
+        self.turns = np.zeros(games, dtype=np.int64)
+        self.winners = np.full(games, -1, dtype=np.intp)
+
+    def run(self, max_turns: int = 2000) -> SimulationResult:
+        """Step every game until it has a winner or has played max_turns turns."""
+        while True:
+            active = np.flatnonzero((self.winners < 0) & (self.turns < max_turns))
+            if not len(active):
+                break
+            self.step(active)
+        return SimulationResult([p.label for p in self.policies], self.winners, self.turns)
+
+    def step(self, g) -> None:
+        """Play one turn in each game listed in g."""
+        n_seats = len(self.policies)
+        cur = self.current[g]
+        rows = np.arange(len(g))
+        own = self.counts[g, cur]
+        counts, bank = self.counts, self.bank
+
+        # Market: list purples the roller doesn't own, take back ones they do
+        for k in _PURPLES:
+            owned = own[:, k] > 0
+            listed = self.market[g, k] > 0
+            stocked = self.reserve[g, k] > 0
+            delta = (stocked & ~owned & ~listed).astype(np.int64) - (stocked & owned & listed)
+            self.market[g, k] += delta
+            self.reserve[g, k] -= delta
+
+        # Dice: two only with Train Station and when two have the higher own-turn mean
+        two = own[:, _TRAIN] > 0
+        if two.any():
+            income = self._own_income(g, cur, own)
+            two &= self._own_mean(income, own, 2) >= self._own_mean(income, own, 1)
+        roll, doubles = self._roll(two)
+        reroll = (own[:, _RADIO] > 0) & (roll < 5)
+        if reroll.any():
+            roll[reroll], doubles[reroll] = self._roll(two[reroll])
+        fire = _HIT[:, roll].T
+
+        # Red: each opponent in seat order takes from the roller
+        for s in range(n_seats):
+            mall = counts[g, s, _MALL][:, None] > 0
+            owed = (counts[g, s] * (_PAYOUT + mall * _MALL_RED_BONUS) * (fire & _IS_RED)).sum(axis=1)
+            taken = np.minimum(owed, bank[g, cur]) * (cur != s)
+            bank[g, cur] -= taken
+            bank[g, s] += taken
+        # Blue: everyone
+        bank[g] += (counts[g] * (_PAYOUT * (fire & _IS_BLUE))[:, None, :]).sum(axis=2)
+        # Green: roller only; factories pay per card of the category they multiply
+        categories = own @ _CATEGORY_ONEHOT
+        green = _PAYOUT * np.where(_FACTORY > 0, categories[:, _FACTORY], 1)
+        green = green + (own[:, _MALL] > 0)[:, None] * _MALL_GREEN_BONUS
+        bank[g, cur] += (own * green * (fire & _IS_GREEN)).sum(axis=1)
+        # Purple: every Stadium on the table collects for the roller (as Stadium.trigger does)
+        sixes = roll == 6
+        stadiums = counts[g, :, _STADIUM].sum(axis=1) * sixes
+        for copy in range(stadiums.max(initial=0)):
+            for s in range(n_seats):
+                paid = np.minimum(_PAYOUT[_STADIUM], bank[g, s]) * ((stadiums > copy) & (cur != s))
+                bank[g, s] -= paid
+                bank[g, cur] += paid
+        tvs = own[:, _TV] * sixes
+        for copy in range(tvs.max(initial=0)):
+            target = self._richest_opponent(g, cur, rows)
+            paid = np.minimum(_PAYOUT[_TV], bank[g, target]) * (tvs > copy)
+            bank[g, target] -= paid
+            bank[g, cur] += paid
+        for r in np.flatnonzero(own[:, _BC] * sixes):
+            for _ in range(own[r, _BC]):
+                self._business_center(g[r], cur[r])
+
+        # Buy: the seat's policy picks among affordable offers whenever there are any
+        own = counts[g, cur]
+        offered = np.where(_IS_LANDMARK, own == 0, self.market[g] > 0) & (_COST <= bank[g, cur][:, None])
+        for s, policy in enumerate(self.policies):
+            mine = np.flatnonzero((cur == s) & offered.any(axis=1))
+            if not len(mine):
+                continue
+            kind = policy.choose(offered[mine], own[mine], self.rng)
+            games = g[mine]
+            counts[games, s, kind] += 1
+            bank[games, s] -= _COST[kind]
+            self.market[games, kind] -= ~_IS_LANDMARK[kind]
+
+        self.turns[g] += 1
+        own = counts[g, cur]
+        won = (own[:, _LANDMARKS] > 0).all(axis=1)
+        self.winners[g[won]] = cur[won]
+        again = doubles & (own[:, _PARK] > 0)
+        self.current[g] = np.where(again, cur, (cur + 1) % n_seats)
+
+    def _roll(self, two):
+        """Draw one or two dice per row; return (totals, doubles)."""
+        dice = self.rng.integers(1, 7, size=(len(two), 2))
+        return dice[:, 0] + two * dice[:, 1], two & (dice[:, 0] == dice[:, 1])
+
+    def _own_income(self, g, cur, own):
+        """Coins by die total on the roller's own turn, as strategy._own_income_vector counts them."""
+        categories = own @ _CATEGORY_ONEHOT
+        pay = np.where(_IS_BLUE | _IS_GREEN, _PAYOUT, 0) * np.where(_FACTORY > 0, categories[:, _FACTORY], 1)
+        pay = pay + (own[:, _MALL] > 0)[:, None] * _MALL_GREEN_BONUS
+        pay[:, _STADIUM] = _PAYOUT[_STADIUM] * (len(self.policies) - 1)
+        richest = self.bank[g, self._richest_opponent(g, cur, np.arange(len(g)))]
+        pay[:, _TV] = np.minimum(_PAYOUT[_TV], richest)
+        return (own * pay) @ _HIT
+
+    @staticmethod
+    def _own_mean(income, own, dice: int):
+        """Mean own-turn income with dice dice, reweighted for Radio Tower as own_turn_pmf does."""
+        die = _DIE[dice]
+        mean = income @ die
+        low = income < mean[:, None]
+        radio = (income * ~low) @ die + (low @ die) * mean
+        return np.where(own[:, _RADIO] > 0, radio, mean)
+
+    def _richest_opponent(self, g, cur, rows):
+        """Seat with the most coins other than the roller; first in seat order on ties."""
+        coins = self.bank[g].astype(float)
+        coins[rows, cur] = -1.0
+        return coins.argmax(axis=1)
+
+    def _business_center(self, game: int, seat: int) -> None:
+        """Swap with the richest opponent as Bot.chooseBusinessCenterSwap would, else take 5 coins."""
+        coins = self.bank[game].astype(float)
+        coins[seat] = -1.0
+        target = int(coins.argmax())
+        theirs = (self.counts[game, target] > 0) & ~_IS_LANDMARK
+        mine = (self.counts[game, seat] > 0) & ~_IS_LANDMARK
+        if not theirs.any() or not mine.any():
+            self.bank[game, seat] += 5
+            return
+        take = int(self.policies[seat].choose(theirs[None], self.counts[game, seat][None], self.rng)[0])
+        give = int(np.flatnonzero(mine)[_GIVE_SCORE[mine].argmin()])
+        self.counts[game, seat, give] -= 1
+        self.counts[game, target, give] += 1
+        self.counts[game, target, take] -= 1
+        self.counts[game, seat, take] += 1
+
+
+def simulate(policies: list[PriorityPolicy], games: int = 10000, seed: int | None = None,
+             max_turns: int = 2000) -> SimulationResult:
+    """Play games independent games of the seated policies in lock-step; return the results."""
+    return LockstepSimulator(policies, games, seed).run(max_turns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lock-step Monte Carlo for priority-list bots")
+    parser.add_argument("--games", type=int, default=10000, metavar="N",
+                        help="number of games to simulate (default: 10000)")
+    parser.add_argument("--seed", type=int, default=None, metavar="N",
+                        help="random seed for reproducible runs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = simulate([PriorityPolicy.fromage(), PriorityPolicy.thoughtful()], args.games, args.seed)
+    elapsed = time.perf_counter() - start
+    for label, rate in result.win_rates.items():
+        print(f"{label:20} {rate:6.1%}")
+    print(f"mean turns {result.turns.mean():.1f}; {args.games / elapsed:.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
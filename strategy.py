@@ -6,7 +6,19 @@
 from __future__ import annotations
 import math
 import statistics
-from harmonictook import Blue, Green, Red, Stadium, TVStation, BusinessCenter, Player, Game, Card, UpgradeCard
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import accumulate
+from harmonictook import (
+    Blue, Green, Red, Stadium, TVStation, BusinessCenter, Player, Game, Card, UpgradeCard, Event,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: the pure-list backend handles every operation
+    np = None
 
 # ---------------------------------------------------------------------------
 # Probability tables
@@ -22,6 +34,245 @@ TWO_DIE_PROB: dict[int, float] = {
 P_DOUBLES: float = 6 / 36
 
 
+# ---------------------------------------------------------------------------
+# PMF container
+# ---------------------------------------------------------------------------
+
+# Below this many multiply-adds, the list loop beats NumPy's call overhead.
+_NUMPY_MIN_WORK: int = 64
+
+# n-fold convolutions with at least this many output bins go through NumPy's FFT.
+_FFT_MIN_SUPPORT: int = 512
+
+# FFT round-off leaves ~1e-17 residue where the exact answer is 0; clear it below this.
+_FFT_NOISE_FLOOR: float = 1e-15
+
+
+class PMF(Mapping):
+    """Dense probability mass function over a contiguous run of integer outcomes.
+
+    probs[i] is P(X = offset + i). Income PMFs are small and nearly contiguous, so a
+    flat list indexed by outcome beats a dict keyed by it. Zero entries inside the run
+    are skipped by the Mapping interface (keys, items, get, in, []), so a PMF reads
+    exactly like the dict[int, float] it replaces.
+
+    Instances are immutable values: nothing may write to probs after construction. That
+    lets the CDF, tail sums and moments be computed once on first use and cached, so a
+    memoized round_pmf answers repeated mean/variance/percentile/tail queries in O(1)
+    or O(log n).
+    """
+
+    __slots__ = ("offset", "probs", "_support", "_cdf", "_tails", "_mean", "_variance")
+
+    def __init__(self, probs: list[float], offset: int = 0) -> None:
+        self.offset = offset
+        self.probs = probs
+        self._support: tuple[int, ...] | None = None
+        self._cdf: list[float] | None = None
+        self._tails: list[float] | None = None
+        self._mean: float | None = None
+        self._variance: float | None = None
+
+    @classmethod
+    def from_dict(cls, pmf: Mapping[int, float]) -> PMF:
+        """Build a dense PMF from any {outcome: probability} mapping."""
+        if isinstance(pmf, PMF):
+            return pmf
+        if not pmf:
+            return cls([], 0)
+        lo, hi = min(pmf), max(pmf)
+        probs = [0.0] * (hi - lo + 1)
+        for x, px in pmf.items():
+            probs[x - lo] += px
+        return cls(probs, lo)
+
+    def to_dict(self) -> dict[int, float]:
+        """Return the sparse {outcome: probability} dict view of this PMF."""
+        return dict(self.items())
+
+    def items(self) -> list[tuple[int, float]]:
+        off = self.offset
+        return [(off + i, px) for i, px in enumerate(self.probs) if px != 0.0]
+
+    def keys(self) -> list[int]:
+        off = self.offset
+        return [off + i for i, px in enumerate(self.probs) if px != 0.0]
+
+    def values(self) -> list[float]:
+        return [px for px in self.probs if px != 0.0]
+
+    def __getitem__(self, x: int) -> float:
+        i = x - self.offset
+        if 0 <= i < len(self.probs) and self.probs[i] != 0.0:
+            return self.probs[i]
+        raise KeyError(x)
+
+    def __contains__(self, x: object) -> bool:
+        if not isinstance(x, int):
+            return False
+        i = x - self.offset
+        return 0 <= i < len(self.probs) and self.probs[i] != 0.0
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return sum(1 for px in self.probs if px != 0.0)
+
+    def __repr__(self) -> str:
+        return f"PMF({self.to_dict()!r})"
+
+    # Cached statistics ------------------------------------------------------
+
+    def support(self) -> tuple[int, ...]:
+        """Outcomes with non-zero probability, ascending."""
+        if self._support is None:
+            self._support = tuple(self.keys())
+        return self._support
+
+    def cdf(self) -> list[float]:
+        """cdf()[i] = P(X <= offset + i), accumulated left to right."""
+        if self._cdf is None:
+            self._cdf = list(accumulate(self.probs))
+        return self._cdf
+
+    def tails(self) -> list[float]:
+        """tails()[i] = P(X >= offset + i), accumulated right to left so small tails stay exact."""
+        if self._tails is None:
+            self._tails = list(accumulate(reversed(self.probs)))[::-1]
+        return self._tails
+
+    def mean(self) -> float:
+        """E[X]."""
+        if self._mean is None:
+            self._mean = sum((x * px for x, px in enumerate(self.probs, self.offset)), 0.0)
+        return self._mean
+
+    def variance(self) -> float:
+        """E[X^2] - E[X]^2; 0.0 for an empty PMF."""
+        if self._variance is None:
+            if not self.probs:
+                self._variance = 0.0
+            else:
+                mu = self.mean()
+                e2 = sum((x * x) * px for x, px in enumerate(self.probs, self.offset))
+                self._variance = e2 - mu * mu
+        return self._variance
+
+    def percentile(self, p: float) -> float:
+        """Smallest outcome x with P(X <= x) >= p, by binary search on the CDF."""
+        support = self.support()
+        if not support:
+            return 0.0
+        if p <= 0.0:
+            return float(support[0])
+        cdf = self.cdf()
+        i = bisect_left(cdf, p)
+        if i >= len(cdf):
+            return float(support[-1])
+        return float(self.offset + i)
+
+    def mass_at_least(self, threshold: int) -> float:
+        """P(X >= threshold)."""
+        i = max(0, threshold - self.offset)
+        tails = self.tails()
+        return tails[i] if i < len(tails) else 0.0
+
+
+def _as_pmf(pmf: Mapping[int, float]) -> PMF:
+    """Return pmf as a PMF, converting dicts through the from_dict adapter."""
+    return pmf if isinstance(pmf, PMF) else PMF.from_dict(pmf)
+
+
+def _convolve_lists(a: list[float], b: list[float]) -> list[float]:
+    """Dense convolution of two probability lists: out[i + j] += a[i] * b[j]."""
+    if not a or not b:
+        return []
+    if np is not None and len(a) * len(b) >= _NUMPY_MIN_WORK:
+        return np.convolve(a, b).tolist()
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, pa in enumerate(a):
+        if pa == 0.0:
+            continue
+        for k, pb in enumerate(b, i):
+            out[k] += pa * pb
+    return out
+
+
+def _saturate(pmf: PMF, cap: int) -> PMF:
+    """Collapse all mass at or above cap into one absorbing bucket at cap.
+
+    Only valid for non-negative outcomes (income), where min(x + y, cap) depends on x and y
+    only through min(x, cap) and min(y, cap) — so saturating after every convolution gives
+    the same bucket masses as saturating once at the end.
+    """
+    cut = cap - pmf.offset
+    if cut >= len(pmf.probs) - 1:
+        return pmf
+    if cut <= 0:
+        return PMF([sum(pmf.probs, 0.0)], cap)
+    return PMF(pmf.probs[:cut] + [sum(pmf.probs[cut:], 0.0)], pmf.offset)
+
+
+def _convolve_power(pmf: Mapping[int, float], n: int, cap: int | None = None) -> PMF:
+    """Return the n-fold self-convolution of pmf: the PMF of a sum of n independent draws.
+
+    Uses exponentiation by squaring, so n draws cost O(log n) convolutions instead of n.
+    When NumPy is available and the result spans _FFT_MIN_SUPPORT bins or more, the
+    whole power is taken in one FFT pass (transform, raise to the n-th power, invert).
+    n <= 0 returns the point mass at 0.
+
+    With cap set, every intermediate sum is saturated at cap (see _saturate), so support
+    never exceeds cap + 1 bins however large n grows; P(sum >= cap) is the top bucket.
+    """
+    pmf = _as_pmf(pmf)
+    if n <= 0 or not pmf.probs:
+        return PMF([1.0], 0)
+    if cap is not None:
+        pmf = _saturate(pmf, cap)
+    size = (len(pmf.probs) - 1) * n + 1
+    if cap is None and np is not None and size >= _FFT_MIN_SUPPORT:
+        spectrum = np.fft.rfft(pmf.probs, size)
+        probs = np.fft.irfft(spectrum ** n, size)
+        probs[probs < _FFT_NOISE_FLOOR] = 0.0
+        return PMF(probs.tolist(), pmf.offset * n)
+    result: PMF | None = None
+    square = pmf
+    while True:
+        if n & 1:
+            result = square if result is None else _convolve(result, square, cap)
+        n >>= 1
+        if not n:
+            return result
+        square = _convolve(square, square, cap)
+
+
+def _mix(a: PMF, wa: float, b: PMF, wb: float) -> PMF:
+    """Return the mixture wa*a + wb*b as a PMF spanning both supports."""
+    if not a.probs:
+        return PMF([wb * px for px in b.probs], b.offset)
+    if not b.probs:
+        return PMF([wa * px for px in a.probs], a.offset)
+    lo = min(a.offset, b.offset)
+    hi = max(a.offset + len(a.probs), b.offset + len(b.probs))
+    probs = [0.0] * (hi - lo)
+    for i, px in enumerate(a.probs, a.offset - lo):
+        probs[i] += wa * px
+    for i, px in enumerate(b.probs, b.offset - lo):
+        probs[i] += wb * px
+    return PMF(probs, lo)
+
+
+def _pmf_from_rolls(die_pmf: dict[int, float], income_of) -> PMF:
+    """Bucket die outcomes into an income PMF: P(income = income_of(roll))."""
+    incomes = [income_of(roll) for roll in die_pmf]
+    lo = min(incomes)
+    probs = [0.0] * (max(incomes) - lo + 1)
+    for x, prob in zip(incomes, die_pmf.values()):
+        probs[x - lo] += prob
+    return PMF(probs, lo)
+
+
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
@@ -54,13 +305,30 @@ def _own_turn_coverage(player: Player, num_dice: int) -> float:
 
     Die values where multiple cards overlap are counted once (coverage, not income count).
     """
+    return _mask_prob(_deck_masks(player)[0], num_dice)
+
+
+def _mask_prob(mask: int, num_dice: int) -> float:
+    """Probability that a roll of num_dice dice lands on a die value whose bit is set in mask."""
     prob_table = ONE_DIE_PROB if num_dice == 1 else TWO_DIE_PROB
-    own_turn_cards = [c for c in player.deck.deck if not isinstance(c, (Red, UpgradeCard))]
-    return sum(
-        prob
-        for die_value, prob in prob_table.items()
-        if any(die_value in card.hitsOn for card in own_turn_cards)
-    )
+    return sum((prob for die_value, prob in prob_table.items() if mask >> die_value & 1), 0.0)
+
+
+def _deck_masks(player: Player) -> tuple[int, int]:
+    """(own_turn, opponent_turn) trigger masks for player's deck; see PlayerDeck.trigger_masks."""
+    return player.deck.trigger_masks()
+
+
+def _card_mask_for(card: Card, owner: Player, roller: Player) -> int:
+    """Die values on which card fires when roller rolls, as a bitmask (0 if it can't fire)."""
+    if isinstance(card, UpgradeCard):
+        return 0
+    if isinstance(card, Blue):
+        return card.hits_mask
+    if isinstance(card, Red):
+        return card.hits_mask if roller is not owner else 0
+    # Green, Stadium, TVStation, BusinessCenter: owner's roll only
+    return card.hits_mask if roller is owner else 0
 
 
 def _die_pmf(n_dice: int) -> dict[int, float]:
@@ -73,23 +341,23 @@ def _die_pmf(n_dice: int) -> dict[int, float]:
     if n_dice == 2:
         return dict(TWO_DIE_PROB)
     # 3+ dice: convolve repeatedly
-    acc = _die_pmf(1)
+    acc = _as_pmf(ONE_DIE_PROB)
     for _ in range(n_dice - 1):
         acc = _convolve(acc, ONE_DIE_PROB)
-    return acc
+    return acc.to_dict()
 
 
-def _convolve(a: dict[int, float], b: dict[int, float]) -> dict[int, float]:
+def _convolve(a: Mapping[int, float], b: Mapping[int, float], cap: int | None = None) -> PMF:
     """Combine two independent PMFs by summing their outcomes.
 
-    result[x + y] += a[x] * b[y] for all (x, y) pairs.
+    result[x + y] += a[x] * b[y] for all (x, y) pairs. Accepts PMFs or plain dicts.
+    With cap set (non-negative outcomes only), mass at or above cap lands in one bucket.
     """
-    out: dict[int, float] = {}
-    for x, px in a.items():
-        for y, py in b.items():
-            k = x + y
-            out[k] = out.get(k, 0.0) + px * py
-    return out
+    a, b = _as_pmf(a), _as_pmf(b)
+    if cap is None:
+        return PMF(_convolve_lists(a.probs, b.probs), a.offset + b.offset)
+    a, b = _saturate(a, cap), _saturate(b, cap)
+    return _saturate(PMF(_convolve_lists(a.probs, b.probs), a.offset + b.offset), cap)
 
 
 def _own_turn_income(player: Player, players: list[Player], roll: int) -> int:
@@ -97,29 +365,173 @@ def _own_turn_income(player: Player, players: list[Player], roll: int) -> int:
 
     Blue, Green, Stadium, TVStation only. Business Center is 0 (swap, not coins).
     """
-    total = 0
+    if not 0 <= roll < _ROLL_SLOTS:
+        return 0
+    return _own_income_vector(player, players)[roll]
+
+
+# ---------------------------------------------------------------------------
+# Income vectors
+# ---------------------------------------------------------------------------
+#
+# Expected income is linear in what each card pays on each die total, so mean-only
+# questions (delta_ev, portfolio_ev) don't need the round PMF. An income vector holds
+# coins by die total (index 0-12) for one turn; IncomeVectors holds one for the player's
+# own turn and one per opponent's turn. Buying a card adds its vectors, and the round
+# mean is one dot product per turn with that roller's die PMF — no convolutions.
+#
+# Radio Tower and Amusement Park stay exact: the own-turn mean goes through the same
+# bucketing and reroll reweighting as own_turn_pmf, and the Amusement Park blend has
+# mean E*(1+P_D), which is linear.
+
+_ROLL_SLOTS = 13  # die totals 0..12; sentinel hits (e.g. 99) never fire
+
+
+@dataclass
+class IncomeVectors:
+    """Coins by die total for one player: own turn, then each opponent's turn in seat order."""
+    own: list[int]
+    opponents: list[list[int]]
+
+    def __add__(self, other: "IncomeVectors") -> "IncomeVectors":
+        return IncomeVectors(
+            own=[a + b for a, b in zip(self.own, other.own)],
+            opponents=[[a + b for a, b in zip(x, y)] for x, y in zip(self.opponents, other.opponents)],
+        )
+
+
+def _add_on_hits(vec: list[int], card: Card, amount: int) -> None:
+    """Add amount to vec at every die total card fires on."""
+    if amount:
+        for roll in card.hitsOn:
+            if 0 <= roll < _ROLL_SLOTS:
+                vec[roll] += amount
+
+
+def _own_card_payout(card: Card, player: Player, players: list[Player], counts: Counter) -> int:
+    """Coins card pays player when it fires on player's own turn; counts maps category -> cards."""
+    if isinstance(card, Blue):
+        return card.payout
+    if isinstance(card, Green):
+        if getattr(card, "multiplies", None) is not None:
+            return card.payout * counts[card.multiplies]
+        if player.hasShoppingMall and card.name == "Convenience Store":
+            return card.payout + 1
+        return card.payout
+    if isinstance(card, Stadium):
+        return card.payout * (len(players) - 1)
+    if isinstance(card, TVStation):
+        opponents = [p for p in players if p is not player]
+        return min(5, max(p.bank for p in opponents)) if opponents else 0
+    return 0
+
+
+def _opponent_card_payout(card: Card, roller: Player) -> int:
+    """Coins card pays its owner when it fires on roller's turn: Blues + Reds (steal from roller)."""
+    if isinstance(card, Blue):
+        return card.payout
+    if isinstance(card, Red):
+        return min(card.payout, roller.bank)
+    return 0
+
+
+def _category_counts(player: Player) -> Counter:
+    """Number of cards in player's deck per category."""
+    return Counter(getattr(c, "category", None) for c in player.deck.deck)
+
+
+def _own_income_vector(player: Player, players: list[Player]) -> list[int]:
+    """Coins player earns on their own turn, indexed by die total."""
+    vec = [0] * _ROLL_SLOTS
+    counts = _category_counts(player)
     for card in player.deck.deck:
-        if roll not in card.hitsOn:
-            continue
-        if isinstance(card, Blue):
-            total += card.payout
-        elif isinstance(card, Green):
-            if getattr(card, "multiplies", None) is not None:
-                total += card.payout * _count_category(player, card.multiplies)
-            else:
-                payout = card.payout
-                if player.hasShoppingMall and card.name == "Convenience Store":
-                    payout += 1
-                total += payout
-        elif isinstance(card, Stadium):
-            total += card.payout * (len(players) - 1)
-        elif isinstance(card, TVStation):
-            opponents = [p for p in players if p is not player]
-            if opponents:
-                total += min(5, max(p.bank for p in opponents))
+        _add_on_hits(vec, card, _own_card_payout(card, player, players, counts))
+    return vec
+
+
+def _opponent_income_vector(observer: Player, roller: Player) -> list[int]:
+    """Coins observer earns on roller's turn, indexed by die total."""
+    vec = [0] * _ROLL_SLOTS
+    for card in observer.deck.deck:
+        _add_on_hits(vec, card, _opponent_card_payout(card, roller))
+    return vec
+
+
+def income_vectors(player: Player, players: list[Player]) -> IncomeVectors:
+    """Return player's per-roll income on their own turn and on each opponent's turn."""
+    return IncomeVectors(
+        own=_own_income_vector(player, players),
+        opponents=[_opponent_income_vector(player, p) for p in players if p is not player],
+    )
+
+
+def card_income_vectors(card: Card, player: Player, players: list[Player]) -> IncomeVectors:
+    """Return the change in player's income vectors if card were added to their deck.
+
+    Includes the card's own payout and the extra coin from every factory already in the
+    deck that multiplies the card's category. Upgrades and Business Center add nothing
+    (their value comes from flags or swaps, not per-roll coins).
+    """
+    return _card_income_vectors(card, player, players, _category_counts(player), _factories(player))
+
+
+def _factories(player: Player) -> list[Card]:
+    """Green cards in player's deck that pay per card of another category."""
+    return [c for c in player.deck.deck
+            if isinstance(c, Green) and getattr(c, "multiplies", None) is not None]
+
+
+def _card_income_vectors(
+    card: Card, player: Player, players: list[Player], counts: Counter, factories: list[Card]
+) -> IncomeVectors:
+    """card_income_vectors with the deck's category counts and factories precomputed."""
+    marginal = IncomeVectors(
+        own=[0] * _ROLL_SLOTS,
+        opponents=[[0] * _ROLL_SLOTS for p in players if p is not player],
+    )
+    if isinstance(card, (UpgradeCard, BusinessCenter)):
+        return marginal
+    category = getattr(card, "category", None)
+    counts = counts.copy()
+    counts[category] += 1
+    _add_on_hits(marginal.own, card, _own_card_payout(card, player, players, counts))
+    for factory in factories:
+        if factory.multiplies == category:
+            _add_on_hits(marginal.own, factory, factory.payout)
+    rollers = [p for p in players if p is not player]
+    for vec, roller in zip(marginal.opponents, rollers):
+        _add_on_hits(vec, card, _opponent_card_payout(card, roller))
+    return marginal
+
+
+def expected_round_income(vectors: IncomeVectors, player: Player, players: list[Player]) -> float:
+    """Expected income for player over one round, given their income vectors.
+
+    Equals pmf_mean(round_pmf(player, players)) when vectors is income_vectors(player,
+    players), up to float rounding, without building any convolutions.
+    """
+    base = _pmf_from_rolls(_die_pmf(_num_dice(player)), vectors.own.__getitem__)
+    if getattr(player, "hasRadioTower", False):
+        base = _apply_radio_tower(base)
+    total = pmf_mean(base) * _bonus_turn_factor(player)
+    rollers = [p for p in players if p is not player]
+    for vec, roller in zip(vectors.opponents, rollers):
+        die_pmf = _die_pmf(_num_dice(roller))
+        mean = sum((prob * vec[roll] for roll, prob in die_pmf.items() if roll < _ROLL_SLOTS), 0.0)
+        total += mean * _bonus_turn_factor(roller)
     return total
 
 
+def _bonus_turn_factor(player: Player) -> float:
+    """Mean multiplier of the Amusement Park blend: 1 + P_D with the park, else 1."""
+    return 1.0 + P_DOUBLES if getattr(player, "hasAmusementPark", False) else 1.0
+
+
+def _mean_round_income(player: Player, players: list[Player]) -> float:
+    """Expected income for player over one round from their current deck and flags."""
+    return expected_round_income(income_vectors(player, players), player, players)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -144,39 +556,78 @@ def _ev_businesscenter(card: BusinessCenter, owner: Player, players: list[Player
 
     Give and take must be from the same opponent. Net = best_take_gain - give_loss.
     BusinessCenter cards are excluded from both sides to prevent recursive EV calls.
+    The search itself lives in SwapValuer.
     """
-    opponents = [p for p in players if p is not owner]
-    if not opponents:
-        return 0.0
+    best = SwapValuer(owner, players).best()
+    best_net = best.net if best is not None else 0.0
+    return best_net * p_hits([6], _num_dice(owner)) * _turn_multiplier(owner) * N
 
-    own_cards = [c for c in owner.deck.deck
-                 if not isinstance(c, (UpgradeCard, BusinessCenter))]
-    if not own_cards:
-        return 0.0
 
-    best_net = 0.0
+@dataclass
+class BusinessCenterSwap:
+    """A Business Center swap: give one card to target, take one back; net is the owner's EV gain per round."""
+    target: Player
+    give: Card
+    take: Card
+    net: float
 
-    for target in opponents:
-        target_cards = [c for c in target.deck.deck
-                        if not isinstance(c, (UpgradeCard, BusinessCenter))]
-        if not target_cards:
-            continue
 
-        # Best card to take: maximises delta_ev to owner (factory synergies included)
-        best_gain = max(delta_ev(c, owner, players, 1) for c in target_cards)
+def _swappable(cards: list[Card]) -> list[Card]:
+    return [c for c in cards if not isinstance(c, (UpgradeCard, BusinessCenter))]
 
-        # Best card to give: bottom-4 own cards by marginal EV, then least valuable to target
-        own_by_ev = sorted(own_cards, key=lambda c: delta_ev(c, owner, players, 1))
-        bottom_4 = own_by_ev[:4]
-        best_give = min(bottom_4, key=lambda c: delta_ev(c, target, players, 1))
-        give_loss = delta_ev(best_give, owner, players, 1)
 
-        net = best_gain - give_loss
-        if net > best_net:
-            best_net = net
+class SwapValuer:
+    """Business Center swap search for one decision by owner.
 
-    return best_net * p_hits([6], _num_dice(owner)) * _turn_multiplier(owner) * N
+    The owner's own card values (and so the bottom-4 give pool) are computed once, and
+    the value of each card to the owner is memoized on _card_key, so checking several
+    opponents costs one batched delta_ev pass per opponent for the spite filter plus
+    one per previously unseen take candidate.
+    """
 
+    def __init__(self, owner: Player, players: list[Player], own_cards: list[Card] | None = None) -> None:
+        self.owner = owner
+        self.players = players
+        cards = _swappable(owner.deck.deck if own_cards is None else own_cards)
+        values = _delta_evs(cards, owner, players, 1)
+        # Bottom-4 own cards by marginal EV (stable, so ties keep deck order)
+        order = sorted(range(len(cards)), key=values.__getitem__)[:4]
+        self._give_pool = [cards[i] for i in order]
+        self._give_loss = [values[i] for i in order]
+        self._gain_by_key: dict[tuple, float] = {}
+
+    def _gains(self, cards: list[Card]) -> list[float]:
+        """delta_ev of each card to the owner, batching the ones not seen yet."""
+        keys = [_card_key(c) for c in cards]
+        fresh = {k: c for k, c in zip(keys, cards) if k not in self._gain_by_key}
+        if fresh:
+            values = _delta_evs(list(fresh.values()), self.owner, self.players, 1)
+            self._gain_by_key.update(zip(fresh, values))
+        return [self._gain_by_key[k] for k in keys]
+
+    def best_for(self, target: Player, their_cards: list[Card] | None = None) -> BusinessCenterSwap | None:
+        """Best swap against target, or None when either side has nothing swappable."""
+        take_pool = _swappable(target.deck.deck if their_cards is None else their_cards)
+        if not self._give_pool or not take_pool:
+            return None
+        gains = self._gains(take_pool)
+        best_gain = max(gains)
+        take = take_pool[gains.index(best_gain)]
+        # Spite filter: of the bottom 4, give the card worth least to the target
+        to_target = _delta_evs(self._give_pool, target, self.players, 1)
+        i = to_target.index(min(to_target))
+        return BusinessCenterSwap(target, self._give_pool[i], take, best_gain - self._give_loss[i])
+
+    def best(self) -> BusinessCenterSwap | None:
+        """Best swap with positive net over all opponents (first in seat order on ties), or None."""
+        best: BusinessCenterSwap | None = None
+        for target in self.players:
+            if target is self.owner:
+                continue
+            choice = self.best_for(target)
+            if choice is not None and choice.net > (best.net if best is not None else 0.0):
+                best = choice
+        return best
 
 
 def _train_station_gain(
@@ -204,9 +655,9 @@ def _train_station_gain(
     old_ts = player.hasTrainStation
     try:
         player.hasTrainStation = False
-        evs_1die = [delta_ev(c, player, players, 1) for c in one_die_cards]
+        evs_1die = _delta_evs(one_die_cards, player, players, 1)
         player.hasTrainStation = True
-        evs_2die = [delta_ev(c, player, players, 1) for c in two_die_cards]
+        evs_2die = _delta_evs(two_die_cards, player, players, 1)
     finally:
         player.hasTrainStation = old_ts
 
@@ -221,13 +672,13 @@ def _train_station_gain(
 
 
 def portfolio_ev(player: Player, players: list[Player], N: int = 1) -> float:
-    """Return expected total income over N rounds, derived from round_pmf.
+    """Return expected total income over N rounds: N * pmf_mean(round_pmf), via income vectors.
 
     Note: Amusement Park uses the PMF one-bonus-turn approximation (mean = E*(1+P_D)),
     which differs slightly from the geometric-series formula (E/(1-P_D)) used in older
     per-card EV calculations. The PMF value is the canonical one.
     """
-    return N * pmf_mean(round_pmf(player, players))
+    return N * _mean_round_income(player, players)
 
 
 def coverage_value(card: Card, owner: Player, players: list[Player]) -> float:
@@ -249,15 +700,16 @@ def coverage_value(card: Card, owner: Player, players: list[Player]) -> float:
     """
     if isinstance(card, UpgradeCard):
         return 0.0
+    mask = card.hits_mask
     if isinstance(card, Blue):
-        return sum(p_hits(card.hitsOn, _num_dice(p)) * _turn_multiplier(p) for p in players)
+        return sum(_mask_prob(mask, _num_dice(p)) * _turn_multiplier(p) for p in players)
     if isinstance(card, Red):
         return sum(
-            p_hits(card.hitsOn, _num_dice(p)) * _turn_multiplier(p)
+            _mask_prob(mask, _num_dice(p)) * _turn_multiplier(p)
             for p in players if p is not owner
         )
     # Green, Stadium, TVStation, BusinessCenter: fires only on the owner's roll
-    return p_hits(card.hitsOn, _num_dice(owner)) * _turn_multiplier(owner)
+    return _mask_prob(mask, _num_dice(owner)) * _turn_multiplier(owner)
 
 
 def portfolio_coverage(player: Player, players: list[Player]) -> float:
@@ -267,19 +719,13 @@ def portfolio_coverage(player: Player, players: list[Player]) -> float:
 
 def _card_fires_on(card: Card, owner: Player, roller: Player, die_value: int) -> bool:
     """Return True if card fires when roller rolls die_value."""
-    if isinstance(card, UpgradeCard) or die_value not in card.hitsOn:
-        return False
-    if isinstance(card, Blue):
-        return True
-    if isinstance(card, Red):
-        return roller is not owner
-    # Green, Stadium, TVStation, BusinessCenter: owner's roll only
-    return roller is owner
+    return _card_mask_for(card, owner, roller) >> die_value & 1 == 1
 
 
 def _deck_fires_on(owner: Player, roller: Player, die_value: int) -> bool:
     """Return True if any card in owner's deck fires when roller rolls die_value."""
-    return any(_card_fires_on(c, owner, roller, die_value) for c in owner.deck.deck)
+    own, opponent = _deck_masks(owner)
+    return (own if roller is owner else opponent) >> die_value & 1 == 1
 
 
 def delta_coverage(card: Card, owner: Player, players: list[Player]) -> float:
@@ -307,55 +753,98 @@ def delta_coverage(card: Card, owner: Player, players: list[Player]) -> float:
             cov = _own_turn_coverage(owner, _num_dice(owner))
             return P_DOUBLES * cov
         return 0.0  # Shopping Mall: pure payout multiplier, no coverage effect
+    own, opponent = _deck_masks(owner)
     total = 0.0
     for roller in players:
-        prob_table = ONE_DIE_PROB if _num_dice(roller) == 1 else TWO_DIE_PROB
-        turn_mult = _turn_multiplier(roller)
-        for die_value, prob in prob_table.items():
-            if _card_fires_on(card, owner, roller, die_value) and not _deck_fires_on(owner, roller, die_value):
-                total += prob * turn_mult
+        covered = own if roller is owner else opponent
+        new = _card_mask_for(card, owner, roller) & ~covered
+        if new:
+            total += _mask_prob(new, _num_dice(roller)) * _turn_multiplier(roller)
     return total
 
 
 def delta_ev(
     card: Card, player: Player, players: list[Player],
-    N: int = 1, market_cards: list[Card] | None = None
+    N: int = 1, market_cards: list[Card] | None = None,
+    context: StrategyContext | None = None,
 ) -> float:
     """Return the marginal EV gain from adding card to player's deck.
 
-    For income cards (Blue, Green, Red, Purple): temporarily appends card to the deck,
-    diffs pmf_mean(round_pmf), then pops it back off. Factory synergies and Shopping Mall
-    bonuses are captured automatically because round_pmf sees the full deck.
-    Uses pop() rather than remove() to avoid Card.__eq__ ambiguity on duplicate sortvalues.
+    For income cards (Blue, Green, Red, Purple): adds card_income_vectors to the player's
+    income_vectors and diffs expected_round_income — the mean of round_pmf without the
+    convolutions. Factory synergies and Shopping Mall bonuses are part of the card's
+    marginal vectors. The deck is not modified.
 
-    For UpgradeCards: temporarily sets the attribute flag, diffs pmf_mean(round_pmf),
+    For UpgradeCards: temporarily sets the attribute flag, diffs the round mean,
     restores via finally. Train Station with market_cards uses the forward-looking
-    _train_station_gain heuristic (PMF diff undervalues it on a deck with no 2-die cards yet).
+    _train_station_gain heuristic (the mean diff undervalues it on a deck with no 2-die
+    cards yet).
 
     BusinessCenter is dispatched to _ev_businesscenter (swap value, not coin income).
+    context (a StrategyContext for this table) lets baselines come from its cache.
     """
-    if isinstance(card, BusinessCenter):
-        return _ev_businesscenter(card, player, players, N)
-    if isinstance(card, UpgradeCard):
-        if card.name == "Train Station" and market_cards is not None:
-            return _train_station_gain(player, players, market_cards, N)
-        attr = UpgradeCard.orangeCards[card.name][2]
+    return _delta_evs([card], player, players, N, market_cards, context)[0]
+
+
+def _delta_evs(
+    cards: list[Card], player: Player, players: list[Player],
+    N: int = 1, market_cards: list[Card] | None = None,
+    context: StrategyContext | None = None,
+) -> list[float]:
+    """Return [delta_ev(card, player, players, N, market_cards) for card in cards] in one pass.
+
+    The baselines are built once per call rather than once per card: income cards share
+    the player's income vectors, baseline mean, category counts and factory list (each
+    candidate is one row of marginal vectors on top), and upgrades share one round mean
+    per landmark-flag setting. Arithmetic per card is unchanged, so results are identical.
+    With a context serving this table, the baselines come from (and stay in) its cache.
+    """
+    if context is not None and not context.serves(players):
+        context = None
+    base: IncomeVectors | None = None
+    without_ev = 0.0
+    counts: Counter = Counter()
+    factories: list[Card] = []
+    flag_means: dict[tuple, float] = {}
+
+    def mean_with(attr: str, value: bool) -> float:
         old_val = getattr(player, attr, False)
         try:
-            setattr(player, attr, False)
-            without_ev = pmf_mean(round_pmf(player, players))
-            setattr(player, attr, True)
-            with_ev = pmf_mean(round_pmf(player, players))
+            setattr(player, attr, value)
+            key = tuple(getattr(player, a, False) for _, _, a in UpgradeCard.orangeCards.values())
+            if key not in flag_means:
+                flag_means[key] = (context.mean_round_income(player) if context is not None
+                                   else _mean_round_income(player, players))
+            return flag_means[key]
         finally:
             setattr(player, attr, old_val)
-        return N * (with_ev - without_ev)
-    without_ev = pmf_mean(round_pmf(player, players))
-    player.deck.deck.append(card)
-    try:
-        with_ev = pmf_mean(round_pmf(player, players))
-    finally:
-        player.deck.deck.pop()
-    return N * (with_ev - without_ev)
+
+    results = []
+    for card in cards:
+        if isinstance(card, BusinessCenter):
+            results.append(_ev_businesscenter(card, player, players, N))
+        elif isinstance(card, UpgradeCard):
+            if card.name == "Train Station" and market_cards is not None:
+                results.append(_train_station_gain(player, players, market_cards, N))
+                continue
+            attr = UpgradeCard.orangeCards[card.name][2]
+            without_flag = mean_with(attr, False)
+            results.append(N * (mean_with(attr, True) - without_flag))
+        else:
+            if base is None:
+                if context is not None:
+                    base = context.income_vectors(player)
+                    without_ev = context.mean_round_income(player)
+                    counts = context.category_counts(player)
+                else:
+                    base = income_vectors(player, players)
+                    without_ev = expected_round_income(base, player, players)
+                    counts = _category_counts(player)
+                factories = _factories(player)
+            marginal = _card_income_vectors(card, player, players, counts, factories)
+            with_ev = expected_round_income(base + marginal, player, players)
+            results.append(N * (with_ev - without_ev))
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -372,7 +861,121 @@ def delta_ev(
 #     assuming the mean path.
 
 
-def _apply_amusement_park(base: dict[int, float]) -> dict[int, float]:
+# ---------------------------------------------------------------------------
+# PMF cache
+# ---------------------------------------------------------------------------
+#
+# round_pmf and its parts depend only on a handful of facts about the table: what cards
+# each deck holds, the landmark flags, the player count, and — only where a card can
+# take coins — how much an opponent can be made to pay. Each builder reduces its inputs
+# to a hashable signature of exactly those facts and memoizes on it, so the repeated
+# queries bots make within a turn (and finish_score at game end) are dict lookups.
+# Cached PMFs are shared between callers and must never be mutated.
+
+_PMF_CACHE_SIZE: int = 4096
+
+
+@dataclass
+class PMFCacheInfo:
+    """Counters for the round/own/opponent PMF cache (mirrors functools' cache_info)."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """Bounded mapping that evicts the least recently used entry and counts hits/misses."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        """Return the cached value (marking it most recent), or None on a miss."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        """Store value under key, evicting the oldest entry if over capacity."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_pmf_cache = _LRUCache(_PMF_CACHE_SIZE)
+
+
+def pmf_cache_info() -> PMFCacheInfo:
+    """Return hit/miss counters and occupancy for the PMF cache."""
+    return PMFCacheInfo(_pmf_cache.hits, _pmf_cache.misses, _pmf_cache.maxsize, len(_pmf_cache))
+
+
+def clear_pmf_cache() -> None:
+    """Empty the PMF cache and reset its counters."""
+    _pmf_cache.clear()
+
+
+def _card_key(card: Card) -> tuple:
+    """Hashable identity of a card's rules: its type and its interned CardSpec.
+
+    Keyed on the full spec rather than name alone so that custom cards sharing a name
+    with a standard card (common in tests and experiments) never collide.
+    """
+    return type(card).__name__, card.spec
+
+
+def _deck_signature(player: Player) -> tuple[frozenset, bool, int]:
+    """Return (card multiset, owns a TV Station, largest Red payout) for player's deck."""
+    counts: Counter = Counter()
+    has_tv = False
+    max_red = 0
+    for card in player.deck.deck:
+        counts[_card_key(card)] += 1
+        if isinstance(card, TVStation):
+            has_tv = True
+        elif isinstance(card, Red) and card.payout > max_red:
+            max_red = card.payout
+    return frozenset(counts.items()), has_tv, max_red
+
+
+def _own_turn_signature(player: Player, players: list[Player], deck_sig: tuple) -> tuple:
+    """Everything own_turn_pmf reads: deck, landmarks, table size, and TV Station's take."""
+    cards, has_tv, _ = deck_sig
+    tv_take = None
+    if has_tv:
+        opponent_banks = [p.bank for p in players if p is not player]
+        tv_take = min(5, max(opponent_banks)) if opponent_banks else None
+    return (
+        cards, player.hasTrainStation, player.hasShoppingMall,
+        player.hasAmusementPark, player.hasRadioTower, len(players), tv_take,
+    )
+
+
+def _opponent_turn_signature(roller: Player, deck_sig: tuple) -> tuple:
+    """Everything opponent_turn_pmf reads: observer's deck, roller's dice, roller's stealable bank."""
+    cards, _, max_red = deck_sig
+    return (cards, roller.hasTrainStation, roller.hasAmusementPark, min(roller.bank, max_red))
+
+
+def _apply_amusement_park(base: PMF) -> PMF:
     """Blend a PMF with its 2-turn convolution weighted by P_DOUBLES.
 
     Models the Amusement Park bonus turn: with probability P_DOUBLES the player
@@ -381,33 +984,44 @@ def _apply_amusement_park(base: dict[int, float]) -> dict[int, float]:
     geometric-series value E/(1-P_D).
     """
     two_turns = _convolve(base, base)
-    combined: dict[int, float] = {}
-    for k in set(base) | set(two_turns):
-        combined[k] = (1.0 - P_DOUBLES) * base.get(k, 0.0) + P_DOUBLES * two_turns.get(k, 0.0)
-    return combined
+    return _mix(base, 1.0 - P_DOUBLES, two_turns, P_DOUBLES)
+
+
+def _apply_radio_tower(base: PMF) -> PMF:
+    """Reweight an own-turn PMF for the optimal Radio Tower policy: reroll if income < E_own.
+
+    P(final=x) = P(x) * (I(x >= mu) + P_reroll), where P_reroll = sum of P(x) for x < mu.
+    """
+    mu = pmf_mean(base)
+    p_reroll = sum(px for x, px in base.items() if x < mu)
+    return PMF(
+        [px * ((1.0 if x >= mu else 0.0) + p_reroll) for x, px in enumerate(base.probs, base.offset)],
+        base.offset,
+    )
 
 
-def own_turn_pmf(player: Player, players: list[Player]) -> dict[int, float]:
+def own_turn_pmf(player: Player, players: list[Player]) -> PMF:
     """Income distribution (PMF) for player on their own turn.
 
-    Returns dict[int, float]: income in coins -> probability. Fires: Blue, Green,
+    Returns a PMF: income in coins -> probability. Fires: Blue, Green,
     Stadium, TVStation (Business Center contributes 0 coins). Applies: Radio Tower
     reroll on 0 income; Amusement Park bonus-turn as extra draw from same distribution.
-    Train Station: player rolls 2 dice if owned.
+    Train Station: player rolls 2 dice if owned. Memoized on _own_turn_signature.
     """
-    n_dice = _num_dice(player)
-    die_pmf = _die_pmf(n_dice)
-    base: dict[int, float] = {}
-    for roll, prob in die_pmf.items():
-        income = _own_turn_income(player, players, roll)
-        base[income] = base.get(income, 0.0) + prob
-
-    # Optimal Radio Tower strategy: reroll if income < E_own.
-    # P(final=x) = P(x) * (I(x >= mu) + P_reroll), where P_reroll = sum of P(x) for x < mu.
+    key = ("own", _own_turn_signature(player, players, _deck_signature(player)))
+    pmf = _pmf_cache.get(key)
+    if pmf is None:
+        pmf = _build_own_turn_pmf(player, players)
+        _pmf_cache.put(key, pmf)
+    return pmf
+
+
+def _build_own_turn_pmf(player: Player, players: list[Player]) -> PMF:
+    """Uncached body of own_turn_pmf."""
+    die_pmf = _die_pmf(_num_dice(player))
+    base = _pmf_from_rolls(die_pmf, _own_income_vector(player, players).__getitem__)
     if getattr(player, "hasRadioTower", False):
-        mu = pmf_mean(base)
-        p_reroll = sum(px for x, px in base.items() if x < mu)
-        base = {x: px * ((1.0 if x >= mu else 0.0) + p_reroll) for x, px in base.items()}
+        base = _apply_radio_tower(base)
 
     # Amusement Park: (1-P_D)*base + P_D*convolve(base,base) → mean = E*(1+P_D).
     # Note: portfolio_ev uses the geometric-series multiplier 1/(1-P_D), so
@@ -420,100 +1034,95 @@ def own_turn_pmf(player: Player, players: list[Player]) -> dict[int, float]:
 
 def _opponent_turn_income(observer: Player, roller: Player, roll: int) -> int:
     """Coin income for observer when roller rolls roll: Blues + Reds (steal from roller)."""
-    total = 0
-    for card in observer.deck.deck:
-        if roll not in card.hitsOn:
-            continue
-        if isinstance(card, Blue):
-            total += card.payout
-        elif isinstance(card, Red):
-            total += min(card.payout, roller.bank)
-    return total
+    if not 0 <= roll < _ROLL_SLOTS:
+        return 0
+    return _opponent_income_vector(observer, roller)[roll]
 
 
 def opponent_turn_pmf(
     observer: Player, roller: Player, players: list[Player]
-) -> dict[int, float]:
+) -> PMF:
     """PMF of income for observer when roller takes their turn.
 
     Fires: observer's Blue (all rolls), observer's Red (roller's turn only).
     Does not fire: Green, Purple, or observer's Radio Tower (roller's choice).
     Amusement Park on roller: same one-bonus-turn approximation as own_turn_pmf.
+    Memoized on _opponent_turn_signature.
     """
+    key = ("opp", _opponent_turn_signature(roller, _deck_signature(observer)))
+    pmf = _pmf_cache.get(key)
+    if pmf is None:
+        pmf = _build_opponent_turn_pmf(observer, roller)
+        _pmf_cache.put(key, pmf)
+    return pmf
+
+
+def _build_opponent_turn_pmf(observer: Player, roller: Player) -> PMF:
+    """Uncached body of opponent_turn_pmf."""
     die_pmf = _die_pmf(_num_dice(roller))
-    base: dict[int, float] = {}
-    for roll, prob in die_pmf.items():
-        income = _opponent_turn_income(observer, roller, roll)
-        base[income] = base.get(income, 0.0) + prob
+    base = _pmf_from_rolls(die_pmf, _opponent_income_vector(observer, roller).__getitem__)
     if getattr(roller, "hasAmusementPark", False):
         return _apply_amusement_park(base)
     return base
 
 
-def round_pmf(player: Player, players: list[Player]) -> dict[int, float]:
+def round_pmf(player: Player, players: list[Player]) -> PMF:
     """PMF of net income for player over one full round (own turn + all opponents' turns).
 
     Convolution of own_turn_pmf with opponent_turn_pmf for each opponent. All income
     values are non-negative. This is the building block for ERUV, percentile TUV,
-    and confidence intervals (e.g. P(victory within N rounds)).
+    and confidence intervals (e.g. P(victory within N rounds)). Memoized on the own-turn
+    signature plus one opponent-turn signature per opponent, in seat order.
     """
+    deck_sig = _deck_signature(player)
+    key = ("round", _own_turn_signature(player, players, deck_sig)) + tuple(
+        _opponent_turn_signature(p, deck_sig) for p in players if p is not player
+    )
+    acc = _pmf_cache.get(key)
+    if acc is not None:
+        return acc
     acc = own_turn_pmf(player, players)
     for p in players:
         if p is player:
             continue
         opp_pmf = opponent_turn_pmf(player, p, players)
         acc = _convolve(acc, opp_pmf)
+    _pmf_cache.put(key, acc)
     return acc
 
 
-def pmf_mean(pmf: dict[int, float]) -> float:
+def pmf_mean(pmf: Mapping[int, float]) -> float:
     """Expected (mean) income from the PMF. E[X] = sum(x * p).
 
     When pmf is round_pmf(...), this is expected income per round — the denominator
     for planning "expected rounds until victory" (ERUV). Matches portfolio_ev for
-    non–Amusement Park players.
+    non–Amusement Park players. Accepts a PMF or a plain dict.
     """
-    if not pmf:
-        return 0.0
-    return sum(x * p for x, p in pmf.items())
+    return _as_pmf(pmf).mean()
 
 
-def pmf_variance(pmf: dict[int, float]) -> float:
+def pmf_variance(pmf: Mapping[int, float]) -> float:
     """Variance of the distribution. E[X^2] - E[X]^2.
 
     High variance means outcome is uncertain; we're less sure we'll hit the mean path.
     Use this to decide whether to shore up weak spots in the engine (coverage, synergy)
     or to treat ERUV as a confident estimate.
     """
-    if not pmf:
-        return 0.0
-    mu = pmf_mean(pmf)
-    e2 = sum((x * x) * p for x, p in pmf.items())
-    return e2 - mu * mu
+    return _as_pmf(pmf).variance()
 
 
-def pmf_percentile(pmf: dict[int, float], p: float) -> float:
+def pmf_percentile(pmf: Mapping[int, float], p: float) -> float:
     """Smallest income x such that P(income <= x) >= p.
 
     p=0.5 is median. p>0.5 gives an optimistic (high) income; p<0.5 pessimistic.
     Enables 25/75 or 10/90 optimist/pessimist TUV when passed to tuv_percentile(..., p).
     """
-    if not pmf or p <= 0.0:
-        return float(min(pmf.keys(), default=0))
-    items = sorted(pmf.items())
-    cumulative_sum = 0.0
-    for x, prob in items:
-        cumulative_sum += prob
-        if cumulative_sum >= p:
-            return float(x)
-    return float(items[-1][0])
+    return _as_pmf(pmf).percentile(p)
 
 
-def pmf_mass_at_least(pmf: dict[int, float], threshold: int) -> float:
+def pmf_mass_at_least(pmf: Mapping[int, float], threshold: int) -> float:
     """Probability that the outcome is >= threshold. Sum of p for all x >= threshold."""
-    if not pmf:
-        return 0.0
-    return sum(p for x, p in pmf.items() if x >= threshold)
+    return _as_pmf(pmf).mass_at_least(threshold)
 
 
 def _prob_win_in_n_rounds(
@@ -523,6 +1132,7 @@ def _prob_win_in_n_rounds(
 
     Shared by prob_victory_within_n_rounds (Game wrapper) and MarathonBot (no Game).
     Returns 1.0 if player has already won or deficit is already met; 0.0 if n_rounds=0.
+    Sums saturate at the deficit, so the cost depends on the deficit, not on n_rounds.
     """
     if player.isWinner():
         return 1.0
@@ -531,11 +1141,8 @@ def _prob_win_in_n_rounds(
         return 1.0
     if n_rounds <= 0:
         return 0.0
-    rp = round_pmf(player, players)
-    acc: dict[int, float] = {0: 1.0}
-    for _ in range(n_rounds):
-        acc = _convolve(acc, rp)
-    return pmf_mass_at_least(acc, deficit)
+    total = _convolve_power(round_pmf(player, players), n_rounds, cap=deficit)
+    return pmf_mass_at_least(total, deficit)
 
 
 def prob_victory_within_n_rounds(
@@ -543,14 +1150,93 @@ def prob_victory_within_n_rounds(
 ) -> float:
     """Probability that cumulative income over n_rounds meets or exceeds the coin deficit.
 
-    Uses the n-fold convolution of round_pmf: "how sure are we that we'll be across
-    the goal line in N rounds?" Assumes we only need to earn deficit = cost_remaining - bank;
+    Uses the n-fold convolution of round_pmf (via _convolve_power): "how sure are we that
+    we'll be across the goal line in N rounds?" Assumes we only need to earn deficit = cost_remaining - bank;
     does not enforce the landmark-count floor (caller may require n_rounds >= n_landmarks).
     Returns 1.0 if player has already won.
     """
     return _prob_win_in_n_rounds(player, game.players, n_rounds)
 
 
+@dataclass
+class VictoryTimeline:
+    """Distribution of the round in which cumulative income first meets the coin deficit.
+
+    first_passage[n] = P(deficit first met after exactly n rounds), for n = 0..horizon;
+    any remaining mass is P(not met within horizon). Like _prob_win_in_n_rounds, the
+    landmark-count floor is not applied — callers wanting TUV semantics take
+    max(n_landmarks, ...) themselves.
+    """
+    first_passage: list[float]
+
+    @property
+    def horizon(self) -> int:
+        return len(self.first_passage) - 1
+
+    def p_win_within(self, n_rounds: int) -> float:
+        """P(deficit met within n_rounds); equals _prob_win_in_n_rounds for n_rounds <= horizon."""
+        if n_rounds < 0:
+            return 0.0
+        return sum(self.first_passage[:n_rounds + 1], 0.0)
+
+    def expected_rounds(self) -> float:
+        """E[min(T, horizon + 1)]: mean rounds to victory, counting misses as horizon + 1.
+
+        A lower bound on the true mean; exact once p_win_within(horizon) reaches 1.
+        """
+        unmet = max(0.0, 1.0 - sum(self.first_passage, 0.0))
+        return sum((n * pn for n, pn in enumerate(self.first_passage)), 0.0) + (self.horizon + 1) * unmet
+
+    def percentile_rounds(self, p: float) -> float:
+        """Smallest n with P(win within n) >= p; math.inf if that is beyond the horizon.
+
+        p=0.5 is the median rounds-to-victory; low p is optimistic, high p pessimistic.
+        """
+        cumulative = 0.0
+        for n, pn in enumerate(self.first_passage):
+            cumulative += pn
+            if cumulative >= p:
+                return float(n)
+        return math.inf
+
+
+def _victory_timeline(player: Player, players: list[Player], horizon: int) -> VictoryTimeline:
+    """Core computation for victory_timeline, given a players list.
+
+    One forward pass over rounds: the not-yet-won mass is kept per coins earned (0 to
+    deficit - 1), convolved with round_pmf each round, and whatever reaches the deficit
+    is recorded as that round's first passage and dropped. Cost is horizon x deficit x
+    round support, with no repeated work across n.
+    """
+    first_passage = [0.0] * (max(0, horizon) + 1)
+    deficit = max(0, _landmark_cost_remaining(player) - player.bank)
+    if player.isWinner() or deficit <= 0:
+        first_passage[0] = 1.0
+        return VictoryTimeline(first_passage)
+    step = round_pmf(player, players)
+    cut = deficit - step.offset  # index into a convolved row where income meets the deficit
+    pending = [1.0]  # pending[k] = P(not yet won, k coins earned)
+    for n in range(1, len(first_passage)):
+        if not pending:
+            break
+        row = _convolve_lists(pending, step.probs)
+        if cut <= 0:
+            first_passage[n] = sum(row, 0.0)
+            break
+        first_passage[n] = sum(row[cut:], 0.0)
+        pending = [0.0] * step.offset + row[:cut]
+    return VictoryTimeline(first_passage)
+
+
+def victory_timeline(player: Player, game: Game, horizon: int) -> VictoryTimeline:
+    """First-passage distribution of rounds until victory, for every n up to horizon.
+
+    ERUV-style means, percentile rounds and P(win within n) for all n are read off one
+    VictoryTimeline instead of one prob_victory_within_n_rounds call per n.
+    """
+    return _victory_timeline(player, game.players, horizon)
+
+
 # ---------------------------------------------------------------------------
 # TUV (turns until victory) / ERUV (expected rounds until victory)
 # ---------------------------------------------------------------------------
@@ -561,6 +1247,8 @@ def prob_victory_within_n_rounds(
 # For a given horizon N, use prob_victory_within_n_rounds for a confidence interval:
 # "how sure are we that we'll be across the goal line in N rounds?" When variance is
 # high, we can spend margin shoring up weak spots in our PMF instead of trusting the mean.
+# Callers that need P(win within n) for many n (or percentile rounds) should read one
+# victory_timeline instead; the bots ask about a single N per decision and do not.
 
 
 def _n_landmarks_remaining(player: Player) -> int:
@@ -638,19 +1326,145 @@ def delta_tuv(player_a: Player, player_b: Player, game: Game) -> float:
     return tuv_expected(player_a, game) - tuv_expected(player_b, game)
 
 
-def score_purchase_options(player: Player, cards: list[Card], players: list[Player], N: int = 1) -> dict[Card, float]:
+def score_purchase_options(
+    player: Player, cards: list[Card], players: list[Player], N: int = 1,
+    context: StrategyContext | None = None,
+) -> dict[Card, float]:
     """Return a {Card: delta_ev} dict for cards, sorted descending by delta_ev.
 
     cards should be pre-filtered to distinct, affordable options.
     players is passed to delta_ev for opponent-count-sensitive EV (Red, Blue, Purple cards).
+    All candidates are scored in one _delta_evs pass over a shared baseline; pass the
+    game's StrategyContext as context to reuse baselines across decisions in a turn.
     """
     if not cards:
         return {}
-    scored = [
-        (card, delta_ev(card, player, players, N, market_cards=cards))
-        for card in cards
-    ]
+    scored = list(zip(cards, _delta_evs(cards, player, players, N, market_cards=cards, context=context)))
     scored.sort(key=lambda pair: pair[1], reverse=True)
     return dict(scored)
 
 
+# ---------------------------------------------------------------------------
+# Strategy context
+# ---------------------------------------------------------------------------
+#
+# Within one turn a bot asks many questions about the same table: every candidate card,
+# every landmark flag, every swap. StrategyContext (owned by Game, see Game.strategy)
+# keeps the per-player building blocks for the current state — category counts, income
+# vectors, opponent-turn PMFs, round PMFs and round means — so those questions share them.
+#
+# Every entry is stored with a stamp of exactly the state it was built from (deck version,
+# landmark flags, the banks it reads), and is only returned while the stamp still matches.
+# Cached values therefore can't go stale even when a bot or test edits a deck directly.
+# Game.next_turn forwards its events to observe(), which drops the entries a buy, swap or
+# coin movement touched, and calls refresh() at the start of each turn to sweep the rest.
+
+_DECK_EVENTS: dict[str, tuple[str, ...]] = {"buy": ("player",), "bc_swap": ("player", "target")}
+_BANK_EVENTS: dict[str, tuple[str, ...]] = {
+    "buy": ("player",), "payout": ("player",), "bc_bot_payout": ("player",),
+    "steal": ("player", "target"), "collect": ("player", "target"),
+}
+
+
+class StrategyContext:
+    """Per-game cache of strategy building blocks, validated by state stamps.
+
+    Strategy functions take it as an optional context= argument and use it only when
+    their players list is the context's table; any other list falls back to the plain
+    computation, which gives identical results.
+    """
+
+    def __init__(self, players: list[Player]) -> None:
+        self.players = players
+        self._entries: dict[tuple, tuple[tuple, object]] = {}
+
+    def serves(self, players: list[Player]) -> bool:
+        """True if players is this context's table (same players, same seat order)."""
+        return players is self.players or players == self.players
+
+    # Stamps -----------------------------------------------------------------
+
+    @staticmethod
+    def _flags(player: Player) -> tuple[bool, bool, bool, bool]:
+        return (player.hasTrainStation, player.hasShoppingMall,
+                player.hasAmusementPark, player.hasRadioTower)
+
+    def _stamp(self, kind: str, player: Player, roller: Player | None = None) -> tuple:
+        if kind == "counts":
+            return (player.deck.deck.version,)
+        if kind == "opp":
+            return (player.deck.deck.version, roller.bank, roller.hasTrainStation, roller.hasAmusementPark)
+        if kind == "vectors":
+            return (player.deck.deck.version, player.hasShoppingMall,
+                    tuple(p.bank for p in self.players if p is not player))
+        # "mean" and "round" read every player's deck, flags and bank
+        return tuple((p.deck.deck.version, p.bank) + self._flags(p) for p in self.players)
+
+    def _get(self, kind: str, build, player: Player, roller: Player | None = None):
+        key = (kind, player, roller)
+        stamp = self._stamp(kind, player, roller)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        value = build()
+        self._entries[key] = (stamp, value)
+        return value
+
+    # Cached building blocks -------------------------------------------------
+
+    def category_counts(self, player: Player) -> Counter:
+        """Number of cards in player's deck per category (do not mutate)."""
+        return self._get("counts", lambda: _category_counts(player), player)
+
+    def income_vectors(self, player: Player) -> IncomeVectors:
+        """income_vectors(player, players) for this table (do not mutate)."""
+        return self._get("vectors", lambda: income_vectors(player, self.players), player)
+
+    def opponent_turn_pmf(self, observer: Player, roller: Player) -> PMF:
+        """opponent_turn_pmf(observer, roller, players) for this table."""
+        return self._get("opp", lambda: opponent_turn_pmf(observer, roller, self.players), observer, roller)
+
+    def round_pmf(self, player: Player) -> PMF:
+        """round_pmf(player, players) for this table."""
+        return self._get("round", lambda: round_pmf(player, self.players), player)
+
+    def mean_round_income(self, player: Player) -> float:
+        """Expected round income from player's current income vectors (see expected_round_income)."""
+        return self._get(
+            "mean", lambda: expected_round_income(self.income_vectors(player), player, self.players), player
+        )
+
+    # Invalidation -----------------------------------------------------------
+
+    def observe(self, events: list[Event]) -> None:
+        """Drop entries that buy, swap and coin-movement events may have changed."""
+        for event in events:
+            deck_names = [getattr(event, f) for f in _DECK_EVENTS.get(event.type, ())]
+            bank_names = [getattr(event, f) for f in _BANK_EVENTS.get(event.type, ())]
+            if deck_names or bank_names:
+                self._drop({p for p in self.players if p.name in deck_names},
+                           {p for p in self.players if p.name in bank_names})
+
+    def _drop(self, deck_touched: set[Player], bank_touched: set[Player]) -> None:
+        for key in list(self._entries):
+            kind, player, roller = key
+            if kind == "counts":
+                stale = player in deck_touched
+            elif kind == "opp":
+                stale = player in deck_touched or roller in deck_touched or roller in bank_touched
+            elif kind == "vectors":
+                stale = player in deck_touched or any(p is not player for p in bank_touched)
+            else:
+                stale = bool(deck_touched or bank_touched)
+            if stale:
+                del self._entries[key]
+
+    def refresh(self) -> None:
+        """Sweep entries whose stamps no longer match the table (called at each turn start)."""
+        for key, (stamp, _) in list(self._entries.items()):
+            if self._stamp(key[0], key[1], key[2]) != stamp:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
@@ -184,12 +184,12 @@ class TestBots(unittest.TestCase):
         self.assertEqual(thoughtful.chooseCard([bakery, mine]), "Mine")
 
     def testThoughtfulBotRandomFallback(self):
-        """Verify ThoughtfulBot falls back to random.choice(names) when no option matches any priority list."""
+        """Verify ThoughtfulBot falls back to rng.choice(names) when no option matches any priority list."""
         thoughtful = ThoughtfulBot(name="Thoughtful")
         curiosity  = Blue("Curiosity Shop", 1, 1, 1, [4])
         duck_ranch = Blue("Duck Ranch", 2, 1, 1, [5])
-        # ThoughtfulBot calls random.choice on a list of name strings (in bots.py).
-        with patch('bots.random.choice', return_value='Duck Ranch'):
+        # ThoughtfulBot calls its rng's choice on a list of name strings (in bots.py).
+        with patch.object(thoughtful.rng, 'choice', return_value='Duck Ranch'):
             result = thoughtful.chooseCard([curiosity, duck_ranch])
         self.assertEqual(result, 'Duck Ranch')
 
@@ -3,7 +3,8 @@
 # tests/test_cards.py — Card trigger mechanics and sort ordering tests
 
 import unittest
-from harmonictook import Game, Blue, Green, Red, Card, Stadium, TVStation, BusinessCenter, UpgradeCard
+import dataclasses
+from harmonictook import Game, Blue, Green, Red, Card, CardSpec, Stadium, TVStation, BusinessCenter, UpgradeCard
 
 
 class TestCards(unittest.TestCase):
@@ -221,6 +222,55 @@ class TestCards(unittest.TestCase):
         self.assertGreater(len(collect_targets), 0)  # at least one other player paid
 
 
+class TestHitsMask(unittest.TestCase):
+    """Card.hits_mask mirrors hitsOn; PlayerDeck.trigger_masks unions them per roller type."""
+
+    def test_mask_tracks_hits_on(self):
+        bakery = Green("Bakery", 3, 1, 1, [2, 3])
+        self.assertEqual(bakery.hits_mask, 0b1100)
+        self.assertTrue(bakery.fires_on(3))
+        self.assertFalse(bakery.fires_on(4))
+        bakery.hitsOn = [11, 12]
+        self.assertTrue(bakery.fires_on(12))
+        self.assertFalse(bakery.fires_on(2))
+
+    def test_landmark_never_fires_on_a_roll(self):
+        card = UpgradeCard("Radio Tower")
+        self.assertEqual(card.hitsOn, [99])
+        self.assertFalse(any(card.fires_on(r) for r in range(13)))
+
+    def test_deck_trigger_masks(self):
+        player = Game(players=2).players[0]
+        player.deck.append(Red("Cafe", 4, 2, 1, [3]))
+        player.deck.append(Stadium())
+        player.deck.append(UpgradeCard("Train Station"))
+        own, opponent = player.deck.trigger_masks()
+        self.assertEqual(own, 1 << 1 | 1 << 2 | 1 << 3 | 1 << 6)     # Wheat, Bakery, Stadium
+        self.assertEqual(opponent, 1 << 1 | 1 << 3)                  # Wheat, Cafe
+
+    def test_deck_masks_follow_direct_edits(self):
+        player = Game(players=2).players[0]
+        before = player.deck.trigger_masks()
+        player.deck.deck.append(Blue("Mine", 5, 6, 5, [9]))
+        own, opponent = player.deck.trigger_masks()
+        self.assertEqual(own, before[0] | 1 << 9)
+        self.assertEqual(opponent, before[1] | 1 << 9)
+
+    def test_reassigning_an_owned_card_refreshes_deck_caches(self):
+        """Verify reassigning hitsOn or cost on a deck card refreshes masks, roll index and sorted removal."""
+        player = Game(players=2).players[0]
+        for card in (Blue("Ranch", 2, 1, 1, [2]), Blue("Forest", 5, 3, 1, [5]),
+                     Green("Cheese Factory", 6, 5, 3, [7], 2)):
+            card.owner = player
+            player.deck.append(card)
+        wheat = player.deck.deck[0]
+        wheat.hitsOn = [8]
+        self.assertTrue(player.deck.trigger_masks()[0] >> 8 & 1)
+        self.assertTrue(any(wheat in cards for cards in player.deck.triggered_by(8)))
+        player.deck.remove(wheat)
+        self.assertNotIn("Wheat Field", player.deck.counts())
+
+
 class TestCardOrdering(unittest.TestCase):
     """Tests for Card sort ordering and comparison operators."""
 
@@ -287,6 +337,49 @@ class TestCardOrdering(unittest.TestCase):
         self.assertEqual(Card().describe(), "")
 
 
+class TestCardSpecs(unittest.TestCase):
+    """Card copies share one interned, immutable CardSpec and carry only their owner."""
+
+    def test_copies_share_one_spec(self):
+        game = Game(players=2)
+        wheat = [c for c in game.market.deck if c.name == "Wheat Field"]
+        self.assertEqual(len(wheat), 6)
+        self.assertTrue(all(c.spec is wheat[0].spec for c in wheat))
+        self.assertIs(Blue("Wheat Field", 1, 1, 1, [1]).spec, wheat[0].spec)
+        self.assertFalse(hasattr(wheat[0], "__dict__"))
+
+    def test_spec_is_immutable(self):
+        spec = CardSpec.of("Ranch", 2, 1, 1, [2])
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            spec.cost = 5  # type: ignore[misc]
+
+    def test_assignment_rebinds_only_that_copy(self):
+        ranch, other = Blue("Ranch", 2, 1, 1, [2]), Blue("Ranch", 2, 1, 1, [2])
+        ranch.payout = 4
+        ranch.hitsOn.append(7)          # hitsOn is a copy; mutating it changes nothing
+        self.assertEqual(ranch.payout, 4)
+        self.assertEqual(ranch.hitsOn, [2])
+        self.assertEqual(other.payout, 1)
+        self.assertIs(ranch.spec, CardSpec.of("Ranch", 2, 1, 4, (2,)))
+
+    def test_sort_key_matches_sortvalue_formula(self):
+        bakery = Green("Bakery", 3, 1, 1, [2, 3])
+        self.assertAlmostEqual(bakery.sortvalue(), 2.5 + 0.01 + ord("B")/255)
+
+    def test_upgrade_listings_are_shared_but_purchases_are_fresh(self):
+        game = Game(players=2)
+        player = game.players[0]
+        player.deposit(10)
+        listed = player.checkRemainingUpgrades()
+        self.assertIs(listed[0], game.players[1].checkRemainingUpgrades()[0])
+        player.buy("Train Station", game.market)
+        bought = player.deck.first("Train Station")
+        self.assertIsNot(bought, listed[0])
+        self.assertIs(bought.owner, player)
+        self.assertIsNone(listed[0].owner)
+        self.assertTrue(player.hasTrainStation)
+
+
 class TestDescribeMethods(unittest.TestCase):
     """describe() returns a non-empty human-readable string for every concrete card type."""
 
@@ -3,7 +3,7 @@
 # tests/test_decks.py — Store, PlayerDeck, and TableDeck tests
 
 import unittest
-from harmonictook import Game, TableDeck, UpgradeCard
+from harmonictook import Game, TableDeck, UpgradeCard, Blue, Green, Red, CardList, TRIGGER_ORDER
 
 
 class TestStoreOperations(unittest.TestCase):
@@ -70,5 +70,127 @@ class TestStoreOperations(unittest.TestCase):
         self.assertEqual(len(table.deck), size_before)
 
 
+class TestStoreMultiset(unittest.TestCase):
+    """Store keeps a name -> cards multiset in step with its sorted .deck list."""
+
+    def setUp(self):
+        self.table = TableDeck()
+
+    def assertMatchesDeck(self, store):
+        """Counts, names and order must agree with a fresh scan of store.deck."""
+        expected: dict = {}
+        for card in store.deck:
+            expected[card.name] = expected.get(card.name, 0) + 1
+        self.assertEqual(store.counts(), expected)
+        self.assertEqual(list(store.counts()), list(expected), "Names must be in deck order")
+        self.assertEqual(store.names(), list(expected))
+        self.assertEqual(list(store.deck), sorted(store.deck))
+
+    def test_counts_match_deck_after_mixed_mutations(self):
+        """append/remove keep the multiset and sort order in step, including new and emptied names."""
+        ranch = next(c for c in self.table.deck if c.name == "Ranch")
+        stadium = next(c for c in self.table.deck if c.name == "Stadium")
+        self.table.remove(ranch)
+        self.table.remove(stadium)
+        self.assertEqual(self.table.count("Ranch"), 5)
+        self.assertEqual(self.table.count("Stadium"), 0)
+        self.assertMatchesDeck(self.table)
+        self.table.append(stadium)
+        self.table.append(Red("Sushi Bar", 4, 2, 3, [1]))
+        self.assertEqual(self.table.names()[0], "Sushi Bar")
+        self.assertMatchesDeck(self.table)
+
+    def test_direct_list_edits_are_picked_up(self):
+        """Editing .deck directly invalidates the multiset; the next Store call re-sorts as before."""
+        self.table.deck.append(Blue("Wheat Field", 1, 1, 1, [1]))
+        self.assertEqual(self.table.count("Wheat Field"), 7)
+        self.table.deck.insert(0, Blue("Mine", 5, 6, 5, [9]))
+        self.table.append(Green("Bakery", 3, 1, 1, [2, 3]))
+        self.assertMatchesDeck(self.table)
+
+    def test_remove_missing_card_raises_value_error(self):
+        """Removing a card that is not present raises ValueError, as list.remove does."""
+        with self.assertRaises(ValueError):
+            self.table.remove(Red("Sushi Bar", 4, 2, 3, [1]))
+        self.assertMatchesDeck(self.table)
+
+    def test_remove_card_whose_spec_changed_in_place(self):
+        """A card reassigned while in the deck is still found (linear fallback) and the deck re-sorts."""
+        self.table.append(Red("Sushi Bar", 4, 2, 3, [1]))     # leave the sorted fast path armed
+        forest = next(c for c in self.table.deck if c.name == "Forest")
+        forest.hitsOn = [12]
+        self.table.remove(forest)
+        self.assertEqual(self.table.count("Forest"), 5)
+        self.assertMatchesDeck(self.table)
+
+    def test_kinds_and_freq_use_one_card_per_name(self):
+        kinds = self.table.kinds()
+        self.assertEqual([c.name for c in kinds], self.table.names())
+        self.assertEqual({c.name: n for c, n in self.table.freq().items()}, self.table.counts())
+
+
+class TestCardList(unittest.TestCase):
+    """Store.deck is a CardList whose version changes on every mutation."""
+
+    def setUp(self):
+        self.deck = Game(players=2).players[0].deck
+
+    def test_deck_is_card_list(self):
+        self.assertIsInstance(self.deck.deck, CardList)
+        self.deck.deck = [Blue("Ranch", 2, 1, 1, [2])]
+        self.assertIsInstance(self.deck.deck, CardList, "Assigning a plain list wraps it")
+        self.assertEqual(self.deck.names(), ["Ranch"])
+
+    def test_direct_mutations_bump_version(self):
+        ranch = Blue("Ranch", 2, 1, 1, [2])
+        mutations = [
+            lambda d: d.append(ranch), lambda d: d.remove(ranch), lambda d: d.insert(0, ranch),
+            lambda d: d.pop(0), lambda d: d.extend([ranch]), lambda d: d.sort(),
+            lambda d: d.__setitem__(0, ranch), lambda d: d.__delitem__(0), lambda d: d.clear(),
+        ]
+        for mutate in mutations:
+            before = self.deck.deck.version
+            mutate(self.deck.deck)
+            self.assertGreater(self.deck.deck.version, before)
+
+    def test_versions_are_unique_across_lists(self):
+        self.assertNotEqual(CardList().version, CardList().version)
+
+
+
+class TestRollIndex(unittest.TestCase):
+    """PlayerDeck.triggered_by: cards firing on a roll, bucketed in resolution order."""
+
+    def setUp(self):
+        self.game = Game(players=2)
+        self.player, self.other = self.game.players
+
+    def test_buckets_follow_trigger_order(self):
+        cafe = Red("Cafe", 4, 2, 1, [3])
+        self.player.deck.append(cafe)
+        buckets = self.player.deck.triggered_by(3)
+        self.assertEqual(len(buckets), len(TRIGGER_ORDER))
+        self.assertEqual(buckets[TRIGGER_ORDER.index(Red)], [cafe])
+        self.assertEqual([c.name for c in buckets[TRIGGER_ORDER.index(Green)]], ["Bakery"])
+        self.assertEqual(sum(len(b) for b in self.player.deck.triggered_by(7)), 0)
+
+    def test_landmarks_never_indexed(self):
+        self.player.deck.append(UpgradeCard("Radio Tower"))
+        self.assertEqual(sum(len(b) for b in self.player.deck.triggered_by(99)), 0)
+
+    def test_index_follows_remove_and_swap(self):
+        blue = TRIGGER_ORDER.index(Blue)
+        ranch = Blue("Ranch", 2, 1, 1, [2])
+        ranch.owner = self.other
+        self.other.deck.append(ranch)
+        wheat = next(c for c in self.player.deck.deck if c.name == "Wheat Field")
+        self.player.swap(wheat, self.other, ranch)
+        self.assertEqual(list(self.player.deck.triggered_by(2)[blue]), [ranch])
+        self.assertEqual(len(self.player.deck.triggered_by(1)[blue]), 0)
+        self.assertEqual(len(self.other.deck.triggered_by(1)[blue]), 2)
+        self.player.deck.remove(ranch)
+        self.assertEqual(len(self.player.deck.triggered_by(2)[blue]), 0)
+
+
 if __name__ == "__main__":
     unittest.main(buffer=True)
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# tests/test_fastgame.py — Tests for the headless array-backed FastGame engine
+
+import unittest
+from unittest.mock import patch
+
+from harmonictook import Bot, PassBot
+from bots import CoverageBot, EVBot, FromageBot, ImpatientBot, MarathonBot, ThoughtfulBot
+from fastgame import CATALOGUE, KIND, FastGame, compare_with_game
+
+
+def _roll(game: FastGame, value: int) -> None:
+    """Play one turn for the current player with the dice fixed at value (no buying)."""
+    player = game.get_current_player()
+    with patch.object(player, "dieroll", return_value=(value, False)), \
+            patch.object(player, "chooseAction", return_value="pass"):
+        game.next_turn()
+
+
+class TestSetup(unittest.TestCase):
+    """A new FastGame matches a new Game's starting table."""
+
+    def test_starting_state(self):
+        """Verify banks, starting decks, market stacks and reserve match a new Game."""
+        game = FastGame(3)
+        self.assertEqual(game.bank, [3, 3, 3])
+        for row in game.counts:
+            self.assertEqual(row[KIND["Wheat Field"]], 1)
+            self.assertEqual(row[KIND["Bakery"]], 1)
+            self.assertEqual(sum(row), 2)
+        self.assertEqual(game.market[KIND["Ranch"]], 6)
+        self.assertEqual(game.market[KIND["Stadium"]], 1)
+        self.assertEqual(game.reserve[KIND["Radio Tower"]], 4)
+
+    def test_catalogue_is_in_deck_order(self):
+        """Verify CATALOGUE follows card sort order with landmarks last."""
+        self.assertEqual(list(CATALOGUE), sorted(CATALOGUE))
+        self.assertEqual(CATALOGUE[-1].name, "Radio Tower")
+
+    def test_seated_players_are_reset(self):
+        """Verify seated players start from a fresh bank and flags."""
+        bot = Bot(name="Reused")
+        bot.bank = 40
+        bot.hasTrainStation = True
+        game = FastGame([bot, Bot(name="Other")])
+        self.assertEqual(game.bank[0], 3)
+        self.assertFalse(bot.hasTrainStation)
+
+
+class TestTriggers(unittest.TestCase):
+    """Each color resolves as Game.next_turn resolves it."""
+
+    def setUp(self):
+        self.game = FastGame([PassBot(name="A"), PassBot(name="B")])
+
+    def test_red_takes_from_roller_with_mall_bonus(self):
+        """Verify Reds take from the roller, with the Shopping Mall bonus, before Greens pay."""
+        self.game.counts[1][KIND["Cafe"]] = 2
+        self.game.landmarks[1] = 0b10            # Shopping Mall
+        _roll(self.game, 3)
+        # Reds resolve before A's Bakery pays, so B can take at most A's 3 coins
+        self.assertEqual(self.game.bank, [1, 6])
+
+    def test_green_pays_only_the_roller_and_factories_multiply(self):
+        """Verify Greens pay only the roller and factories multiply by category count."""
+        self.game.counts[0][KIND["Ranch"]] = 3
+        self.game.counts[0][KIND["Cheese Factory"]] = 1
+        _roll(self.game, 7)
+        self.assertEqual(self.game.bank, [3 + 9, 3])
+
+    def test_stadium_collects_from_everyone_else(self):
+        """Verify Stadium collects from every other player."""
+        self.game.counts[0][KIND["Stadium"]] = 1
+        _roll(self.game, 6)
+        self.assertEqual(self.game.bank, [5, 1])
+
+    def test_tv_station_steals_from_chosen_target(self):
+        """Verify TV Station steals from the target the roller chooses."""
+        self.game.counts[0][KIND["TV Station"]] = 1
+        self.game.bank[1] = 10
+        _roll(self.game, 6)
+        self.assertEqual(self.game.bank, [8, 5])
+
+
+class TestRun(unittest.TestCase):
+    """Whole games: a winner with every landmark, and buys reflected on the players."""
+
+    def test_run_produces_a_winner(self):
+        """Verify run() ends with a winner and Player objects that match the arrays."""
+        game = FastGame(2, seed=3)
+        winner = game.run()
+        self.assertIs(game.winner, winner)
+        self.assertTrue(winner.isWinner())
+        self.assertEqual(winner.bank, game.bank[game.players.index(winner)])
+        for row, player in zip(game.counts, game.players):
+            establishments = sum(player.deck.counts().values()) - bin(game.landmarks[game.players.index(player)]).count("1")
+            self.assertEqual(sum(row), establishments)
+
+
+class TestDifferential(unittest.TestCase):
+    """Seeded games in FastGame and Game end in the same state."""
+
+    def test_random_bots(self):
+        """Verify random Bots end seeded games identically in both engines at 2-4 players."""
+        for seed in range(10):
+            for n in (2, 3, 4):
+                with self.subTest(seed=seed, players=n):
+                    self.assertEqual(compare_with_game([Bot] * n, seed), [])
+
+    def test_priority_bots(self):
+        """Verify priority-list bots end seeded games identically in both engines."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.assertEqual(compare_with_game([ThoughtfulBot, FromageBot, Bot], seed), [])
+
+    def test_strategy_bots(self):
+        """Verify EV-driven bots end a seeded game identically in both engines."""
+        for factories in ([EVBot, CoverageBot], [ImpatientBot, MarathonBot]):
+            with self.subTest(factories=[f.__name__ for f in factories]):
+                self.assertEqual(compare_with_game(factories, 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main(buffer=True)
@@ -2,9 +2,14 @@
 # -*- coding: UTF-8 -*-
 # tests/test_game.py — Game class creation, state, and refresh_market tests
 
+import random
 import unittest
 from unittest.mock import patch, MagicMock
-from harmonictook import Game, Human, TVStation, GameState, NullDisplay
+from harmonictook import (
+    Game, Human, TVStation, GameState, GameHistory, HistoryPolicy, NullDisplay, RecordingDisplay, Blue,
+    PayoutTallyDisplay, DiceStream,
+    OUTCOME_EVENTS, PAYOUT_EVENTS, deck_to_string,
+)
 from bots import ThoughtfulBot
 
 
@@ -91,6 +96,28 @@ class TestRefreshMarket(unittest.TestCase):
         # Card is owned and already absent from market → should stay absent
         self.assertNotIn("TV Station", self.game.market.names())
 
+    def testRefreshMarketMovesOwnedCardOutOfMarket(self):
+        """Verify branch 3: card owned and in market → the market's copy moves to the reserve."""
+        tv = TVStation()
+        tv.owner = self.player
+        self.player.deck.append(tv)
+        listed = self.game.market.first("TV Station")
+        reserve_before = self.game.reserve.count("TV Station")
+        self.game.refresh_market()
+        self.assertNotIn("TV Station", self.game.market.names())
+        self.assertEqual(self.game.reserve.count("TV Station"), reserve_before + 1)
+        self.assertTrue(any(c is listed for c in self.game.reserve.deck))
+        self.assertEqual(len({id(c) for c in self.game.reserve.deck}), len(self.game.reserve.deck),
+            "The reserve must not hold the same card object twice")
+
+    def testRefreshMarketIsIdempotent(self):
+        """A second refresh for the same player changes nothing."""
+        self.game.refresh_market()
+        market, reserve = self.game.market.counts(), self.game.reserve.counts()
+        self.game.refresh_market()
+        self.assertEqual(self.game.market.counts(), market)
+        self.assertEqual(self.game.reserve.counts(), reserve)
+
 
 class TestMain(unittest.TestCase):
     """Tests for the main() entry point."""
@@ -104,7 +131,7 @@ class TestMain(unittest.TestCase):
         with patch('harmonictook.Game', return_value=mock_game) as mock_game_cls:
             with patch('sys.argv', ['harmonictook.py', '--bots', '2']):
                 harmonictook.main()
-        mock_game_cls.assert_called_once_with(bots=2, humans=0)
+        mock_game_cls.assert_called_once_with(bots=2, humans=0, history=HistoryPolicy(), seed=None)
         mock_game.run.assert_called_once()
 
     @patch('builtins.input', return_value='3')   # '3' → "Quit" in post-game menu
@@ -116,10 +143,64 @@ class TestMain(unittest.TestCase):
         with patch('harmonictook.Game', return_value=mock_game) as mock_game_cls:
             with patch('sys.argv', ['harmonictook.py']):
                 harmonictook.main()
-        mock_game_cls.assert_called_once_with(bots=0, humans=0)
+        mock_game_cls.assert_called_once_with(bots=0, humans=0, history=HistoryPolicy(), seed=None)
         mock_game.run.assert_called_once()
 
 
+class TestEventSubscriptions(unittest.TestCase):
+    """Display.subscribes limits which events next_turn builds; deck_state renders lazily."""
+
+    def setUp(self):
+        self.game = Game(players=2)
+
+    @patch('harmonictook.random.randint', return_value=1)
+    def testQuietDisplayKeepsOnlyRollEvents(self, _):
+        """Verify an empty subscription still builds the roll events Game.run needs."""
+        events = self.game.next_turn(NullDisplay(frozenset()))
+        self.assertEqual({e.type for e in events}, {"roll"})
+
+    @patch('harmonictook.random.randint', return_value=1)
+    def testRecordingDisplaySeesOnlyItsSubscriptions(self, _):
+        """Verify a RecordingDisplay receives only the event types it subscribes to."""
+        recorder = RecordingDisplay(subscribes=PAYOUT_EVENTS | OUTCOME_EVENTS)
+        self.game.next_turn(recorder)
+        types = {e.type for e in recorder.events}
+        self.assertIn("payout", types)          # both Wheat Fields pay on a 1
+        self.assertTrue(types <= PAYOUT_EVENTS | OUTCOME_EVENTS)
+
+    def testPayoutTallyMatchesRecordedEvents(self):
+        """Verify PayoutTallyDisplay totals the same per-card payouts a RecordingDisplay records."""
+        recorder = RecordingDisplay(subscribes=PAYOUT_EVENTS)
+        Game(players=3, seed=8).run(display=recorder)
+        expected: dict = {}
+        for ev in recorder.events:
+            if ev.card:
+                entry = expected.setdefault(ev.player, {}).setdefault(ev.card, {"fires": 0, "total": 0})
+                entry["fires"] += 1
+                entry["total"] += ev.value
+        tally = PayoutTallyDisplay()
+        Game(players=3, seed=8).run(display=tally)
+        self.assertTrue(expected)
+        self.assertEqual(tally.payouts, expected)
+
+    @patch('harmonictook.random.randint', return_value=1)
+    def testDefaultDisplayStillSeesEverything(self, _):
+        """Verify a display with no subscription set still receives every event type."""
+        types = {e.type for e in self.game.next_turn(NullDisplay())}
+        self.assertTrue({"bank_status", "deck_state", "card_activates", "payout"} <= types)
+
+    @patch('harmonictook.random.randint', return_value=1)
+    def testDeckStateRendersTheDeckAsItWas(self, _):
+        """Verify deck_state renders the deck as it was when the event was built."""
+        player = self.game.players[0]
+        expected = deck_to_string(player.deck)
+        events = self.game.next_turn(NullDisplay())
+        deck_event = next(e for e in events if e.type == "deck_state")
+        player.deck.append(Blue("Ranch", 2, 1, 1, [2]))    # later changes don't leak in
+        self.assertTrue(deck_event.message.endswith(expected))
+        self.assertIn("Robo0's Deck", deck_event.message)
+
+
 class TestGameHistory(unittest.TestCase):
     """Tests for Game.history (list[GameState]) and the PlayerSnapshot/GameState dataclasses."""
 
@@ -195,5 +276,144 @@ class TestGameHistory(unittest.TestCase):
             self.assertEqual(state.turn_number, i)
 
 
+class TestHistoryPolicy(unittest.TestCase):
+    """Tests for the Game.history retention modes: off, ring buffer, compact, and delta."""
+
+    def _play(self, policy, turns=6):
+        game = Game(players=2, history=policy)
+        with patch('harmonictook.random.randint', return_value=12):
+            for _ in range(turns):
+                game.next_turn(NullDisplay())
+        return game
+
+    def testOffKeepsNothing(self):
+        """Verify mode "off" records no turns."""
+        self.assertEqual(len(self._play(HistoryPolicy("off")).history), 0)
+
+    def testRingBufferKeepsLastTurns(self):
+        """Verify last=N keeps only the N most recent turns."""
+        history = self._play(HistoryPolicy(last=3)).history
+        self.assertEqual([state.turn_number for state in history], [3, 4, 5])
+        self.assertEqual(history[-1].turn_number, 5)
+
+    def _rebuild(self, policy):
+        """Feed one played game's full history into a GameHistory with the given policy."""
+        game = Game(players=3, seed=4)
+        game.run(display=NullDisplay())
+        full = list(game.history)
+        history = GameHistory(policy)
+        for state in full:
+            history.append(state)
+        return full, history
+
+    def testCompactDropsEvents(self):
+        """Verify compact entries keep snapshots but carry no events."""
+        full, compact = self._rebuild(HistoryPolicy("compact"))
+        self.assertEqual(len(compact), len(full))
+        self.assertTrue(all(state.events == [] for state in compact))
+        self.assertEqual([s.players for s in compact], [s.players for s in full])
+
+    def testDeltaRebuildsSnapshots(self):
+        """Verify delta entries read back the same snapshots as full ones by iteration and by index."""
+        full, delta = self._rebuild(HistoryPolicy("delta"))
+        self.assertGreater(len(full), GameHistory.KEYFRAME_INTERVAL)
+        self.assertEqual([s.players for s in delta], [s.players for s in full])
+        for i in (0, 1, GameHistory.KEYFRAME_INTERVAL, len(full) - 2, -1):
+            self.assertEqual(delta[i].players, full[i].players)
+            self.assertEqual(delta[i].turn_number, full[i].turn_number)
+
+    def testDeltaRingBuffer(self):
+        """Verify a delta ring buffer keeps the last N turns with correct snapshots after eviction."""
+        full, ring = self._rebuild(HistoryPolicy("delta", last=5))
+        self.assertEqual([s.players for s in ring], [s.players for s in full[-5:]])
+        self.assertEqual([ring[i].players for i in range(5)], [s.players for s in full[-5:]])
+        self.assertEqual(ring[0].turn_number, full[-5].turn_number)
+
+    def testResetKeepsPolicy(self):
+        """Verify Game.reset empties history without dropping the retention policy."""
+        game = self._play(HistoryPolicy("compact", last=2))
+        game.reset()
+        self.assertEqual(len(game.history), 0)
+        self.assertEqual(game.history.policy, HistoryPolicy("compact", last=2))
+
+    def testParse(self):
+        """Verify CLI strings map to policies and bad modes are rejected."""
+        self.assertEqual(HistoryPolicy.parse("delta:50"), HistoryPolicy("delta", last=50))
+        self.assertEqual(HistoryPolicy.parse("off"), HistoryPolicy("off"))
+        with self.assertRaises(ValueError):
+            HistoryPolicy.parse("everything")
+        with self.assertRaises(ValueError):
+            HistoryPolicy.parse("full:-1")
+
+
+class TestGameRNG(unittest.TestCase):
+    """Tests for the per-game random stream (Game seed/rng)."""
+
+    def _play(self, seed):
+        game = Game(players=2, seed=seed)
+        game.players[:] = [ThoughtfulBot(name="A"), ThoughtfulBot(name="B")]
+        game.run(display=NullDisplay())
+        return game.winner.name, game.turn_number, [p.bank for p in game.players]
+
+    def testPlayersShareTheGameStream(self):
+        """Verify every seated player draws from the game's rng."""
+        game = Game(players=3, seed=5)
+        for player in game.players:
+            self.assertIs(player.rng, game.rng)
+
+    def testSeedReproducesGameDespiteGlobalState(self):
+        """Verify a seeded game replays identically regardless of the global random state."""
+        random.seed(1)
+        first = self._play(seed=11)
+        random.seed(2)
+        self.assertEqual(self._play(seed=11), first)
+
+    def testGamesDoNotShareAStream(self):
+        """Verify draws in one seeded game do not advance another game's stream."""
+        a, b = Game(players=2, seed=3), Game(players=2, seed=3)
+        a.rng.random()
+        self.assertNotEqual(a.rng.getstate(), b.rng.getstate())
+        b.rng.random()
+        self.assertEqual(a.rng.getstate(), b.rng.getstate())
+
+    def testUnseededGameUsesGlobalRandom(self):
+        """Verify an unseeded game falls back to the global random module."""
+        self.assertIs(Game(players=2).rng, random)
+
+    def testDiceStreamFacesDependOnlyOnSeatAndTurn(self):
+        """Verify a seat's faces for a turn are fixed by seed, seat and turn, whatever other seats rolled."""
+        a, b = DiceStream(9, block_size=2), DiceStream(9)
+        for _ in range(5):                      # seat 0 takes five turns in a only
+            a.start_turn(0)
+            a.roll(2)
+            a.roll(2)
+        a.start_turn(1)
+        b.start_turn(1)
+        self.assertEqual(a.roll(1), b.faces(1, 0)[:1])
+        self.assertEqual(a.faces(0, 3), b.faces(0, 3))
+        self.assertNotEqual([a.faces(0, t) for t in range(4)], [a.faces(1, t) for t in range(4)])
+        self.assertTrue(all(1 <= f <= 6 for t in range(8) for f in a.faces(0, t)))
+
+    def testDiceStreamRerollUsesTheSecondPair(self):
+        """Verify a turn's re-roll takes the second pair, and a third roll in one turn is refused."""
+        dice = DiceStream(3)
+        dice.start_turn(0)
+        faces = dice.faces(0, 0)
+        self.assertEqual(dice.roll(2), faces[:2])
+        self.assertEqual(dice.roll(1), faces[2:3])
+        with self.assertRaises(ValueError):
+            dice.roll(1)
+
+    def testDiceStreamRollsForEveryPlayer(self):
+        """Verify Game(dice=...) binds the stream and each turn rolls its seat's faces, not the game rng."""
+        dice = DiceStream(4)
+        game = Game(players=2, seed=1, dice=dice)
+        self.assertIs(game.players[1].dice, dice)
+        game.current_player_index = 1
+        with patch.object(game.rng, 'randint', side_effect=AssertionError("rolled the game rng")):
+            events = game.next_turn(NullDisplay())
+        roll = next(e for e in events if e.type == "roll")
+        self.assertEqual(roll.value, DiceStream(4).faces(1, 0)[0])
+
 if __name__ == "__main__":
     unittest.main(buffer=True)
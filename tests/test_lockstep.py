@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# tests/test_lockstep.py — Tests for the NumPy lock-step Monte Carlo simulator
+
+import random
+import unittest
+
+import lockstep
+from bots import FromageBot, ThoughtfulBot
+from fastgame import CATALOGUE, KIND, FastGame
+
+
+def _offered(*names):
+    row = [[name in names for name in (c.name for c in CATALOGUE)]]
+    return lockstep.np.array(row)
+
+
+def _owned(**counts):
+    row = lockstep.np.zeros((1, len(CATALOGUE)), dtype=int)
+    for name, n in counts.items():
+        row[0, KIND[name.replace("_", " ")]] = n
+    return row
+
+
+@unittest.skipIf(lockstep.np is None, "NumPy not installed")
+class TestPriorityPolicy(unittest.TestCase):
+    """Compiled buy orders choose what the bot classes would."""
+
+    def setUp(self):
+        self.rng = lockstep.np.random.default_rng(0)
+
+    def test_fromage_follows_priority_and_caps(self):
+        """Verify the Fromage order buys Ranch until its cap, then moves on."""
+        policy = lockstep.PriorityPolicy.fromage()
+        offered = _offered("Ranch", "Cheese Factory", "Bakery")
+        self.assertEqual(policy.choose(offered, _owned(Ranch=1), self.rng)[0], KIND["Ranch"])
+        self.assertEqual(policy.choose(offered, _owned(Ranch=3), self.rng)[0], KIND["Cheese Factory"])
+
+    def test_fromage_fallback_matches_bot_for_unlisted_cards(self):
+        """Verify a card missing from the list counts as capped, so the fallback picks among all offered."""
+        bot = FromageBot(name="F")
+        bot.PRIORITY = [("Ranch", 1)]
+        bot.deck.append(CATALOGUE[KIND["Ranch"]].copy())
+        options = [c for c in CATALOGUE if c.name in ("Ranch", "Forest")]
+        bot_picks = set()
+        for seed in range(50):
+            bot.rng = random.Random(seed)
+            bot_picks.add(bot.chooseCard(options))
+        policy = lockstep.PriorityPolicy.fromage(bot.PRIORITY)
+        offered = lockstep.np.repeat(_offered("Ranch", "Forest"), 50, axis=0)
+        owned = lockstep.np.repeat(_owned(Ranch=1), 50, axis=0)
+        policy_picks = {CATALOGUE[k].name for k in policy.choose(offered, owned, self.rng)}
+        self.assertEqual(bot_picks, {"Ranch", "Forest"})
+        self.assertEqual(policy_picks, bot_picks)
+
+    def test_thoughtful_late_cards_need_train_station_and_prereqs(self):
+        """Verify Thoughtful late cards need a Train Station and their factory prerequisites."""
+        policy = lockstep.PriorityPolicy.thoughtful()
+        offered = _offered("Cheese Factory", "Mine", "Forest")
+        self.assertEqual(policy.choose(offered, _owned(), self.rng)[0], KIND["Forest"])
+        with_station = _owned(Train_Station=1)
+        self.assertEqual(policy.choose(offered, with_station, self.rng)[0], KIND["Mine"])
+        offered = _offered("Cheese Factory", "Forest")
+        self.assertEqual(policy.choose(offered, with_station, self.rng)[0], KIND["Forest"])
+        self.assertEqual(policy.choose(offered, _owned(Train_Station=1, Ranch=1), self.rng)[0],
+                         KIND["Cheese Factory"])
+
+    def test_nothing_offered(self):
+        """Verify choose() returns -1 when nothing is offered."""
+        policy = lockstep.PriorityPolicy.thoughtful()
+        self.assertEqual(policy.choose(_offered(), _owned(), self.rng)[0], -1)
+
+    def test_lists_match_bot_classes(self):
+        """Verify compiled policies cover every entry in the bot classes' lists."""
+        self.assertEqual(len(lockstep.PriorityPolicy.fromage().entries), len(FromageBot.PRIORITY))
+        self.assertEqual(len(lockstep.PriorityPolicy.thoughtful().entries),
+                         len(ThoughtfulBot.UPGRADES + ThoughtfulBot.LATE_CARDS + ThoughtfulBot.EARLY_CARDS))
+
+
+@unittest.skipIf(lockstep.np is None, "NumPy not installed")
+class TestSimulate(unittest.TestCase):
+    """Whole runs: every game finishes, seeds reproduce, and results track FastGame."""
+
+    def setUp(self):
+        self.policies = [lockstep.PriorityPolicy.fromage(), lockstep.PriorityPolicy.thoughtful()]
+
+    def test_every_game_has_a_winner(self):
+        """Verify every game finishes and win rates and lengths sum to one."""
+        result = lockstep.simulate(self.policies, games=300, seed=1)
+        self.assertTrue((result.winners >= 0).all())
+        self.assertAlmostEqual(sum(result.win_rates.values()), 1.0)
+        self.assertAlmostEqual(sum(result.length_distribution().values()), 1.0)
+
+    def test_seed_reproduces(self):
+        """Verify the same seed reproduces winners and game lengths."""
+        a = lockstep.simulate(self.policies, games=100, seed=5)
+        b = lockstep.simulate(self.policies, games=100, seed=5)
+        self.assertTrue((a.winners == b.winners).all())
+        self.assertTrue((a.turns == b.turns).all())
+
+    def test_winners_hold_every_landmark(self):
+        """Verify each winner holds all four landmarks."""
+        sim = lockstep.LockstepSimulator(self.policies, games=50, seed=2)
+        result = sim.run()
+        landmarks = [KIND[name] for name in ("Train Station", "Shopping Mall", "Amusement Park", "Radio Tower")]
+        for game, seat in enumerate(result.winners):
+            self.assertTrue((sim.counts[game, seat, landmarks] == 1).all())
+
+    def test_matches_fastgame_statistically(self):
+        """Verify win rates and mean game length track FastGame."""
+        result = lockstep.simulate(self.policies, games=2000, seed=3)
+        random.seed(3)
+        fromage_wins, turns = 0, 0
+        for _ in range(150):
+            game = FastGame([FromageBot(name="F"), ThoughtfulBot(name="T")])
+            fromage_wins += game.run() is game.players[0]
+            turns += game.turn_number
+        self.assertAlmostEqual(result.win_rates["0:FromageBot"], fromage_wins / 150, delta=0.12)
+        self.assertAlmostEqual(result.turns.mean(), turns / 150, delta=4.0)
+
+
+if __name__ == "__main__":
+    unittest.main(buffer=True)
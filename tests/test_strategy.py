@@ -3,15 +3,18 @@
 # tests/test_strategy.py — TDD tests for the strategy.py EV valuation library
 
 import unittest
-from harmonictook import Blue, Green, Red, Stadium, TVStation, BusinessCenter, UpgradeCard, Game
+from unittest.mock import patch
+import strategy
+from harmonictook import Blue, Green, Red, Stadium, TVStation, BusinessCenter, UpgradeCard, Game, Event
 from strategy import (
     ONE_DIE_PROB, TWO_DIE_PROB, P_DOUBLES,
     p_hits, portfolio_ev, portfolio_coverage, delta_ev, delta_coverage,
-    coverage_value, score_purchase_options,
-    _die_pmf, _convolve, _landmark_cost_remaining, _prob_win_in_n_rounds,
+    coverage_value, score_purchase_options, SwapValuer,
+    PMF, _die_pmf, _convolve, _convolve_power, _landmark_cost_remaining, _prob_win_in_n_rounds,
     own_turn_pmf, opponent_turn_pmf, round_pmf,
     pmf_mean, pmf_variance, pmf_percentile, pmf_mass_at_least,
-    prob_victory_within_n_rounds,
+    prob_victory_within_n_rounds, victory_timeline, pmf_cache_info, clear_pmf_cache,
+    income_vectors, card_income_vectors, expected_round_income, StrategyContext,
     tuv_expected, tuv_percentile, tuv_variance, delta_tuv,
 )
 from bots import EVBot, CoverageBot
@@ -346,6 +349,19 @@ class TestScorePurchaseOptions(unittest.TestCase):
         scores = list(result.values())
         self.assertEqual(scores, sorted(scores, reverse=True))
 
+    def test_batched_scores_match_per_card_delta_ev(self):
+        """Sharing baselines across candidates must not change any score, landmarks included."""
+        self.player.deck.append(Green("Cheese Factory", 6, 5, 3, [7], 2))
+        self.player.hasRadioTower = True
+        cards = list({c.name: c for c in self.game.market.deck}.values())
+        cards += [UpgradeCard(name) for name in ("Train Station", "Shopping Mall", "Amusement Park")]
+        result = score_purchase_options(self.player, cards, self.game.players, N=3)
+        for card in cards:
+            with self.subTest(card=card.name):
+                self.assertEqual(
+                    result[card], delta_ev(card, self.player, self.game.players, 3, market_cards=cards)
+                )
+
 
 class TestEVTVStation(unittest.TestCase):
     """EV for TV Station: steal up to 5 from the richest opponent on a 6."""
@@ -450,6 +466,68 @@ class TestEVBusinessCenter(unittest.TestCase):
         card = BusinessCenter()
         self.assertAlmostEqual(delta_ev(card, self.owner, self.game.players), 0.0, places=10)
 
+    def _spite_setup(self):
+        """Owner: Ranch + FatBakery; target: TakeBait + a Cheese Factory that Ranch would feed."""
+        self.owner.deck.deck.clear()
+        self.target.deck.deck.clear()
+        self.owner.hasTrainStation = True
+        self.target.hasTrainStation = True
+        self.ranch = Blue("Ranch", 2, 1, 1, [2])
+        self.fat_bakery = Green("FatBakery", 3, 1, 5, [2])
+        self.take_bait = Blue("TakeBait", 1, 1, 10, [2])
+        for card in (self.ranch, self.fat_bakery):
+            card.owner = self.owner
+            self.owner.deck.append(card)
+        for card in (self.take_bait, Green("Cheese Factory", 6, 5, 3, [7], 2)):
+            card.owner = self.target
+            self.target.deck.append(card)
+
+    def test_swap_valuer_exposes_give_and_take(self):
+        """The valued swap names its cards: spite filter gives FatBakery, not the Ranch."""
+        self._spite_setup()
+        choice = SwapValuer(self.owner, self.game.players).best()
+        self.assertIs(choice.target, self.target)
+        self.assertIs(choice.give, self.fat_bakery)
+        self.assertIs(choice.take, self.take_bait)
+        expected = (delta_ev(self.take_bait, self.owner, self.game.players)
+                    - delta_ev(self.fat_bakery, self.owner, self.game.players))
+        self.assertAlmostEqual(choice.net, expected, places=12)
+
+    def test_evbot_swaps_what_bc_ev_valued(self):
+        self._spite_setup()
+        bot = EVBot(name="E")
+        bot.deck = self.owner.deck
+        bot.hasTrainStation = True
+        result = bot.chooseBusinessCenterSwap(
+            self.target, list(self.owner.deck.deck), list(self.target.deck.deck))
+        self.assertEqual(result, (self.fat_bakery, self.take_bait))
+
+    def test_evbot_values_swap_against_the_full_table(self):
+        """Given a 4-player table, EVBot values the swap against all four players."""
+        game = Game(players=4)
+        bot = EVBot(name="E")
+        game.players[0] = bot
+        target = game.players[1]
+        for card in (Blue("Ranch", 2, 1, 1, [2]), Red("Cafe", 4, 2, 1, [3]), Blue("Forest", 5, 3, 1, [5])):
+            card.owner = target
+            target.deck.append(card)
+        mine, theirs = list(bot.deck.deck), list(target.deck.deck)
+        expected = SwapValuer(bot, game.players, own_cards=mine).best_for(target, theirs)
+        self.assertGreater(expected.net, 0.0)
+        self.assertEqual(bot.chooseBusinessCenterSwap(target, mine, theirs, game.players),
+                         (expected.give, expected.take))
+
+    def test_evbot_declines_losing_swap(self):
+        """Nothing worth taking → decline (None) so the coin payout applies instead."""
+        self._spite_setup()
+        self.target.deck.deck.clear()
+        self.target.deck.append(Green("Dud", 3, 1, 1, [12]))
+        bot = EVBot(name="E")
+        bot.deck = self.owner.deck
+        bot.hasTrainStation = True
+        self.assertIsNone(bot.chooseBusinessCenterSwap(
+            self.target, list(self.owner.deck.deck), list(self.target.deck.deck)))
+
 
 class TestEVBot(unittest.TestCase):
     """EVBot scores Card objects directly; falls back to random when given only string names."""
@@ -713,6 +791,265 @@ class TestConvolveProperties(unittest.TestCase):
         self.assertEqual(set(result.keys()), reachable)
 
 
+class TestPMFContainer(unittest.TestCase):
+    """PMF: dense storage behind a dict-compatible interface; dicts and PMFs interchange freely."""
+
+    def test_dict_round_trip(self):
+        """PMF.from_dict(d).to_dict() reproduces d exactly."""
+        d = {2: 0.25, 5: 0.5, 6: 0.25}
+        self.assertEqual(PMF.from_dict(d).to_dict(), d)
+
+    def test_interior_zeros_are_invisible(self):
+        """Gaps in the dense run do not show up as keys, membership, or length."""
+        pmf = _convolve({1: 0.5, 3: 0.5}, {0: 1.0})
+        self.assertEqual(pmf.keys(), [1, 3])
+        self.assertNotIn(2, pmf)
+        self.assertEqual(len(pmf), 2)
+        self.assertAlmostEqual(pmf.get(2, 0.0), 0.0, places=10)
+        with self.assertRaises(KeyError):
+            pmf[2]
+
+    def test_free_functions_accept_dict_or_pmf(self):
+        """pmf_mean/variance/percentile/mass_at_least agree on a dict and its PMF form."""
+        d = {0: 0.2, 3: 0.5, 7: 0.3}
+        pmf = PMF.from_dict(d)
+        self.assertAlmostEqual(pmf_mean(d), pmf_mean(pmf), places=12)
+        self.assertAlmostEqual(pmf_variance(d), pmf_variance(pmf), places=12)
+        self.assertAlmostEqual(pmf_percentile(d, 0.6), pmf_percentile(pmf, 0.6), places=12)
+        self.assertAlmostEqual(pmf_mass_at_least(d, 3), pmf_mass_at_least(pmf, 3), places=12)
+
+    def test_percentile_search_matches_linear_scan(self):
+        """Binary search on the cached CDF lands where a cumulative scan of the support does."""
+        pmf = _convolve({1: 0.1, 3: 0.4, 4: 0.5}, {0: 0.3, 5: 0.7})
+        for p in (0.0, 0.03, 0.1, 0.25, 0.5, 0.51, 0.9, 1.0, 1.5):
+            with self.subTest(p=p):
+                running, expected = 0.0, float(pmf.keys()[-1])
+                for x, px in pmf.items():
+                    running += px
+                    if running >= p:
+                        expected = float(x)
+                        break
+                if p <= 0.0:
+                    expected = float(pmf.keys()[0])
+                self.assertEqual(pmf_percentile(pmf, p), expected)
+
+    def test_tail_mass_keeps_small_tails(self):
+        """Tail sums accumulate from the top, so a tiny tail under a large head is not lost."""
+        pmf = PMF([1.0 - 1e-18, 1e-18], 0)
+        self.assertEqual(pmf_mass_at_least(pmf, 1), 1e-18)
+        self.assertEqual(pmf_mass_at_least(pmf, 2), 0.0)
+        self.assertEqual(pmf_mass_at_least(pmf, -5), pmf.tails()[0])
+
+    def test_statistics_are_cached(self):
+        pmf = PMF.from_dict({0: 0.2, 3: 0.5, 7: 0.3})
+        self.assertIs(pmf.cdf(), pmf.cdf())
+        self.assertIs(pmf.support(), pmf.support())
+        self.assertEqual(pmf.mean(), pmf_mean(pmf))
+        self.assertEqual(pmf.variance(), pmf_variance(pmf))
+
+    def test_round_pmf_is_pmf(self):
+        game = Game(players=3)
+        self.assertIsInstance(round_pmf(game.players[0], game.players), PMF)
+
+    def test_list_backend_matches_default_backend(self):
+        """With NumPy disabled, convolution falls back to the list loop and gives the same PMF."""
+        a = _die_pmf(2)
+        b = {0: 0.1, 4: 0.3, 9: 0.6}
+        default = _convolve(_convolve(a, b), a)
+        with patch.object(strategy, "np", None):
+            fallback = _convolve(_convolve(a, b), a)
+        self.assertEqual(default.keys(), fallback.keys())
+        for k in default:
+            self.assertAlmostEqual(default[k], fallback[k], places=12)
+
+
+class TestConvolvePower(unittest.TestCase):
+    """_convolve_power: repeated squaring and the FFT path both match n sequential convolutions."""
+
+    def _sequential(self, pmf, n):
+        acc = {0: 1.0}
+        for _ in range(n):
+            acc = _convolve(acc, pmf)
+        return acc
+
+    def _assert_same(self, a, b, places=12):
+        for k in set(a.keys()) | set(b.keys()):
+            self.assertAlmostEqual(a.get(k, 0.0), b.get(k, 0.0), places=places, msg=f"key {k}")
+
+    def test_zero_rounds_is_point_mass_at_zero(self):
+        self.assertEqual(_convolve_power(_die_pmf(1), 0).to_dict(), {0: 1.0})
+
+    def test_matches_sequential_for_odd_and_even_n(self):
+        """n=1..9 covers every squaring branch (odd/even bits, single and multiple squarings)."""
+        pmf = {0: 0.5, 1: 0.2, 4: 0.3}
+        for n in range(1, 10):
+            self._assert_same(_convolve_power(pmf, n), self._sequential(pmf, n))
+
+    def test_three_d6_matches_die_pmf(self):
+        self._assert_same(_convolve_power(_die_pmf(1), 3), _die_pmf(3))
+
+    def test_fft_path_matches_squaring_path(self):
+        """Forcing the FFT threshold down gives the same PMF (to round-off) as repeated squaring."""
+        if strategy.np is None:
+            self.skipTest("NumPy not installed")
+        pmf = {0: 0.4, 2: 0.35, 7: 0.25}
+        exact = _convolve_power(pmf, 12)
+        with patch.object(strategy, "_FFT_MIN_SUPPORT", 1):
+            fft = _convolve_power(pmf, 12)
+        self._assert_same(fft, exact, places=14)
+        self.assertEqual(set(fft.keys()), set(exact.keys()),
+            msg="FFT round-off must not create outcomes that cannot occur")
+
+
+class TestSaturatingConvolution(unittest.TestCase):
+    """cap=: mass at or above the cap collapses into one bucket; everything below is exact."""
+
+    def test_capped_power_matches_uncapped_below_and_at_cap(self):
+        pmf = {0: 0.3, 1: 0.3, 3: 0.4}
+        cap = 7
+        full = _convolve_power(pmf, 9)
+        capped = _convolve_power(pmf, 9, cap=cap)
+        for k in range(cap):
+            self.assertAlmostEqual(capped.get(k, 0.0), full.get(k, 0.0), places=12)
+        self.assertAlmostEqual(capped[cap], pmf_mass_at_least(full, cap), places=12)
+
+    def test_support_bounded_by_cap(self):
+        """However many rounds, a capped sum never spans more than cap + 1 outcomes."""
+        capped = _convolve_power(_die_pmf(2), 40, cap=10)
+        self.assertLessEqual(max(capped.keys()), 10)
+        self.assertAlmostEqual(sum(capped.values()), 1.0, places=10)
+
+    def test_capped_convolve_folds_tail(self):
+        result = _convolve({0: 0.5, 4: 0.5}, {0: 0.5, 4: 0.5}, cap=5)
+        self.assertEqual(result.to_dict(), {0: 0.25, 4: 0.5, 5: 0.25})
+
+    def test_prob_win_matches_uncapped_tail_mass(self):
+        """_prob_win_in_n_rounds (capped) equals the tail mass of the full n-fold sum."""
+        game = Game(players=3)
+        player = game.players[0]
+        player.hasTrainStation = True
+        deficit = _landmark_cost_remaining(player) - player.bank
+        full = _convolve_power(round_pmf(player, game.players), 30)
+        self.assertAlmostEqual(
+            _prob_win_in_n_rounds(player, game.players, 30),
+            pmf_mass_at_least(full, deficit), places=10,
+        )
+
+
+class TestPMFCache(unittest.TestCase):
+    """The PMF cache keys on game-relevant state only: identical states hit, relevant changes miss."""
+
+    def setUp(self):
+        clear_pmf_cache()
+        self.game = Game(players=2)
+        self.player, self.other = self.game.players
+
+    def test_repeated_query_is_a_hit(self):
+        first = round_pmf(self.player, self.game.players)
+        hits_before = pmf_cache_info().hits
+        second = round_pmf(self.player, self.game.players)
+        self.assertIs(first, second)
+        self.assertEqual(pmf_cache_info().hits, hits_before + 1)
+
+    def test_bank_ignored_without_tv_station(self):
+        """Opponent bank cannot change own-turn income unless a TV Station can take it."""
+        first = own_turn_pmf(self.player, self.game.players)
+        self.other.deposit(20)
+        self.assertIs(own_turn_pmf(self.player, self.game.players), first)
+
+    def test_tv_station_keys_on_opponent_bank(self):
+        tv = TVStation()
+        tv.owner = self.player
+        self.player.deck.append(tv)
+        self.other.bank = 1
+        poor = own_turn_pmf(self.player, self.game.players)
+        self.other.bank = 10
+        rich = own_turn_pmf(self.player, self.game.players)
+        self.assertGreater(pmf_mean(rich), pmf_mean(poor))
+
+    def test_same_name_different_stats_do_not_collide(self):
+        """Two cards named alike but paying differently must give different PMFs."""
+        self.player.deck.deck.clear()
+        self.player.deck.append(Blue("Wheat Field", 1, 1, 1, [1]))
+        small = pmf_mean(round_pmf(self.player, self.game.players))
+        self.player.deck.deck.clear()
+        self.player.deck.append(Blue("Wheat Field", 1, 1, 9, [1]))
+        big = pmf_mean(round_pmf(self.player, self.game.players))
+        self.assertAlmostEqual(big, 9 * small, places=10)
+
+    def test_size_is_bounded(self):
+        with patch.object(strategy, "_pmf_cache", strategy._LRUCache(3)):
+            for bank in range(10):
+                self.other.bank = bank
+                red = Red("Cafe", 4, 2, 10, [1, 2, 3, 4, 5, 6])
+                self.player.deck.append(red)
+                round_pmf(self.player, self.game.players)
+            self.assertEqual(pmf_cache_info().currsize, 3)
+
+    def test_clear_resets_counters(self):
+        round_pmf(self.player, self.game.players)
+        clear_pmf_cache()
+        info = pmf_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+class TestIncomeVectors(unittest.TestCase):
+    """Per-roll income vectors: means agree with the PMF path, card vectors are exact marginals."""
+
+    def setUp(self):
+        self.game = Game(players=3)
+        self.player, self.mid, self.last = self.game.players
+        self.player.deck.append(Blue("Ranch", 2, 1, 1, [2]))
+        self.player.deck.append(Green("Cheese Factory", 6, 5, 3, [7], 2))
+        self.player.deck.append(Red("Cafe", 4, 2, 1, [3]))
+        self.mid.deck.append(Blue("Forest", 5, 3, 1, [5]))
+        self.last.bank = 0
+
+    def _assert_mean_matches_pmf(self):
+        vectors = income_vectors(self.player, self.game.players)
+        self.assertAlmostEqual(
+            expected_round_income(vectors, self.player, self.game.players),
+            pmf_mean(round_pmf(self.player, self.game.players)),
+            places=10,
+        )
+
+    def test_mean_matches_round_pmf(self):
+        self._assert_mean_matches_pmf()
+
+    def test_mean_matches_round_pmf_with_landmarks(self):
+        """Radio Tower reweighting, Amusement Park (own and opponent) and Train Station stay exact."""
+        self.player.hasTrainStation = True
+        self.player.hasShoppingMall = True
+        self.player.hasRadioTower = True
+        self.player.hasAmusementPark = True
+        self.mid.hasAmusementPark = True
+        self.mid.hasTrainStation = True
+        self._assert_mean_matches_pmf()
+
+    def test_card_vectors_are_the_marginal(self):
+        """income_vectors(deck + card) == income_vectors(deck) + card_income_vectors(card)."""
+        players = self.game.players
+        for card in (Blue("Ranch", 2, 1, 1, [2]), Red("Cafe", 4, 2, 1, [3]),
+                     Green("Cheese Factory", 6, 5, 3, [7], 2), Stadium(), TVStation()):
+            with self.subTest(card=card.name):
+                predicted = income_vectors(self.player, players) + card_income_vectors(card, self.player, players)
+                self.player.deck.append(card)
+                try:
+                    self.assertEqual(income_vectors(self.player, players), predicted)
+                finally:
+                    self.player.deck.deck.pop()
+
+    def test_red_steal_capped_by_roller_bank(self):
+        vectors = income_vectors(self.player, self.game.players)
+        self.assertEqual(vectors.opponents[0][3], 1)
+        self.assertEqual(vectors.opponents[1][3], 0, "Broke roller has nothing to steal")
+
+    def test_delta_ev_does_not_touch_deck(self):
+        before = list(self.player.deck.deck)
+        delta_ev(Blue("Ranch", 2, 1, 1, [2]), self.player, self.game.players)
+        self.assertEqual(self.player.deck.deck, before)
+
+
 class TestPMFStatsEdgeCases(unittest.TestCase):
     """pmf_mean, pmf_variance, pmf_percentile: edge cases and mathematical invariants."""
 
@@ -1098,6 +1435,114 @@ class TestTUV(unittest.TestCase):
         self.assertAlmostEqual(pmf_mass_at_least(pmf, 5), 0.0, places=10)
 
 
+class TestVictoryTimeline(unittest.TestCase):
+    """victory_timeline: one first-passage pass answers P(win within n) for every n."""
+
+    def setUp(self):
+        self.game = Game(players=3)
+        self.player = self.game.players[0]
+        self.player.deck.append(Blue("Ranch", 2, 1, 1, [2]))
+        self.player.deck.append(Green("Convenience Store", 3, 2, 3, [4]))
+        self.player.hasTrainStation = True
+        self.player.bank = 4
+
+    def test_matches_prob_win_for_every_n(self):
+        timeline = victory_timeline(self.player, self.game, 30)
+        for n in range(31):
+            with self.subTest(n=n):
+                self.assertAlmostEqual(
+                    timeline.p_win_within(n),
+                    _prob_win_in_n_rounds(self.player, self.game.players, n),
+                    places=12,
+                )
+
+    def test_readers_agree_with_distribution(self):
+        timeline = victory_timeline(self.player, self.game, 60)
+        median = timeline.percentile_rounds(0.5)
+        self.assertGreaterEqual(timeline.p_win_within(int(median)), 0.5)
+        self.assertLess(timeline.p_win_within(int(median) - 1), 0.5)
+        self.assertGreater(timeline.expected_rounds(), 0.0)
+        self.assertLessEqual(timeline.expected_rounds(), 61.0)
+
+    def test_beyond_horizon_is_inf(self):
+        timeline = victory_timeline(self.player, self.game, 2)
+        self.assertEqual(timeline.percentile_rounds(0.99), float("inf"))
+        self.assertAlmostEqual(timeline.expected_rounds(), 3.0, places=6)
+
+    def test_no_deficit_wins_at_round_zero(self):
+        self.player.bank = 999
+        timeline = victory_timeline(self.player, self.game, 5)
+        self.assertEqual(timeline.first_passage, [1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(timeline.percentile_rounds(0.5), 0.0)
+
+
+class TestStrategyContext(unittest.TestCase):
+    """StrategyContext: cached per-table building blocks that never go stale."""
+
+    def setUp(self):
+        self.game = Game(players=3)
+        self.player, self.mid, self.last = self.game.players
+        self.ctx = self.game.strategy
+
+    def test_game_owns_one_context(self):
+        self.assertIsInstance(self.ctx, StrategyContext)
+        self.assertIs(self.game.strategy, self.ctx)
+        self.game.reset()
+        self.assertIsNot(self.game.strategy, self.ctx)
+
+    def test_repeat_lookup_is_cached(self):
+        self.assertIs(self.ctx.income_vectors(self.player), self.ctx.income_vectors(self.player))
+        self.assertIs(self.ctx.opponent_turn_pmf(self.player, self.mid),
+                      self.ctx.opponent_turn_pmf(self.player, self.mid))
+
+    def test_direct_deck_edit_is_seen(self):
+        """Stamps catch mutations that bypass events (bots and tests edit decks directly)."""
+        before = self.ctx.income_vectors(self.player)
+        self.player.deck.deck.append(Blue("Mine", 5, 6, 5, [9]))
+        after = self.ctx.income_vectors(self.player)
+        self.assertEqual(after, income_vectors(self.player, self.game.players))
+        self.assertNotEqual(after, before)
+
+    def test_bank_change_reaches_red_income(self):
+        self.player.deck.append(Red("Cafe", 4, 2, 1, [3]))
+        self.mid.bank = 0
+        broke = self.ctx.opponent_turn_pmf(self.player, self.mid)
+        self.mid.bank = 5
+        self.assertGreater(pmf_mean(self.ctx.opponent_turn_pmf(self.player, self.mid)), pmf_mean(broke))
+
+    def test_events_drop_touched_entries(self):
+        self.ctx.category_counts(self.player)
+        self.ctx.category_counts(self.mid)
+        self.ctx.opponent_turn_pmf(self.player, self.mid)
+        self.ctx.observe([Event(type="bc_swap", player=self.mid.name, target=self.last.name)])
+        kept = {(kind, p) for kind, p, _ in self.ctx._entries}
+        self.assertIn(("counts", self.player), kept)
+        self.assertNotIn(("counts", self.mid), kept)
+        self.assertNotIn(("opp", self.player), kept, "Roller's deck or flags may have changed")
+
+    def test_scores_match_without_context(self):
+        self.player.deck.append(Green("Cheese Factory", 6, 5, 3, [7], 2))
+        cards = list({c.name: c for c in self.game.market.deck}.values())
+        cards.append(UpgradeCard("Shopping Mall"))
+        players = self.game.players
+        plain = score_purchase_options(self.player, cards, players, N=2)
+        for _ in range(2):
+            cached = score_purchase_options(self.player, cards, players, N=2, context=self.ctx)
+            self.assertEqual(list(cached.items()), list(plain.items()))
+
+    def test_other_player_list_ignores_context(self):
+        solo = [self.player]
+        ranch = Blue("Ranch", 2, 1, 1, [2])
+        self.assertEqual(delta_ev(ranch, self.player, solo, context=self.ctx), delta_ev(ranch, self.player, solo))
+
+    def test_next_turn_keeps_context_consistent(self):
+        for _ in range(6):
+            self.game.next_turn()
+            self.game.current_player_index = (self.game.current_player_index + 1) % 3
+            for p in self.game.players:
+                self.assertEqual(self.ctx.income_vectors(p), income_vectors(p, self.game.players))
+
+
 class TestTUVPercentileAndVariance(unittest.TestCase):
     """tuv_percentile and tuv_variance: percentile-based and variance-based TUV."""
 
@@ -1224,6 +1669,32 @@ class TestStrategyCoveragePaths(unittest.TestCase):
         self.assertIsInstance(result, float)
         self.assertGreater(result, 0.0)
 
+    def test_delta_coverage_matches_per_value_scan(self):
+        """Bitmask delta_coverage equals the (roller, die value) scan it replaces."""
+        self.player.hasTrainStation = True
+        self.player.deck.append(Red("Cafe", 4, 2, 1, [3]))
+        self.other.deck.append(Blue("Mine", 5, 6, 5, [9]))
+        market = list({c.name: c for c in self.game.market.deck}.values())
+        for card in market:
+            expected = 0.0
+            for roller in self.game.players:
+                table = TWO_DIE_PROB if roller.hasTrainStation else ONE_DIE_PROB
+                for value, prob in table.items():
+                    fires = card.fires_on(value) and (
+                        isinstance(card, Blue)
+                        or (isinstance(card, Red) and roller is not self.player)
+                        or (not isinstance(card, (Blue, Red)) and roller is self.player))
+                    covered = any(
+                        c.fires_on(value) and (
+                            isinstance(c, Blue)
+                            or (isinstance(c, Red) and roller is not self.player)
+                            or (not isinstance(c, (Blue, Red, UpgradeCard)) and roller is self.player))
+                        for c in self.player.deck.deck)
+                    if fires and not covered:
+                        expected += prob
+            with self.subTest(card=card.name):
+                self.assertAlmostEqual(delta_coverage(card, self.player, self.game.players), expected, places=12)
+
     # ------------------------------------------------------------------
     # _turn_multiplier AP branch — exercised via coverage_value
     # ------------------------------------------------------------------
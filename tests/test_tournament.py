@@ -2,19 +2,24 @@
 # -*- coding: UTF-8 -*-
 # tests/test_tournament.py — Tests for the Swiss tournament harness
 
+import gzip
 import json
 import os
+import pickle
 import random
 import tempfile
 import unittest
+from unittest.mock import patch
 
-from harmonictook import Bot, PassBot
+import tournament
+from harmonictook import Bot, DiceStream, PassBot
 from bots import EVBot, ThoughtfulBot
 from tournament import (
     make_evbot,
     TournamentPlayer, RoundResult,
     _seeded_tables, _striped_tables, _avoid_pair_repeats,
-    _run_table, _default_swiss_field,
+    _run_table, _default_swiss_field, play_table, run_swiss_tournament, RecordSink,
+    _play_duplicate, _apply_outcome,
 )
 
 
@@ -206,6 +211,71 @@ class TestWriteGameRecord(unittest.TestCase):
             os.unlink(path)
 
 
+class TestRecordSink(unittest.TestCase):
+    """RecordSink: buffered writes, suffix-driven compression, size-based rotation, and restore."""
+
+    def test_lines_are_buffered_until_flush(self):
+        """Short writes stay in memory until flush(), then land in the file in order."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.txt")
+            sink = RecordSink(path)
+            sink.write("a\n")
+            sink.write("b\n")
+            self.assertFalse(os.path.exists(path))
+            sink.close()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "a\nb\n")
+
+    def test_gzip_suffix_compresses_and_marks_concatenate(self):
+        """A .gz path is gzip-compressed; output written across mark() calls reads back as one stream."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.jsonl.gz")
+            with RecordSink(path) as sink:
+                sink.write("one\n")
+                sink.mark()
+                sink.write("two\n")
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "one\ntwo\n")
+
+    def test_rotation_starts_new_part_past_max_bytes(self):
+        """With max_bytes set, lines go to numbered parts that each stop after reaching max_bytes."""
+        with tempfile.TemporaryDirectory() as directory:
+            with RecordSink(os.path.join(directory, "out.jsonl"), max_bytes=10) as sink:
+                for i in range(5):
+                    sink.write(f"line{i}\n")
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ["out.0001.jsonl", "out.0002.jsonl", "out.0003.jsonl"])
+            with open(os.path.join(directory, "out.0003.jsonl"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "line4\n")
+
+    def test_reopened_compressed_part_rotates_on_its_text_size(self):
+        """A sink reopening a .gz part counts its uncompressed bytes, so rotation happens on time."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.jsonl.gz")
+            with RecordSink(path, max_bytes=10) as sink:
+                sink.write("line0\n")
+            with RecordSink(path, max_bytes=10) as sink:
+                sink.write("line1\n")
+                sink.write("line2\n")
+            self.assertEqual(sorted(os.listdir(directory)), ["out.0001.jsonl.gz", "out.0002.jsonl.gz"])
+            with gzip.open(os.path.join(directory, "out.0002.jsonl.gz"), "rt", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "line2\n")
+
+    def test_restore_truncates_and_drops_later_parts(self):
+        """restore(mark) removes parts begun after the mark and cuts its part back to the marked size."""
+        with tempfile.TemporaryDirectory() as directory:
+            with RecordSink(os.path.join(directory, "out.jsonl"), max_bytes=10) as sink:
+                sink.write("line0\n")
+                mark = sink.mark()
+                for i in range(1, 5):
+                    sink.write(f"line{i}\n")
+                sink.restore(mark)
+                sink.write("again\n")
+            self.assertEqual(os.listdir(directory), ["out.0001.jsonl"])
+            with open(os.path.join(directory, "out.0001.jsonl"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), "line0\nagain\n")
+
+
 class TestDefaultSwissField(unittest.TestCase):
     """_default_swiss_field: 24 players, 3 per family, correct factory types."""
 
@@ -225,5 +295,220 @@ class TestDefaultSwissField(unittest.TestCase):
             self.assertIs(field[i].player_factory, ThoughtfulBot)
 
 
+class TestSeededReplay(unittest.TestCase):
+    """Per-game seeds: a recorded seed replays its game, and a tournament seed reproduces the run."""
+
+    def test_record_seed_replays_game(self):
+        """The seed written to a game record replays the same game through play_table."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            path = f.name
+        try:
+            players = [
+                TournamentPlayer(label="E", player_factory=make_evbot(1)),
+                TournamentPlayer(label="T", player_factory=ThoughtfulBot),
+            ]
+            _run_table(players, records_path=path, seed=1234)
+            with open(path, encoding="utf-8") as f:
+                record = json.loads(f.readline())
+        finally:
+            os.unlink(path)
+        self.assertEqual(record["seed"], 1234)
+        game, instances, _ = play_table(players, seed=record["seed"])
+        self.assertEqual(game.turn_number, record["turns"])
+        for entry in record["players"]:
+            self.assertEqual(instances[entry["label"]].bank, entry["bank"])
+
+    def test_tournament_seed_reproduces_ratings(self):
+        """Two runs with the same seed end with identical ratings whatever the global state."""
+        def ratings(global_seed):
+            random.seed(global_seed)
+            entries = [TournamentPlayer(label=f"{name}{i}", player_factory=factory)
+                       for i in range(6) for name, factory in (("B", Bot), ("T", ThoughtfulBot))]
+            result = run_swiss_tournament(entries, verbose=False, seed=7)
+            return [(tp.label, round(tp.rating, 6)) for tp in result]
+        self.assertEqual(ratings(1), ratings(2))
+
+
+class TestParallelTables(unittest.TestCase):
+    """--jobs: a round's tables on a process pool give the same ratings and files as jobs=1."""
+
+    def _run(self, jobs, directory):
+        entries = [TournamentPlayer(label=f"{name}{i}", player_factory=factory)
+                   for i in range(4) for name, factory in
+                   (("B", Bot), ("T", ThoughtfulBot), ("E", make_evbot(1)))]
+        records = os.path.join(directory, f"records{jobs}.jsonl")
+        stats = os.path.join(directory, f"stats{jobs}.txt")
+        result = run_swiss_tournament(entries, verbose=False, seed=3, jobs=jobs,
+                                      stats_path=stats, records_path=records)
+        with open(records, encoding="utf-8") as r, open(stats, encoding="utf-8") as st:
+            return [(tp.label, tp.rating, tp.rd, tp.scores) for tp in result], r.read(), st.read()
+
+    def test_jobs_match_sequential_run(self):
+        """Ratings, RDs, score lists, records and stats are identical with jobs=1 and jobs=2."""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(self._run(1, directory), self._run(2, directory))
+
+    def test_factories_pickle(self):
+        """Default-field factories survive pickling, so tables can be sent to workers."""
+        for tp in _default_swiss_field():
+            factory = pickle.loads(pickle.dumps(tp.player_factory))
+            self.assertIsInstance(factory("X"), type(tp.player_factory("X")))
+
+
+class TestCheckpointResume(unittest.TestCase):
+    """Round-level checkpoints: an interrupted run resumes to the same results as an uninterrupted one."""
+
+    def _entries(self):
+        return [TournamentPlayer(label=f"{name}{i}", player_factory=factory)
+                for i in range(6) for name, factory in (("B", Bot), ("T", ThoughtfulBot))]
+
+    def _paths(self, directory, tag):
+        return {kind: os.path.join(directory, f"{tag}.{kind}") for kind in ("stats", "records", "ckpt")}
+
+    def _outputs(self, entries, paths):
+        with open(paths["stats"], encoding="utf-8") as st, open(paths["records"], encoding="utf-8") as r:
+            return [(tp.label, tp.rating, tp.rd, tp.scores) for tp in entries], st.read(), r.read()
+
+    def _run(self, entries, paths, n_days, resume=False):
+        return run_swiss_tournament(entries, n_days=n_days, verbose=False, seed=11,
+                                    stats_path=paths["stats"], records_path=paths["records"],
+                                    checkpoint_path=paths["ckpt"], resume=resume)
+
+    def test_resume_after_crash_mid_round_matches_uninterrupted_run(self):
+        """A run killed partway through a round, then resumed, writes identical ratings, stats and records."""
+        with tempfile.TemporaryDirectory() as directory:
+            whole = self._paths(directory, "whole")
+            expected = self._outputs(self._run(self._entries(), whole, n_days=2), whole)
+
+            broken = self._paths(directory, "broken")
+            real_apply = tournament._apply_outcome
+            calls = []
+
+            def crash_mid_round(*args, **kwargs):
+                calls.append(1)
+                if len(calls) == 22:            # day 1 has 19 tables; third table of day 2
+                    raise KeyboardInterrupt
+                return real_apply(*args, **kwargs)
+
+            with patch("tournament._apply_outcome", side_effect=crash_mid_round):
+                with self.assertRaises(KeyboardInterrupt):
+                    self._run(self._entries(), broken, n_days=2)
+            resumed = self._run(self._entries(), broken, n_days=2, resume=True)
+            self.assertEqual(self._outputs(resumed, broken), expected)
+
+    def test_resume_can_extend_a_finished_run(self):
+        """Resuming a finished 1-day run with n_days=2 matches a straight 2-day run."""
+        with tempfile.TemporaryDirectory() as directory:
+            whole = self._paths(directory, "whole")
+            expected = self._outputs(self._run(self._entries(), whole, n_days=2), whole)
+            staged = self._paths(directory, "staged")
+            self._run(self._entries(), staged, n_days=1)
+            self.assertEqual(self._outputs(self._run(self._entries(), staged, n_days=2, resume=True), staged),
+                             expected)
+
+    def test_resume_with_compressed_rotated_output_matches_uninterrupted_run(self):
+        """Crash and resume with gzip, rotated records split into the same parts with the same contents."""
+        def read_parts(directory, tag):
+            parts = {}
+            for name in sorted(n for n in os.listdir(directory) if n.startswith(f"{tag}.0")):
+                with gzip.open(os.path.join(directory, name), "rt", encoding="utf-8") as f:
+                    parts[name[len(tag):]] = f.read()
+            return parts
+
+        def run(directory, tag, resume=False):
+            return run_swiss_tournament(self._entries(), n_days=2, verbose=False, seed=11,
+                                        records_path=os.path.join(directory, f"{tag}.jsonl.gz"),
+                                        checkpoint_path=os.path.join(directory, f"{tag}.ckpt"),
+                                        resume=resume, max_bytes=4096)
+
+        with tempfile.TemporaryDirectory() as directory:
+            run(directory, "whole")
+            expected = read_parts(directory, "whole")
+            self.assertGreater(len(expected), 2)
+
+            real_apply = tournament._apply_outcome
+            calls = []
+
+            def crash_mid_round(*args, **kwargs):
+                calls.append(1)
+                if len(calls) == 22:
+                    raise KeyboardInterrupt
+                return real_apply(*args, **kwargs)
+
+            with patch("tournament._apply_outcome", side_effect=crash_mid_round):
+                with self.assertRaises(KeyboardInterrupt):
+                    run(directory, "broken")
+            run(directory, "broken", resume=True)
+            self.assertEqual(read_parts(directory, "broken"), expected)
+
+    def test_checkpoint_for_other_field_is_rejected(self):
+        """A checkpoint written for different entries raises ValueError instead of resuming."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self._paths(directory, "run")
+            self._run(self._entries(), paths, n_days=1)
+            others = [TournamentPlayer(label=f"X{i}", player_factory=Bot) for i in range(12)]
+            with self.assertRaises(ValueError):
+                self._run(others, paths, n_days=2, resume=True)
+
+
+class TestDuplicateFormat(unittest.TestCase):
+    """Duplicate tables: every seat rotation on the same dice, rated on paired results."""
+
+    def test_each_rotation_is_a_deal_on_the_same_dice(self):
+        """A 3-entry table gives 3 deals, each with rotated seats and the table's dice seed."""
+        players = [TournamentPlayer(label=lbl, player_factory=ThoughtfulBot) for lbl in "ABC"]
+        deals = _play_duplicate(players, seed=21, with_record=True)
+        self.assertEqual([[p["label"] for p in d.record["players"]] for d in deals],
+                         [["A", "B", "C"], ["B", "C", "A"], ["C", "A", "B"]])
+        self.assertEqual({d.record["dice_seed"] for d in deals}, {21})
+
+    def test_each_seat_rolls_the_same_faces_whoever_sits_there(self):
+        """Different bots in a seat across rotations roll that seat's faces turn for turn."""
+        streams = []
+
+        class LoggedDice(DiceStream):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.rolls: dict[tuple[int, int, int], list[int]] = {}
+                streams.append(self)
+
+            def roll(self, n_dice):
+                attempt = self._attempt
+                faces = super().roll(n_dice)
+                self.rolls[(self.seat, self.turn, attempt)] = faces
+                return faces
+
+        players = [TournamentPlayer(label="T", player_factory=ThoughtfulBot),
+                   TournamentPlayer(label="E", player_factory=make_evbot(1))]
+        with patch("tournament.DiceStream", LoggedDice):
+            _play_duplicate(players, seed=21)
+        first, second = (stream.rolls for stream in streams)
+        self.assertTrue(any(len(faces) == 2 for faces in first.values()))      # Train Station rolls happen
+        for key in first.keys() & second.keys():
+            n = min(len(first[key]), len(second[key]))
+            self.assertEqual(first[key][:n], second[key][:n], key)
+        for seat in (0, 1):
+            self.assertTrue(any(key[0] == seat for key in first.keys() & second.keys()))
+
+    def test_mirror_deals_cancel_dice_luck(self):
+        """Identical bots split a two-seat duplicate table evenly, so equal ratings stay equal."""
+        players = [TournamentPlayer(label=lbl, player_factory=ThoughtfulBot) for lbl in "AB"]
+        deals = _play_duplicate(players, seed=5)
+        self.assertEqual(deals[0].scores, {"A": deals[1].scores["B"], "B": deals[1].scores["A"]})
+        _apply_outcome(players, deals)
+        self.assertAlmostEqual(players[0].rating, players[1].rating)
+        self.assertEqual(len(players[0].scores), 2)
+
+    def test_duplicate_checkpoint_is_not_resumed_as_plain(self):
+        """Resuming a duplicate run without duplicate=True raises ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            ckpt = os.path.join(directory, "run.ckpt")
+            entries = [TournamentPlayer(label=f"B{i}", player_factory=Bot) for i in range(12)]
+            result = run_swiss_tournament(entries, verbose=False, seed=2, checkpoint_path=ckpt, duplicate=True)
+            self.assertTrue(all(len(tp.scores) == 2 + 2 + 3 + 4 for tp in result))   # one score per deal
+            with self.assertRaises(ValueError):
+                run_swiss_tournament(entries, n_days=2, verbose=False, seed=2, checkpoint_path=ckpt, resume=True)
+
+
 if __name__ == "__main__":
     unittest.main(buffer=True)
@@ -11,18 +11,31 @@
 #   python tournament.py --days 20           # 20 days of Swiss
 #   python tournament.py --records out.jsonl # also export per-game JSONL records
 #   python tournament.py --stats out.txt     # also export per-game stats summary
+#   python tournament.py --records out.jsonl.gz --rotate-mb 256  # gzip, 256 MB parts
+#   python tournament.py --days 20 --jobs 8  # play each round's tables on 8 processes
+#   python tournament.py --days 5 --duplicate  # every seat rotation on the same dice
+#   python tournament.py --days 100 --checkpoint run.ckpt           # save state every round
+#   python tournament.py --days 100 --checkpoint run.ckpt --resume  # continue after a crash
 
 from __future__ import annotations
 
 import argparse
+import bz2
+import gzip
 import json
+import lzma
 import math
+import os
 import random
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import repeat
 from typing import Callable
 
-from harmonictook import Bot, Game, Player, PlayerDeck, RecordingDisplay, UpgradeCard
+from harmonictook import Bot, DiceStream, Game, HistoryPolicy, PayoutTallyDisplay, Player, PlayerDeck, UpgradeCard
 from bots import EVBot, FromageBot, ImpatientBot, KinematicBot, MarathonBot, ThoughtfulBot, CoverageBot  # noqa: F401 (re-exported for callers)
 from strategy import pmf_mean, round_pmf, tuv_expected
 
@@ -97,29 +110,144 @@ def finish_score(player: Player, game: Game) -> int:
     return int(round(50.0 - eruv))
 
 
+# Factories are partials rather than closures so tables can be pickled to worker processes
+
 def make_evbot(n_horizon: int) -> Callable[[str], EVBot]:
     """Return a factory that creates an EVBot with the given planning horizon."""
-    def factory(name: str) -> EVBot:
-        return EVBot(name=name, n_horizon=n_horizon)
-    return factory
+    return partial(EVBot, n_horizon=n_horizon)
 
 
 def make_kinematic_bot(a: float, eruv_offset: int) -> Callable[[str], KinematicBot]:
     """Return a factory that creates a KinematicBot with the given parameters."""
-    def factory(name: str) -> KinematicBot:
-        return KinematicBot(name=name, a=a, eruv_offset=eruv_offset)
-    factory.__name__ = f"KinematicBot(a={a},o={eruv_offset:+d})"
+    factory = partial(KinematicBot, a=a, eruv_offset=eruv_offset)
+    factory.__name__ = f"KinematicBot(a={a},o={eruv_offset:+d})"  # type: ignore[attr-defined]
     return factory
 
 
-def _write_game_record(
-    records_path: str,
+_COMPRESSORS: dict[str, Callable] = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+class RecordSink:
+    """Buffered, optionally compressed and rotated line writer for stats and JSONL records.
+
+    Compression follows the path suffix (.gz, .bz2 or .xz). With max_bytes set, output
+    goes to numbered parts (out.0001.jsonl.gz, out.0002.jsonl.gz, ...), starting a new
+    part once the current one holds max_bytes of uncompressed text. Like the plain
+    append it replaces, a sink continues an existing file (or the last existing part).
+
+    Lines are buffered in memory and written in one call per buffer_size bytes.
+    mark() flushes and closes the compressed stream, so the returned position is a
+    clean cut point for restore(); the next write opens a new gzip/bz2/xz member in
+    append mode, which readers concatenate transparently.
+    """
+
+    def __init__(self, path: str, max_bytes: int | None = None, buffer_size: int = 1 << 16) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        root, self._compression = os.path.splitext(path)
+        if self._compression not in _COMPRESSORS:
+            root, self._compression = path, ""
+        self._root, self._ext = os.path.splitext(root)
+        self.part = 0
+        if max_bytes is not None:
+            self.part = 1
+            while os.path.exists(self.part_path(self.part + 1)):
+                self.part += 1
+        self._part_bytes = self._text_size(self.part_path(self.part))  # uncompressed bytes in the part
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._file = None
+
+    def part_path(self, part: int) -> str:
+        """Path of the given part (part 0 is the unrotated path itself)."""
+        if part == 0:
+            return self.path
+        return f"{self._root}.{part:04d}{self._ext}{self._compression}"
+
+    def _text_size(self, path: str) -> int:
+        """Uncompressed size of an existing part (0 if it does not exist)."""
+        if not os.path.exists(path):
+            return 0
+        if not self._compression:
+            return os.path.getsize(path)
+        size = 0
+        with _COMPRESSORS[self._compression](path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                size += len(chunk)
+        return size
+
+    def write(self, line: str) -> None:
+        """Queue one line (newline included) for writing."""
+        if self.max_bytes is not None and self._part_bytes >= self.max_bytes:
+            self._close_part()
+            self.part += 1
+            self._part_bytes = 0
+        data = line.encode("utf-8")
+        self._pending.append(data)
+        self._pending_size += len(data)
+        self._part_bytes += len(data)
+        if self._pending_size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything queued so far to the current part."""
+        if not self._pending:
+            return
+        if self._file is None:
+            opener = _COMPRESSORS.get(self._compression, open)
+            self._file = opener(self.part_path(self.part), "ab")
+        self._file.write(b"".join(self._pending))
+        self._pending.clear()
+        self._pending_size = 0
+
+    def _close_part(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def mark(self) -> list[int]:
+        """Flush, finish the current compressed stream, and return [part, size on disk, text bytes].
+
+        text bytes is the part's uncompressed size, so a restored sink rotates at the
+        same points as one that was never interrupted.
+        """
+        self._close_part()
+        current = self.part_path(self.part)
+        return [self.part, os.path.getsize(current) if os.path.exists(current) else 0, self._part_bytes]
+
+    def restore(self, mark: list[int]) -> None:
+        """Cut output back to a mark() position: truncate that part and delete later parts."""
+        self._close_part()
+        part, size, text_bytes = mark
+        later = part + 1
+        while self.max_bytes is not None and os.path.exists(self.part_path(later)):
+            os.remove(self.part_path(later))
+            later += 1
+        current = self.part_path(part)
+        if os.path.exists(current) and os.path.getsize(current) > size:
+            os.truncate(current, size)
+        self.part = part
+        self._part_bytes = text_bytes
+
+    def close(self) -> None:
+        self._close_part()
+
+    def __enter__(self) -> RecordSink:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _game_record(
     game: Game,
     instances: dict[str, Player],
     scores: dict[str, int],
-    all_events: list,
-) -> None:
-    """Append one JSONL record describing the end state of a completed game.
+    payouts: dict[str, dict[str, dict[str, int]]],
+) -> dict:
+    """Build the JSONL record describing the end state of a completed game.
 
     Each line is a compact JSON object with top-level game metadata and a 'players'
     list. Landmarks are separated from income cards so downstream queries can filter
@@ -127,17 +255,8 @@ def _write_game_record(
 
     Per-player fields:
       income_ev     — mean coins per round at game end (for acceleration analysis)
-      card_payouts  — {card_name: {fires, total}} aggregated from game events
+      card_payouts  — {card_name: {fires, total}} from the game's PayoutTallyDisplay
     """
-    payout_types = {"payout", "steal", "collect"}
-    by_player: dict[str, dict[str, dict[str, int]]] = {lbl: {} for lbl in instances}
-    for ev in all_events:
-        if ev.type not in payout_types or not ev.card or ev.player not in by_player:
-            continue
-        entry = by_player[ev.player].setdefault(ev.card, {"fires": 0, "total": 0})
-        entry["fires"] += 1
-        entry["total"] += ev.value
-
     player_records = []
     for label, player in instances.items():
         landmarks = sorted(c.name for c in player.deck.deck if isinstance(c, UpgradeCard))
@@ -154,52 +273,151 @@ def _write_game_record(
             "landmarks": landmarks,
             "deck": deck_counts,
             "income_ev": round(income_ev, 4),
-            "card_payouts": by_player[label],
+            "card_payouts": payouts.get(label, {}),
         })
     record = {
+        "seed": game.seed,
         "turns": game.turn_number,
         "n_players": len(game.players),
         "players": player_records,
     }
-    with open(records_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    if game.dice is not None:
+        record["dice_seed"] = game.dice.seed
+    return record
 
 
-def _run_table(
-    players: list[TournamentPlayer],
-    stats_path: str | None = None,
-    records_path: str | None = None,
-) -> RoundResult:
-    """Run one game; update Glicko rating+RD and scores in place; return the round result."""
-    n = len(players)
+def _write_game_record(
+    records: RecordSink,
+    game: Game,
+    instances: dict[str, Player],
+    scores: dict[str, int],
+    payouts: dict[str, dict[str, dict[str, int]]],
+) -> None:
+    """Write one JSONL record (see _game_record) for a completed game to the records sink."""
+    _write_record(records, _game_record(game, instances, scores, payouts))
+
+
+def _write_record(records: RecordSink, record: dict) -> None:
+    records.write(json.dumps(record, separators=(",", ":")) + "\n")
 
-    game = Game(players=n)
+
+def play_table(
+    players: list[TournamentPlayer],
+    seed: int | None = None,
+    dice_seed: int | None = None,
+) -> tuple[Game, dict[str, Player], PayoutTallyDisplay]:
+    """Play one game with a fresh instance per entry, in seat order; ratings are untouched.
+
+    The game draws from its own stream seeded with seed, so passing the seed stored in a
+    game record (with the same entries in the same seats) replays that game exactly.
+    With dice_seed set, dice come from DiceStream(dice_seed) instead (see duplicate play).
+    Returns the finished game, the label -> player map, and the payout tally.
+    """
+    dice = DiceStream(dice_seed) if dice_seed is not None else None
+    # Nothing reads per-turn snapshots after a tournament game, so skip building them
+    game = Game(players=len(players), history=HistoryPolicy("off"), seed=seed, dice=dice)
     instances: dict[str, Player] = {}
     for i, tp in enumerate(players):
         p = tp.player_factory(tp.label)
         p.deck = PlayerDeck(p)
         game.players[i] = p
         instances[tp.label] = p
-    recorder = RecordingDisplay()
-    game.run(display=recorder)
+    tally = PayoutTallyDisplay()
+    game.run(display=tally)
+    return game, instances, tally
+
+
+@dataclass
+class TableOutcome:
+    """A finished table as reported back from play (possibly in a worker process)."""
+    seed: int | None
+    turns: int
+    scores: dict[str, int]            # label → finish_score
+    record: dict | None = None        # JSONL record, built only when records are written
 
-    scores: dict[str, int] = {tp.label: finish_score(instances[tp.label], game) for tp in players}
 
-    if stats_path is not None:
-        player_scores = "  ".join(f"{tp.label}={scores[tp.label]}" for tp in players)
-        with open(stats_path, "a", encoding="utf-8") as f:
-            f.write(f"turns={game.turn_number}  n={n}  {player_scores}\n")
+def _play_outcome(
+    players: list[TournamentPlayer],
+    seed: int | None = None,
+    with_record: bool = False,
+    dice_seed: int | None = None,
+) -> TableOutcome:
+    """Play one table and reduce it to picklable results; ratings are untouched."""
+    game, instances, tally = play_table(players, seed, dice_seed)
+    scores = {tp.label: finish_score(instances[tp.label], game) for tp in players}
+    record = _game_record(game, instances, scores, tally.payouts) if with_record else None
+    return TableOutcome(seed=game.seed, turns=game.turn_number, scores=scores, record=record)
+
+
+def _play_duplicate(
+    players: list[TournamentPlayer],
+    seed: int | None = None,
+    with_record: bool = False,
+) -> list[TableOutcome]:
+    """Play a table once per seat rotation, every deal on the same dice; ratings are untouched.
+
+    Like duplicate bridge: DiceStream fixes each seat's faces turn by turn, and deal k
+    puts entry (j + k) mod n in seat j, so every entry plays every seat's dice and every
+    turn-order position. Each deal also shares the decision stream seed, so random
+    tie-breaks repeat.
+    """
+    if seed is None:
+        seed = random.getrandbits(63)
+    return [_play_outcome(players[k:] + players[:k], seed, with_record, dice_seed=seed)
+            for k in range(len(players))]
 
-    if records_path is not None:
-        _write_game_record(records_path, game, instances, scores, recorder.events)
+
+def _run_table(
+    players: list[TournamentPlayer],
+    stats_path: str | None = None,
+    records_path: str | None = None,
+    seed: int | None = None,
+) -> RoundResult:
+    """Run one game; update Glicko rating+RD and scores in place; return the round result."""
+    outcome = _play_outcome(players, seed, with_record=records_path is not None)
+    with ExitStack() as stack:
+        stats = stack.enter_context(RecordSink(stats_path)) if stats_path is not None else None
+        records = stack.enter_context(RecordSink(records_path)) if records_path is not None else None
+        return _apply_outcome(players, outcome, stats, records)
+
+
+def _apply_outcome(
+    players: list[TournamentPlayer],
+    outcome: TableOutcome | list[TableOutcome],
+    stats: RecordSink | None = None,
+    records: RecordSink | None = None,
+) -> RoundResult:
+    """Write a played table's stats and record, then apply its Glicko updates in place.
+
+    outcome may be the list of deals from _play_duplicate. Each deal is written out, and
+    each pair of entries is then rated once on the share of deals the first outscored
+    the second, so a duplicate table moves ratings as one paired game, not n games.
+    """
+    n = len(players)
+    deals = outcome if isinstance(outcome, list) else [outcome]
+
+    for deal in deals:
+        if stats is not None:
+            player_scores = "  ".join(f"{tp.label}={deal.scores[tp.label]}" for tp in players)
+            stats.write(f"turns={deal.turns}  n={n}  seed={deal.seed}  {player_scores}\n")
+        if records is not None and deal.record is not None:
+            _write_record(records, deal.record)
+
+    if len(deals) == 1:
+        scores = deals[0].scores
+    else:
+        scores = {tp.label: round(sum(d.scores[tp.label] for d in deals) / len(deals)) for tp in players}
 
     # Build per-player opponent result lists using pre-game ratings (snapshot before any update)
     result_lists: dict[str, list[tuple[float, float, float]]] = {tp.label: [] for tp in players}
     for i in range(n):
         for j in range(i + 1, n):
             a, b = players[i], players[j]
-            sa, sb = scores[a.label], scores[b.label]
-            s_a = 1.0 if sa > sb else (0.5 if sa == sb else 0.0)
+            s_a = 0.0
+            for deal in deals:
+                sa, sb = deal.scores[a.label], deal.scores[b.label]
+                s_a += 1.0 if sa > sb else (0.5 if sa == sb else 0.0)
+            s_a /= len(deals)
             s_b = 1.0 - s_a
             result_lists[a.label].append((b.rating, b.rd, s_a))
             result_lists[b.label].append((a.rating, a.rd, s_b))
@@ -210,7 +428,7 @@ def _run_table(
         deltas[tp.label] = new_r - tp.rating
         tp.rating = new_r
         tp.rd = new_rd
-        tp.scores.append(scores[tp.label])
+        tp.scores.extend(deal.scores[tp.label] for deal in deals)
 
     finish_order = sorted(players, key=lambda tp: -scores[tp.label])
     return RoundResult(
@@ -278,12 +496,110 @@ def print_standings(players: list[TournamentPlayer], after_round: int) -> None:
     print()
 
 
+_CHECKPOINT_VERSION: int = 4
+
+
+def _save_checkpoint(
+    path: str,
+    entries: list[TournamentPlayer],
+    rng: random.Random,
+    next_round: tuple[int, int],
+    total_rounds: int,
+    recent: dict[str, set[str]],
+    outputs: dict[str, RecordSink],
+    duplicate: bool = False,
+) -> None:
+    """Atomically write everything needed to resume before next_round (day, round).
+
+    outputs maps "stats"/"records" to their sinks; each sink's mark() is stored so a
+    resume can cut off lines a crashed round wrote after this checkpoint and carry on
+    rotating exactly where the uninterrupted run would.
+    """
+    version, internal, gauss = rng.getstate()
+    state = {
+        "version": _CHECKPOINT_VERSION,
+        "next_round": list(next_round),
+        "total_rounds": total_rounds,
+        "duplicate": duplicate,
+        "rng": [version, list(internal), gauss],
+        "recent": {label: sorted(opponents) for label, opponents in recent.items()},
+        "players": [{"label": tp.label, "rating": tp.rating, "rd": tp.rd, "scores": tp.scores}
+                    for tp in entries],
+        "outputs": {kind: sink.mark() for kind, sink in outputs.items()},
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _load_checkpoint(
+    path: str,
+    entries: list[TournamentPlayer],
+    outputs: dict[str, RecordSink],
+    duplicate: bool = False,
+) -> dict:
+    """Restore ratings, RDs and scores onto entries from a checkpoint; return the saved state.
+
+    Raises ValueError if the checkpoint is from another format version, field or play
+    format (duplicate or not). Output sinks are cut back to their positions at checkpoint time.
+    """
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != _CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version: {state.get('version')!r}")
+    saved = state["players"]
+    if [p["label"] for p in saved] != [tp.label for tp in entries]:
+        raise ValueError("checkpoint was written for a different tournament field")
+    if state["duplicate"] != duplicate:
+        raise ValueError(f"checkpoint was written with duplicate={state['duplicate']}")
+    for tp, p in zip(entries, saved):
+        tp.rating, tp.rd, tp.scores = p["rating"], p["rd"], list(p["scores"])
+    for kind, sink in outputs.items():
+        if kind in state["outputs"]:
+            sink.restore(state["outputs"][kind])
+    return state
+
+
+_ROUND_FORMATS: tuple[str, ...] = ("Seeded pairs", "Seeded pairs", "Seeded triples", "Seeded quads")
+
+
+def _round_tables(
+    entries: list[TournamentPlayer],
+    day: int,
+    rnd: int,
+    rng: random.Random,
+    recent: dict[str, set[str]],
+) -> list[list[TournamentPlayer]]:
+    """Build the tables for round rnd (1-4) of the given day."""
+    if rnd == 1:
+        # Random on day 1, seeded thereafter
+        if day == 1:
+            shuffled = list(entries)
+            rng.shuffle(shuffled)
+            return [shuffled[i:i + 2] for i in range(0, len(shuffled), 2)]
+        return _seeded_tables(entries, 2)
+    if rnd == 2:
+        # Seeded pairs, avoiding same-day round-1 rematches
+        return _avoid_pair_repeats(_seeded_tables(entries, 2), recent)
+    if rnd == 3:
+        return _seeded_tables(entries, 3)
+    # Striped quads: ranks 1,4,7,10 / 2,5,8,11 / 3,6,9,12
+    return _striped_tables(entries, 4)
+
+
 def run_swiss_tournament(
     entries: list[TournamentPlayer],
     n_days: int = 1,
     verbose: bool = True,
     stats_path: str | None = None,
     records_path: str | None = None,
+    seed: int | None = None,
+    jobs: int = 1,
+    checkpoint_path: str | None = None,
+    resume: bool = False,
+    max_bytes: int | None = None,
+    duplicate: bool = False,
 ) -> list[TournamentPlayer]:
     """Run n_days x 4-round Swiss tournament; return players sorted by final rating.
 
@@ -295,13 +611,49 @@ def run_swiss_tournament(
 
     Field is padded to a multiple of 12 with random-bot fillers if needed.
     Rating and score state is mutated in place on each TournamentPlayer.
+
+    Pairings draw from a stream seeded with seed (from the global random module when
+    None), and every table gets its own game seed from that stream; the seed is
+    written to stats and records so any single game can be replayed with play_table.
+
+    With jobs > 1 each round's tables are played on a pool of that many processes.
+    Tables in a round share no players, seeds are drawn before play, and results are
+    applied in table order, so ratings and output files match a jobs=1 run.
+
+    With checkpoint_path set, the full tournament state (ratings, RDs, score lists, RNG
+    state and the day/round cursor) is saved after every round. resume=True continues
+    from that checkpoint, with the same entries and output paths, and produces the same
+    ratings, stats and records as an uninterrupted run; n_days may be raised to extend it.
+
+    Stats and records go through one RecordSink each in this process (workers only
+    return records), so writes are buffered, compressed by path suffix, and split into
+    parts of max_bytes when it is set.
+
+    duplicate=True plays every table once per seat rotation on the same dice (see
+    _play_duplicate) and rates entries on those paired results: n games per table,
+    each rating update less noisy than one game's.
     """
     filler_n = 0
     while len(entries) % 12 != 0:
         filler_n += 1
         entries.append(TournamentPlayer(label=f"Random{filler_n}", player_factory=Bot))
 
-    total_rounds = 0
+    rng = random.Random(seed if seed is not None else random.getrandbits(64))
+    with_record = records_path is not None
+    stats = RecordSink(stats_path, max_bytes) if stats_path is not None else None
+    records = RecordSink(records_path, max_bytes) if records_path is not None else None
+    outputs = {kind: sink for kind, sink in (("stats", stats), ("records", records)) if sink is not None}
+    start_day, start_round, total_rounds = 1, 1, 0
+    recent: dict[str, set[str]] = {}
+    if resume:
+        if checkpoint_path is None:
+            raise ValueError("resume=True needs a checkpoint_path")
+        state = _load_checkpoint(checkpoint_path, entries, outputs, duplicate)
+        version, internal, gauss = state["rng"]
+        rng.setstate((version, tuple(internal), gauss))
+        start_day, start_round = state["next_round"]
+        total_rounds = state["total_rounds"]
+        recent = {label: set(opponents) for label, opponents in state["recent"].items()}
 
     def _print_round(rn: int, fmt: str, results: list[RoundResult]) -> None:
         print(f"\n{'=' * 56}")
@@ -313,57 +665,44 @@ def run_swiss_tournament(
             print(f"  Finish:    {finish_str}")
             print(f"  Rating d:  {delta_str}")
 
-    for day in range(1, n_days + 1):
-        if verbose and n_days > 1:
-            print(f"\n{'#' * 56}")
-            print(f"  Day {day} of {n_days}")
-            print(f"{'#' * 56}")
-
-        # Round 1 — random on day 1, seeded thereafter
-        if day == 1:
-            shuffled = list(entries)
-            random.shuffle(shuffled)
-            r1_tables = [shuffled[i:i + 2] for i in range(0, len(shuffled), 2)]
-        else:
-            r1_tables = _seeded_tables(entries, 2)
-        r1_results = [_run_table(t, stats_path, records_path) for t in r1_tables]
-        total_rounds += 1
-
-        # Build same-day round-1 opponent map for deconflict in round 2
-        recent: dict[str, set[str]] = {}
-        for table in r1_tables:
-            for tp in table:
-                recent[tp.label] = {o.label for o in table if o.label != tp.label}
-
-        if verbose:
-            fmt1 = "Random pairs" if day == 1 else "Seeded pairs"
-            _print_round(total_rounds, fmt1, r1_results)
-            print_standings(entries, total_rounds)
-
-        # Round 2 — seeded pairs, avoid same-day round-1 rematches
-        r2_tables = _seeded_tables(entries, 2)
-        r2_tables = _avoid_pair_repeats(r2_tables, recent)
-        r2_results = [_run_table(t, stats_path, records_path) for t in r2_tables]
-        total_rounds += 1
-        if verbose:
-            _print_round(total_rounds, "Seeded pairs", r2_results)
-            print_standings(entries, total_rounds)
-
-        # Round 3 — seeded triples
-        r3_tables = _seeded_tables(entries, 3)
-        r3_results = [_run_table(t, stats_path, records_path) for t in r3_tables]
-        total_rounds += 1
-        if verbose:
-            _print_round(total_rounds, "Seeded triples", r3_results)
-            print_standings(entries, total_rounds)
-
-        # Round 4 — striped quads: ranks 1,4,7,10 / 2,5,8,11 / 3,6,9,12
-        r4_tables = _striped_tables(entries, 4)
-        r4_results = [_run_table(t, stats_path, records_path) for t in r4_tables]
-        total_rounds += 1
-        if verbose:
-            _print_round(total_rounds, "Seeded quads", r4_results)
-            print_standings(entries, total_rounds)
+    with ExitStack() as stack:
+        for sink in outputs.values():
+            stack.enter_context(sink)
+        executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs)) if jobs > 1 else None
+        for day in range(start_day, n_days + 1):
+            if verbose and n_days > 1:
+                print(f"\n{'#' * 56}")
+                print(f"  Day {day} of {n_days}")
+                print(f"{'#' * 56}")
+
+            for rnd in range(start_round if day == start_day else 1, 5):
+                tables = _round_tables(entries, day, rnd, rng, recent)
+                seeds = [rng.getrandbits(63) for _ in tables]
+                play = _play_duplicate if duplicate else _play_outcome
+                if executor is None:
+                    outcomes = [play(t, s, with_record) for t, s in zip(tables, seeds)]
+                else:
+                    # Ship bare entries: workers need labels and factories, not rating history
+                    bare = [[TournamentPlayer(label=tp.label, player_factory=tp.player_factory) for tp in t]
+                            for t in tables]
+                    outcomes = list(executor.map(play, bare, seeds, repeat(with_record)))
+                results = [_apply_outcome(t, o, stats, records) for t, o in zip(tables, outcomes)]
+                total_rounds += 1
+
+                if rnd == 1:
+                    # Same-day round-1 opponent map, for deconflicting round 2
+                    recent = {tp.label: {o.label for o in table if o.label != tp.label}
+                              for table in tables for tp in table}
+
+                if checkpoint_path is not None:
+                    next_round = (day, rnd + 1) if rnd < 4 else (day + 1, 1)
+                    _save_checkpoint(checkpoint_path, entries, rng, next_round, total_rounds, recent, outputs,
+                                     duplicate)
+
+                if verbose:
+                    fmt = "Random pairs" if (day, rnd) == (1, 1) else _ROUND_FORMATS[rnd - 1]
+                    _print_round(total_rounds, fmt, results)
+                    print_standings(entries, total_rounds)
 
     return sorted(entries, key=lambda tp: -tp.rating)
 
@@ -424,13 +763,26 @@ def main() -> None:
                         help="append per-game JSONL records (decks, ERUV, bot type) to FILE")
     parser.add_argument("--seed", type=int, default=None, metavar="N",
                         help="random seed for reproducible tournament runs")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="play each round's tables on N worker processes (default: 1)")
+    parser.add_argument("--duplicate", action="store_true",
+                        help="play each table in every seat rotation on the same dice; rate on paired results")
+    parser.add_argument("--rotate-mb", type=int, default=None, metavar="N",
+                        help="split --stats/--records into numbered parts of N MB (uncompressed)")
+    parser.add_argument("--checkpoint", metavar="FILE", default=None,
+                        help="save tournament state to FILE after every round")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the run saved in --checkpoint FILE (same --stats/--records)")
     args = parser.parse_args()
-
-    if args.seed is not None:
-        random.seed(args.seed)
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume requires --checkpoint FILE")
 
     entries = _default_swiss_field()
-    run_swiss_tournament(entries, n_days=args.days, stats_path=args.stats, records_path=args.records)
+    run_swiss_tournament(entries, n_days=args.days, stats_path=args.stats, records_path=args.records,
+                         seed=args.seed, jobs=args.jobs, checkpoint_path=args.checkpoint,
+                         resume=args.resume,
+                         max_bytes=args.rotate_mb * 2**20 if args.rotate_mb else None,
+                         duplicate=args.duplicate)
 
 
 if __name__ == "__main__":